@@ -3,7 +3,7 @@
 from pathlib import Path
 from typing import Dict
 
-from agents.base import BaseAdapter
+from agents.base import BaseAdapter, DEFAULT_RESOURCES
 from ask.utils.skill_registry import get_skill_readme
 
 
@@ -15,6 +15,8 @@ class AntigravityAdapter(BaseAdapter):
     - Global (user):   ~/.gemini/antigravity/skills/<skill-name>/SKILL.md
     """
     
+    resource_names = DEFAULT_RESOURCES
+    
     def __init__(self, use_global: bool = False, project_root: Path = None):
         if use_global:
             # Global: ~/.gemini/antigravity/skills/
@@ -49,49 +51,3 @@ description: {description}
 {readme}
 """
         return content
-
-    def install_resources(self, skill: Dict, target_dir: Path, dry_run: bool = False, force: bool = False) -> Dict[str, bool]:
-        """
-        Install scripts and sidecar files to the skill directory.
-        """
-        import shutil
-        
-        skill_path_str = skill.get("_path")
-        if not skill_path_str:
-            return {"conflict": False}
-            
-        skill_path = Path(skill_path_str)
-        conflicts = []
-        resources_to_copy = ["scripts", "reference", "images", "assets", "examples.md", "reference.md"]
-        
-        # Check conflicts
-        for resource in resources_to_copy:
-            src = skill_path / resource
-            dst = target_dir / resource
-            if src.exists() and dst.exists() and not force:
-                 conflicts.append(f"Resource exists: {dst}")
-
-        if conflicts:
-            return {"conflict": True, "details": ", ".join(conflicts)}
-            
-        if dry_run:
-            return {"conflict": False}
-            
-        # Perform Copy
-        for resource in resources_to_copy:
-            src = skill_path / resource
-            dst = target_dir / resource
-            
-            if src.exists():
-                if force and dst.exists():
-                    if dst.is_dir():
-                        shutil.rmtree(dst)
-                    else:
-                        dst.unlink()
-
-                if src.is_dir():
-                    shutil.copytree(src, dst)
-                else:
-                    shutil.copy2(src, dst)
-                    
-        return {"conflict": False}
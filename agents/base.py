@@ -1,7 +1,18 @@
 """Base adapter class with safe copy logic."""
 
+import os
+import shutil
 from pathlib import Path
-from typing import Dict
+from typing import Dict, List, Union
+
+from ask.utils.artifacts import get_prebuilt_outputs
+from ask.utils.compact import compact_markdown
+from ask.utils.splitter import SECTION_FILE, split_markdown
+from ask.utils.store import link_tree, save_hash_cache, save_links
+
+
+# Resources most adapters install next to a skill
+DEFAULT_RESOURCES = ["scripts", "reference", "images", "assets", "examples.md", "reference.md"]
 
 
 class BaseAdapter:
@@ -9,6 +20,22 @@ class BaseAdapter:
     
     target_dir: Path = None
     
+    # Files/folders copied from the skill directory alongside the main file
+    resource_names: List[str] = []
+    
+    # Set by get_adapter
+    agent_name: str = None
+    
+    # Output options (set by get_adapter)
+    compact: bool = False
+    split: bool = False
+    
+    # Install resources as links into the shared content-addressed store (set by get_adapter)
+    link: bool = False
+    
+    # Install from fresh `ask build` artifacts instead of transforming, when available
+    use_prebuilt: bool = True
+    
     def list_installed_skills(self) -> Dict[str, str]:
         """
         List all installed skills and their versions.
@@ -58,10 +85,133 @@ class BaseAdapter:
             pass
         return "0.0.0"
 
+    def render(self, skill: Dict) -> str:
+        """
+        Render the final file content for a skill.
+        
+        Runs the adapter's transform() and applies output options such as compact mode.
+        """
+        content = self.transform(skill)
+        if self.compact:
+            content = compact_markdown(content)
+        return content
+
+    def get_resource_dir(self, skill: Dict, target_dir: Path, name: str = None) -> Path:
+        """
+        Directory that holds a skill's auxiliary files (scripts, sidecars, sections).
+        
+        Defaults to the directory containing the main file, which suits
+        folder-per-skill layouts. Flat layouts override this.
+        """
+        return target_dir
+
+    def get_sections_dir(self, skill: Dict, target: Path, name: str = None) -> Path:
+        """
+        Directory for the section files written in split mode.
+        
+        Always owned by one skill: flat layouts whose resource directory is
+        shared by every skill get .scripts/<skill-name>/sections instead.
+        """
+        skill_name = name or skill.get("name", "unknown")
+        resource_dir = self.get_resource_dir(skill, target.parent, name)
+        if resource_dir == target.parent and target.parent.name != skill_name:
+            resource_dir = target.parent / ".scripts" / skill_name
+        return resource_dir / "sections"
+
+    def remove_sections(self, sections_dir: Path) -> None:
+        """Delete the section files a previous split install wrote, and their directory once empty."""
+        if not sections_dir.is_dir() or sections_dir.is_symlink():
+            return
+        for path in sections_dir.iterdir():
+            if SECTION_FILE.match(path.name) and path.is_file() and not path.is_symlink():
+                path.unlink()
+        try:
+            sections_dir.rmdir()
+        except OSError:
+            # Files ASK did not write stay where they are
+            pass
+
+    def render_outputs(self, skill: Dict, name: str = None) -> Dict[Path, str]:
+        """
+        Render every file this adapter writes for a skill.
+        
+        Returns:
+            Dict of path -> content. The main target comes first, followed by
+            section files when split mode is on.
+        """
+        if self.use_prebuilt:
+            prebuilt = get_prebuilt_outputs(self, skill, name)
+            if prebuilt is not None:
+                return prebuilt
+        
+        target = self.get_target_path(skill, name)
+        content = self.render(skill)
+        
+        if not self.split:
+            return {target: content}
+        
+        sections_dir = self.get_sections_dir(skill, target, name)
+        link_prefix = Path(os.path.relpath(sections_dir, target.parent)).as_posix()
+        content, sections = split_markdown(content, link_prefix)
+        
+        outputs = {target: content}
+        for filename, section in sections:
+            outputs[sections_dir / filename] = section
+        return outputs
+
+    def get_resource_map(self, skill: Dict, target_dir: Path) -> Dict[Path, Path]:
+        """
+        Map each resource the skill ships (see resource_names) to its install location.
+        
+        Returns:
+            Dict of source path -> destination path, for resources that exist in the source.
+        """
+        skill_path_str = skill.get("_path")
+        if not skill_path_str or not self.resource_names:
+            return {}
+        
+        skill_path = Path(skill_path_str)
+        dest_dir = self.get_resource_dir(skill, target_dir)
+        # Inventory recorded by the registry, if any, saves a stat per resource
+        available = skill.get("_resources")
+        
+        resources = {}
+        for resource in self.resource_names:
+            src = skill_path / resource
+            if (resource in available) if available is not None else src.exists():
+                resources[src] = dest_dir / resource
+        return resources
+
+    def iter_resource_files(self, skill: Dict, target_dir: Path):
+        """Yield (source_file, destination_file) for every file inside the skill's resources."""
+        for src, dst in self.get_resource_map(skill, target_dir).items():
+            if src.is_dir():
+                for path in sorted(src.rglob("*")):
+                    if path.is_file():
+                        yield path, dst / path.relative_to(src)
+            else:
+                yield src, dst
+
+    def plan_install(self, skill: Dict, name: str = None) -> Dict[Path, Union[str, Path]]:
+        """
+        Everything copy_skill() would write, without writing it.
+        
+        Returns:
+            Dict of install path -> rendered content (str) for generated files,
+            or source path (Path) for resources copied verbatim.
+        """
+        plan: Dict[Path, Union[str, Path]] = dict(self.render_outputs(skill, name))
+        target = self.get_target_path(skill, name)
+        for src, dst in self.iter_resource_files(skill, target.parent):
+            plan[dst] = src
+        return plan
+
     def install_resources(self, skill: Dict, target_dir: Path, dry_run: bool = False, force: bool = False) -> Dict[str, bool]:
         """
         Install additional resources (scripts, references, etc.).
-        Override in subclasses to handle these.
+        
+        Copies every entry of resource_names found in the skill directory into
+        get_resource_dir(). Adapters with no resources install nothing.
         
         Args:
             skill: The skill data
@@ -72,6 +222,36 @@ class BaseAdapter:
         Returns:
             Dict indicating status, e.g., {"conflict": True, "details": "..."}
         """
+        resources = self.get_resource_map(skill, target_dir)
+        
+        # Check conflicts
+        if not force:
+            conflicts = [f"Resource exists: {dst}" for dst in resources.values() if dst.exists()]
+            if conflicts:
+                return {"conflict": True, "details": ", ".join(conflicts)}
+        
+        if dry_run:
+            return {"conflict": False}
+        
+        # Perform Copy
+        for src, dst in resources.items():
+            if dst.is_dir() and not dst.is_symlink():
+                shutil.rmtree(dst)
+            elif dst.exists() or dst.is_symlink():
+                dst.unlink()
+            
+            dst.parent.mkdir(parents=True, exist_ok=True)
+            if self.link:
+                link_tree(src, dst)
+            elif src.is_dir():
+                shutil.copytree(src, dst)
+            else:
+                shutil.copy2(src, dst)
+        
+        if self.link and resources:
+            save_hash_cache()
+            save_links()
+        
         return {"conflict": False}
 
     def install(self, skill: Dict) -> Dict:
@@ -99,7 +279,8 @@ class BaseAdapter:
             force: If True, overwrite existing main file and resources
         
         Returns:
-            status dict with: status, target, would_conflict (for dry-run)
+            status dict with: status, target, would_conflict (for dry-run),
+            files (every file written, when copied)
         """
         # Use new_name if provided (for conflict resolution)
         name_to_use = new_name or skill.get("name")
@@ -124,6 +305,13 @@ class BaseAdapter:
         # We pass target.parent because resources usually live relative to the command or in a fixed spot
         resource_status = self.install_resources(skill, target.parent, dry_run=True, force=force)
         
+        sections_dir = self.get_sections_dir(skill, target, name_to_use)
+        if self.split and sections_dir.exists() and not force:
+            details = f"Directory exists: {sections_dir}"
+            if resource_status.get("conflict"):
+                details = f"{resource_status.get('details')}, {details}"
+            resource_status = {"conflict": True, "details": details}
+        
         # If force is True, we generally ignore resource conflicts unless they are blocking errors
         if resource_status.get("conflict") and not force:
              if dry_run:
@@ -142,17 +330,25 @@ class BaseAdapter:
         if dry_run:
             return {"status": "dry-run", "target": str(target), "would_conflict": False}
         
-        # Ensure parent directory exists
-        target.parent.mkdir(parents=True, exist_ok=True)
+        # Transform and write (Core Instruction, plus sections in split mode)
+        outputs = self.render_outputs(skill, name_to_use)
         
-        # Transform and write (Core Instruction)
-        content = self.transform(skill)
-        target.write_text(content, encoding="utf-8")
+        # Sections from a previous split install may no longer exist (or,
+        # when forcing an install without --split, none should)
+        if force or self.split:
+            self.remove_sections(sections_dir)
+        
+        for path, content in outputs.items():
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(content, encoding="utf-8")
         
         # Install resources (if any)
         self.install_resources(skill, target.parent, dry_run=False, force=force)
         
-        return {"status": "copied", "target": str(target)}
+        files = [str(path) for path in outputs]
+        files.extend(str(dst) for _, dst in self.iter_resource_files(skill, target.parent))
+        
+        return {"status": "copied", "target": str(target), "files": files}
 
     def remove_skill(self, skill: Dict, name: str = None) -> Dict:
         """
@@ -170,13 +366,18 @@ class BaseAdapter:
         
         if not target.exists():
             return {"status": "not_found", "target": str(target)}
+        
+        # The skill's own directory (skill folder, or .scripts/<name>) holds its
+        # resources and sections and goes with it
+        skill_dir = self.get_sections_dir(skill, target, name_to_use).parent
             
         try:
             if target.is_dir():
-                import shutil
                 shutil.rmtree(target)
             else:
                 target.unlink()
+            if skill_dir.name == name_to_use and skill_dir.is_dir():
+                shutil.rmtree(skill_dir)
             return {"status": "removed", "target": str(target)}
         except Exception as e:
             return {"status": "error", "error": str(e), "target": str(target)}
@@ -3,7 +3,7 @@
 from pathlib import Path
 from typing import Dict
 
-from agents.base import BaseAdapter
+from agents.base import BaseAdapter, DEFAULT_RESOURCES
 from ask.utils.skill_registry import get_skill_readme
 
 
@@ -18,6 +18,8 @@ class CodexAdapter(BaseAdapter):
     We append skill content to the instructions file.
     """
     
+    resource_names = DEFAULT_RESOURCES
+    
     def __init__(self, use_global: bool = False, project_root: Path = None):
         if use_global:
             # Global: ~/.codex/instructions.md
@@ -53,53 +55,3 @@ class CodexAdapter(BaseAdapter):
 {readme}
 """
         return content
-
-    def install_resources(self, skill: Dict, target_dir: Path, dry_run: bool = False, force: bool = False) -> Dict[str, bool]:
-        """
-        Install scripts and sidecar files to the instructions directory.
-        """
-        import shutil
-        
-        skill_path_str = skill.get("_path")
-        if not skill_path_str:
-            return {"conflict": False}
-            
-        skill_path = Path(skill_path_str)
-        # Codex skills go into instructions/filename.md, so we copy resources to instructions/
-        
-        dest_dir = target_dir
-        
-        conflicts = []
-        resources_to_copy = ["scripts", "reference", "images", "assets", "examples.md", "reference.md"]
-        
-        # Check conflicts
-        for resource in resources_to_copy:
-            src = skill_path / resource
-            dst = dest_dir / resource
-            if src.exists() and dst.exists() and not force:
-                 conflicts.append(f"Resource exists: {dst}")
-
-        if conflicts:
-            return {"conflict": True, "details": ", ".join(conflicts)}
-            
-        if dry_run:
-            return {"conflict": False}
-            
-        # Perform Copy
-        for resource in resources_to_copy:
-            src = skill_path / resource
-            dst = dest_dir / resource
-            
-            if src.exists():
-                if src.is_dir():
-                    # Check if dir exists before copytree (shutil.copytree dirs_exist_ok=True requires python 3.8+)
-                    # safe_copy logic handles this but here we are manual.
-                    # Given we checked conflicts, we assume we can write or merge.
-                    # For safety in python <3.8 or if conflict logic missed something:
-                    if dst.exists():
-                        shutil.rmtree(dst)
-                    shutil.copytree(src, dst)
-                else:
-                    shutil.copy2(src, dst)
-                    
-        return {"conflict": False}
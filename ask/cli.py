@@ -1,16 +1,57 @@
 """Main CLI entry point for Agent Skill Kit."""
 
+import importlib
+
 import click
 from rich.console import Console
 
 from ask import __version__
-from ask.commands import create, copy, sync, update, list_skills, add_agent, remove
 
 
 console = Console()
 
+# Command name -> "module:attribute". Modules are imported on first use, so a
+# quick call like 'ask run' doesn't pay for every other command's imports.
+COMMANDS = {
+    "create": "ask.commands.create:create",
+    "copy": "ask.commands.copy:copy",
+    "sync": "ask.commands.sync:sync",
+    "update": "ask.commands.update:update",
+    "remove": "ask.commands.remove:remove",
+    "list": "ask.commands.list_skills:list_cmd",
+    "add-agent": "ask.commands.add_agent:add_agent",
+    "search": "ask.commands.search:search",
+    "dedupe": "ask.commands.dedupe:dedupe",
+    "stats": "ask.commands.stats:stats",
+    "build": "ask.commands.build:build",
+    "watch": "ask.commands.watch:watch",
+    "serve": "ask.commands.serve:serve",
+    "install": "ask.commands.install:install",
+    "store": "ask.commands.store:store",
+    "doctor": "ask.commands.doctor:doctor",
+    "diff": "ask.commands.diff:diff",
+    "gc": "ask.commands.gc:gc",
+    "du": "ask.commands.du:du",
+    "rollback": "ask.commands.rollback:rollback",
+    "run": "ask.commands.run:run",
+    "deps": "ask.commands.deps:deps",
+}
+
+
+class LazyGroup(click.Group):
+    """Group that imports each command's module only when the command is used."""
+
+    def list_commands(self, ctx):
+        return sorted(set(COMMANDS) | set(self.commands))
 
-@click.group()
+    def get_command(self, ctx, name):
+        if name not in self.commands and name in COMMANDS:
+            module, attribute = COMMANDS[name].split(":")
+            self.add_command(getattr(importlib.import_module(module), attribute), name=name)
+        return self.commands.get(name)
+
+
+@click.group(cls=LazyGroup)
 @click.version_option(version=__version__, prog_name="ask")
 @click.pass_context
 def main(ctx):
@@ -21,15 +62,5 @@ def main(ctx):
     ctx.ensure_object(dict)
 
 
-# Register commands
-main.add_command(create.create)
-main.add_command(copy.copy)
-main.add_command(sync.sync)
-main.add_command(update.update)
-main.add_command(remove.remove)
-main.add_command(list_skills.list_cmd, name="list")
-main.add_command(add_agent.add_agent)
-
-
 if __name__ == "__main__":
     main()
@@ -27,11 +27,11 @@ class {{class_name}}Adapter(BaseAdapter):
     - Global: {{global_path}}
     """
     
-    def __init__(self, use_global: bool = False):
+    def __init__(self, use_global: bool = False, project_root: Path = None):
         if use_global:
             self.target_dir = Path.home() / "{{global_dir}}"
         else:
-            self.target_dir = Path.cwd() / "{{local_dir}}"
+            self.target_dir = (project_root or Path.cwd()) / "{{local_dir}}"
     
     def get_target_path(self, skill: Dict, name: str = None) -> Path:
         """Get the target path for a skill."""
@@ -0,0 +1,147 @@
+"""Build command - Prebuild transformed skills for every agent."""
+
+import shutil
+from pathlib import Path
+
+import click
+from rich.console import Console
+from rich.table import Table
+
+from ask.utils.skill_registry import get_all_skills
+from ask.utils.filesystem import get_adapter
+from ask.utils.agent_registry import get_available_agents
+from ask.utils.artifacts import adapter_code_hash, get_dist_dir, load_manifest, render_key, save_manifest
+from ask.utils.cache import FileHashCache, hash_file, hash_text
+
+console = Console()
+
+
+def _remove_files(agent_dir: Path, relpaths) -> None:
+    """Delete artifact files and any directories they leave empty."""
+    for rel in relpaths:
+        path = agent_dir / rel
+        if path.is_file() or path.is_symlink():
+            path.unlink()
+        parent = path.parent
+        while parent != agent_dir and parent.is_dir() and not any(parent.iterdir()):
+            parent.rmdir()
+            parent = parent.parent
+
+
+def _is_fresh(entry: dict, agent_dir: Path) -> bool:
+    return all((agent_dir / rel).is_file() for rel in list(entry["outputs"]) + list(entry["resources"]))
+
+
+def _resources_hash(adapter, skill: dict, hasher: FileHashCache) -> str:
+    """Content hash of the resource files an adapter copies for a skill."""
+    target = adapter.get_target_path(skill)
+    files = {dst.relative_to(adapter.target_dir).as_posix(): src
+             for src, dst in adapter.iter_resource_files(skill, target.parent)}
+    digests = hasher.hash_many(files.values())
+    return hash_text("\n".join(f"{rel}:{digests[src]}" for rel, src in sorted(files.items())))
+
+
+@click.command()
+@click.option("--agent", "-a", "agent_names", multiple=True,
+              type=click.Choice(get_available_agents(), case_sensitive=False),
+              help="Only build these agents (repeatable)")
+@click.option("--compact", is_flag=True, help="Build compact-mode output")
+@click.option("--split", is_flag=True, help="Build split-mode output")
+@click.option("--force", "-f", is_flag=True, help="Rebuild everything, ignoring the manifest")
+@click.option("--output", "-o", "output_dir", type=click.Path(file_okay=False, path_type=Path),
+              help="Output directory (default: dist/ in the project root)")
+def build(agent_names: tuple, compact: bool, split: bool, force: bool, output_dir: Path):
+    """Prebuild every skill for every agent into dist/.
+
+    Output mirrors each agent's install layout under dist/<agent>/, with a
+    manifest of render keys and adapter and output hashes. Rebuilds are incremental:
+    only skills whose source or adapter code changed are rendered again.
+
+    copy, sync and update install compact and split output straight from
+    fresh artifacts in dist/ when they were built with the same options.
+
+    Examples:
+
+        ask build
+
+        ask build --agent claude --split
+    """
+    dist_dir = output_dir or get_dist_dir()
+    agents = list(agent_names) or get_available_agents()
+    options = {"compact": compact, "split": split}
+
+    manifest = load_manifest(dist_dir)
+    if force or not manifest or manifest.get("options") != options:
+        # Different output options invalidate every artifact
+        for agent in (manifest or {}).get("agents", {}):
+            shutil.rmtree(dist_dir / agent, ignore_errors=True)
+        manifest = {"options": options, "agents": {}}
+
+    skills = get_all_skills()
+    hasher = FileHashCache()
+
+    table = Table(title="📦 Build", show_header=True, header_style="bold")
+    table.add_column("Agent", style="cyan")
+    table.add_column("Built", justify="right")
+    table.add_column("Up to date", justify="right")
+    table.add_column("Removed", justify="right")
+
+    for agent in agents:
+        adapter = get_adapter(agent, compact=compact, split=split)
+        if not adapter:
+            continue
+        agent_dir = dist_dir / agent
+        adapter.target_dir = agent_dir
+        adapter.use_prebuilt = False
+
+        code_hash = adapter_code_hash(agent)
+        previous = manifest["agents"].get(agent, {})
+        if previous.get("adapter_hash") != code_hash:
+            shutil.rmtree(agent_dir, ignore_errors=True)
+            previous = {}
+        old_entries = previous.get("skills", {})
+
+        entries = {}
+        built = current = 0
+        for skill in skills:
+            if agent not in skill.get("agents", []):
+                continue
+            name = skill["name"]
+            old = old_entries.get(name)
+            key = render_key(skill)
+            resources_hash = _resources_hash(adapter, skill, hasher)
+
+            if (old and _is_fresh(old, agent_dir) and old.get("render_key") == key
+                    and old.get("resources_hash") == resources_hash):
+                entries[name] = old
+                current += 1
+                continue
+
+            if old:
+                _remove_files(agent_dir, list(old["outputs"]) + list(old["resources"]))
+
+            result = adapter.copy_skill(skill, force=True)
+            target = adapter.get_target_path(skill)
+            resources = {dst for _, dst in adapter.iter_resource_files(skill, target.parent)}
+            files = {"outputs": {}, "resources": {}}
+            for path in map(Path, result.get("files", [])):
+                kind = "resources" if path in resources else "outputs"
+                files[kind][path.relative_to(agent_dir).as_posix()] = hash_file(path)
+            entries[name] = {"render_key": key, "resources_hash": resources_hash, **files}
+            built += 1
+
+        removed = 0
+        for name, old in old_entries.items():
+            if name not in entries:
+                _remove_files(agent_dir, list(old["outputs"]) + list(old["resources"]))
+                removed += 1
+
+        manifest["agents"][agent] = {"adapter_hash": code_hash, "skills": entries}
+        table.add_row(agent, str(built), str(current), str(removed))
+
+    save_manifest(manifest, dist_dir)
+    hasher.save()
+
+    console.print()
+    console.print(table)
+    console.print(f"\n[green]✅ Artifacts written to {dist_dir}[/green]")
@@ -1,5 +1,8 @@
 """Copy command - Copy skills to agent directories."""
 
+import os
+from typing import Dict
+
 import click
 from rich.console import Console
 from rich.prompt import Prompt
@@ -8,10 +11,27 @@ from rich.table import Table
 from ask.utils.skill_registry import get_skill, get_all_skills
 from ask.utils.filesystem import get_adapter
 from ask.utils.agent_registry import get_available_agents, get_agent_scopes
+from ask.utils.daemon import DaemonError, request
+from ask.utils.lockfile import Lockfile
 
 console = Console()
 
 
+def _copy_skill(adapter, skill: Dict, agent: str, use_global: bool, new_name: str = None) -> Dict:
+    """Copy one skill through a running 'ask serve' daemon, or in-process when none answers."""
+    try:
+        result = request(
+            "copy", skill=skill["name"], agent=agent, cwd=os.getcwd(), new_name=new_name,
+            compact=adapter.compact, split=adapter.split, link=adapter.link, **{"global": use_global},
+        )
+    except DaemonError:
+        # e.g. a skill added moments ago that the daemon has not picked up yet
+        result = None
+    if result is None:
+        result = adapter.copy_skill(skill, new_name=new_name)
+    return result
+
+
 def prompt_skill_selection():
     """Interactive skill selection with numbered menu.
     
@@ -159,7 +179,10 @@ def prompt_agent_selection(skills):
 @click.argument("agent", required=False, type=click.Choice(get_available_agents(), case_sensitive=False))
 @click.option("--skill", "-s", "skill_name", help="Specific skill to copy")
 @click.option("--all", "-a", "copy_all", is_flag=True, help="Copy all compatible skills")
-def copy(agent: str, skill_name: str, copy_all: bool):
+@click.option("--compact", is_flag=True, help="Strip duplicate frontmatter, comments and decoration from output")
+@click.option("--split", is_flag=True, help="Move large sections into on-demand files linked from a short main file")
+@click.option("--link", is_flag=True, help="Link resource files from the shared content-addressed store instead of copying")
+def copy(agent: str, skill_name: str, copy_all: bool, compact: bool, split: bool, link: bool):
     """Copy skills to an agent's directory.
     
     Run without arguments for interactive mode, or specify agent + skill/--all.
@@ -167,6 +190,8 @@ def copy(agent: str, skill_name: str, copy_all: bool):
     Shows preview of both local and global paths, then asks which to use.
     Safe Copy: Never overwrites. Prompts for new name on conflict.
     
+    A running 'ask serve' daemon does the copying when there is one.
+    
     Examples:
     
         ask copy
@@ -176,6 +201,10 @@ def copy(agent: str, skill_name: str, copy_all: bool):
         ask copy gemini --skill my-skill
         
         ask copy claude --all
+        
+        ask copy claude --all --compact
+        
+        ask copy claude --skill ask-buildmaster --split
     """
     # Interactive mode: no arguments provided
     if not agent and not skill_name and not copy_all:
@@ -291,7 +320,10 @@ def copy(agent: str, skill_name: str, copy_all: bool):
         scope_name = "local"
     
     # Get adapter for chosen scope
-    adapter = get_adapter(agent, use_global=use_global)
+    adapter = get_adapter(agent, use_global=use_global, compact=compact, split=split, link=link)
+    
+    # Project installs are recorded in ask.lock
+    lock = None if use_global else Lockfile.load()
     
     # Copy skills
     console.print(f"\n[bold]Copying to {scope_name}...[/bold]\n")
@@ -301,11 +333,13 @@ def copy(agent: str, skill_name: str, copy_all: bool):
     
     for skill in skills:
         try:
-            result = adapter.copy_skill(skill)
+            result = _copy_skill(adapter, skill, agent, use_global)
             
             if result["status"] == "copied":
                 console.print(f"  [green]✓[/green] {skill['name']} → {result['target']}")
                 success_count += 1
+                if lock:
+                    lock.record(skill, adapter, result)
             elif result["status"] == "conflict":
                 # Prompt user for new name
                 console.print(f"  [yellow]⚠️  '{skill['name']}' already exists[/yellow]")
@@ -320,16 +354,21 @@ def copy(agent: str, skill_name: str, copy_all: bool):
                     skip_count += 1
                 else:
                     # Copy with new name
-                    result = adapter.copy_skill(skill, new_name=new_name)
+                    result = _copy_skill(adapter, skill, agent, use_global, new_name=new_name)
                     if result["status"] == "copied":
                         console.print(f"  [green]✓[/green] {skill['name']} → {result['target']}")
                         success_count += 1
+                        if lock:
+                            lock.record(skill, adapter, result, name=new_name)
                     else:
                         console.print(f"  [red]✗[/red] Failed: {result.get('error', 'Unknown')}")
                         
         except Exception as e:
             console.print(f"  [red]✗[/red] {skill['name']}: {e}")
     
+    if lock and success_count:
+        lock.save()
+    
     # Summary
     console.print()
     console.print(f"[green]Done![/green] {success_count} copied, {skip_count} skipped.")
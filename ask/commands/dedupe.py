@@ -0,0 +1,123 @@
+"""Dedupe command - Detect near-duplicate skills with MinHash/LSH."""
+
+from collections import Counter, defaultdict
+
+import click
+from rich.console import Console
+from rich.table import Table
+
+from ask.utils.cache import hash_text, load_json_cache, save_json_cache
+from ask.utils.minhash import (
+    candidate_pairs,
+    cluster_pairs,
+    paragraphs,
+    shingles,
+    signature,
+    similarity,
+    strip_frontmatter,
+)
+from ask.utils.skill_registry import get_all_skills, get_skill_readme
+
+console = Console()
+
+SIGNATURE_CACHE_NAME = "minhash-signatures"
+MAX_SIGNATURES = 4096
+
+
+@click.command()
+@click.option("--threshold", "-t", default=0.5, show_default=True, type=click.FloatRange(0.0, 1.0),
+              help="Minimum estimated similarity to report a pair")
+@click.option("--category", "-c", help="Only compare skills in this category")
+@click.option("--paragraphs/--no-paragraphs", "show_paragraphs", default=True,
+              help="Show paragraphs shared within each cluster")
+def dedupe(threshold: float, category: str, show_paragraphs: bool):
+    """Find clusters of near-duplicate skills.
+
+    Shingles every skill's instructions, builds MinHash signatures and uses
+    LSH banding so only likely matches are compared. Signatures are cached
+    per content hash.
+
+    Examples:
+
+        ask dedupe
+
+        ask dedupe --threshold 0.3 --category coding
+    """
+    skills = get_all_skills()
+    if category:
+        skills = [s for s in skills if s.get("category") == category]
+
+    # Same-named skills in different categories are told apart by category
+    name_counts = Counter(skill["name"] for skill in skills)
+    texts = {}
+    for skill in skills:
+        content = get_skill_readme(skill)
+        if content:
+            label = skill["name"] if name_counts[skill["name"]] == 1 else f"{skill.get('category')}/{skill['name']}"
+            texts[label] = strip_frontmatter(content)
+
+    if len(texts) < 2:
+        console.print("[yellow]Need at least two skills to compare.[/yellow]")
+        return
+
+    # 1. Signatures (cached per content hash)
+    cached = load_json_cache(SIGNATURE_CACHE_NAME) or {}
+    signatures = {}
+    missing = False
+    for name, text in texts.items():
+        key = hash_text(text)
+        sig = cached.pop(key, None)
+        if sig is None:
+            sig = signature(shingles(text))
+            missing = True
+        # Re-inserted last, so the oldest entries are the ones trimmed below
+        signatures[name] = cached[key] = sig
+    if missing:
+        # Keep signatures of skills outside this run (e.g. other --category values)
+        save_json_cache(SIGNATURE_CACHE_NAME, dict(list(cached.items())[-MAX_SIGNATURES:]))
+
+    # 2. LSH candidates, then verify with the full signature
+    scored = {}
+    for first, second in candidate_pairs(signatures):
+        score = similarity(signatures[first], signatures[second])
+        if score >= threshold:
+            scored[(first, second)] = score
+
+    if not scored:
+        console.print(f"[green]✨ No near-duplicates at similarity ≥ {threshold:.2f}.[/green]")
+        return
+
+    clusters = cluster_pairs(scored)
+
+    console.print(f"\n[bold]Found {len(clusters)} cluster(s) of near-duplicate skills[/bold]\n")
+
+    for idx, members in enumerate(clusters, 1):
+        table = Table(title=f"Cluster {idx}", show_header=True, header_style="bold")
+        table.add_column("Skill A", style="cyan")
+        table.add_column("Skill B", style="cyan")
+        table.add_column("Similarity", style="green", justify="right")
+
+        member_set = set(members)
+        for (first, second), score in sorted(scored.items(), key=lambda kv: -kv[1]):
+            if first in member_set:
+                table.add_row(first, second, f"{score:.0%}")
+
+        console.print(table)
+
+        if show_paragraphs:
+            owners = defaultdict(list)
+            texts_by_hash = {}
+            for name in members:
+                for key, para in paragraphs(texts[name]).items():
+                    owners[key].append(name)
+                    texts_by_hash[key] = para
+
+            shared = [(key, names) for key, names in owners.items() if len(names) > 1]
+            if shared:
+                console.print(f"  [bold]Shared paragraphs ({len(shared)}):[/bold]")
+                for key, names in shared:
+                    preview = texts_by_hash[key]
+                    preview = preview[:100] + "..." if len(preview) > 100 else preview
+                    console.print(f"  • [dim]{preview}[/dim]")
+                    console.print(f"    [magenta]{', '.join(names)}[/magenta]")
+        console.print()
@@ -0,0 +1,153 @@
+"""Deps command - Provision the Python packages skill scripts depend on."""
+
+import time
+from pathlib import Path
+from typing import List
+
+import click
+from rich.console import Console
+from rich.table import Table
+
+from ask.utils.agent_registry import get_available_agents
+from ask.utils.deps import (
+    DepsError,
+    collect_requirements,
+    ensure_env,
+    env_python,
+    fetch_wheels,
+    get_wheel_dir,
+    list_envs,
+    prune_envs,
+)
+from ask.utils.filesystem import SCOPES, get_adapter
+from ask.utils.install_scan import scan_install_dir
+from ask.utils.skill_registry import get_skill
+
+console = Console()
+
+
+def installed_skill_names(agents: List[str], scopes: List[str]) -> List[str]:
+    """Names of skills installed for any of the agents and scopes (leftovers without a main file excluded)."""
+    names = set()
+    for agent in agents:
+        for scope in scopes:
+            adapter = get_adapter(agent, use_global=SCOPES[scope])
+            if adapter:
+                names.update(name for name, info in scan_install_dir(adapter)["skills"].items() if info["main"])
+    return sorted(names)
+
+
+def _show_envs() -> None:
+    envs = list_envs()
+    if not envs:
+        console.print("[yellow]No dependency environments yet.[/yellow]")
+        return
+    table = Table(title="📦 Dependency Environments", show_header=True, header_style="bold")
+    table.add_column("Key", style="cyan")
+    table.add_column("Python", style="dim")
+    table.add_column("Requirements", style="white")
+    table.add_column("Last used", justify="right")
+    for info in envs:
+        days = (time.time() - info["used"]) / 86400
+        table.add_row(info["key"], info["python"], ", ".join(info["requirements"]) or "—",
+                      "today" if days < 1 else f"{days:.0f}d ago")
+    console.print()
+    console.print(table)
+
+
+@click.command()
+@click.option("--skill", "-s", "skill_names", multiple=True,
+              help="Provision these library skills instead of the installed ones (repeatable)")
+@click.option("--agent", "-a", "agent_names", multiple=True,
+              type=click.Choice(get_available_agents(), case_sensitive=False),
+              help="Only consider skills installed for these agents (repeatable)")
+@click.option("--scope", type=click.Choice(["local", "global", "both"]), default="both",
+              help="Which install locations to consider")
+@click.option("--wheels", "wheel_dir", type=click.Path(file_okay=False, path_type=Path),
+              help="Wheel directory to install from (default: the cache's, or ASK_WHEELHOUSE)")
+@click.option("--fetch", is_flag=True, help="Download missing wheels into the wheel directory first (needs network)")
+@click.option("--rebuild", is_flag=True, help="Rebuild the environment even if it exists")
+@click.option("--python", "print_python", is_flag=True, help="Only print the environment's interpreter path")
+@click.option("--list", "show_list", is_flag=True, help="List cached environments and exit")
+@click.option("--prune", is_flag=True, help="Remove environments unused for 30 days and failed builds")
+def deps(skill_names: tuple, agent_names: tuple, scope: str, wheel_dir: Path, fetch: bool, rebuild: bool,
+         print_python: bool, show_list: bool, prune: bool):
+    """Install the dependencies of skill scripts into a shared environment.
+
+    The 'dependencies:' of every installed skill (or of --skill) are
+    installed together into one virtual environment in the cache directory,
+    keyed by a hash of the dependency set and the Python version. Re-runs,
+    other projects and other agents with the same set reuse it instead of
+    building another one.
+
+    Packages come from a local wheel directory only, never from an index;
+    --fetch fills it with 'pip download' first. 'ask run' uses the
+    environment automatically.
+
+    Examples:
+
+        ask deps --fetch
+
+        ask deps --skill ask-pdf-processing
+
+        $(ask deps --python) script.py
+    """
+    if show_list:
+        _show_envs()
+        return
+
+    if prune:
+        removed = prune_envs()
+        console.print(f"[green]✅ Removed {len(removed)} environment(s)[/green]")
+        return
+
+    if skill_names:
+        skills = []
+        for name in skill_names:
+            skill = get_skill(name)
+            if not skill:
+                console.print(f"[red]❌ Skill not found: {name}[/red]")
+                raise click.Abort()
+            skills.append(skill)
+    else:
+        agents = list(agent_names) or get_available_agents()
+        scopes = ["local", "global"] if scope == "both" else [scope]
+        skills = [skill for skill in map(get_skill, installed_skill_names(agents, scopes)) if skill]
+
+    try:
+        required = collect_requirements(skills)
+    except DepsError as e:
+        console.print(f"[red]❌ {e}[/red]")
+        raise click.Abort()
+    if not required:
+        if not print_python:
+            console.print("[yellow]No skills with dependencies to provision.[/yellow]")
+        return
+
+    wheel_dir = wheel_dir or get_wheel_dir()
+    if not print_python:
+        console.print(f"[bold]📦 {len(required)} dependenc{'y' if len(required) == 1 else 'ies'}:[/bold]")
+        for requirement, owners in required.items():
+            console.print(f"  {requirement} [dim]({', '.join(owners)})[/dim]")
+
+    try:
+        if fetch:
+            if not print_python:
+                console.print(f"[dim]Downloading wheels into {wheel_dir}...[/dim]")
+            fetch_wheels(list(required), wheel_dir)
+        result = ensure_env(list(required), wheel_dir, rebuild=rebuild)
+    except DepsError as e:
+        console.print(f"[red]❌ Could not install from {wheel_dir}:[/red]\n{e}")
+        if not fetch:
+            console.print("[dim]Run 'ask deps --fetch' to download the missing wheels.[/dim]")
+        raise click.Abort()
+
+    if print_python:
+        click.echo(env_python(result["path"]))
+        return
+
+    if result["built"]:
+        console.print(f"[green]✅ Built environment {result['key']} in {result['seconds']:.1f}s[/green]")
+    else:
+        console.print(f"[green]✅ Reusing environment {result['key']}[/green] [dim](dependency set unchanged)[/dim]")
+    console.print(f"  Python: {env_python(result['path'])}")
@@ -0,0 +1,150 @@
+"""Diff command - Preview what update would change in installed skills."""
+
+import difflib
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import click
+from rich.console import Console
+
+from ask.utils.skill_registry import get_all_skills
+from ask.utils.filesystem import SCOPES, get_adapter
+from ask.utils.agent_registry import get_available_agents
+from ask.utils.cache import FileHashCache, hash_text
+
+console = Console()
+
+
+def _read_text(path: Path) -> Optional[str]:
+    """File text, or None for binary/unreadable files."""
+    try:
+        return path.read_text(encoding="utf-8")
+    except (OSError, UnicodeDecodeError):
+        return None
+
+
+def _label(path: Path) -> str:
+    """Diff header path: relative to the working directory when inside it."""
+    try:
+        return path.relative_to(Path.cwd()).as_posix()
+    except ValueError:
+        return str(path)
+
+
+def diff_adapter(adapter, skills: List[Dict], hasher: FileHashCache) -> List[str]:
+    """
+    Unified diffs between one agent/scope's installed skills and fresh output.
+
+    Files are compared by hash first; only files that differ are read and diffed.
+
+    Returns:
+        List of diff blocks (one per differing file).
+    """
+    plans = []
+    for skill in skills:
+        target = adapter.get_target_path(skill)
+        if target.exists():
+            plans.append(adapter.plan_install(skill))
+
+    installed = hasher.hash_many([path for plan in plans for path in plan])
+    sources = hasher.hash_many([src for plan in plans for src in plan.values() if isinstance(src, Path)])
+
+    blocks = []
+    for plan in plans:
+        for path, source in plan.items():
+            expected = sources[source] if isinstance(source, Path) else hash_text(source)
+            if installed[path] == expected:
+                continue
+
+            label = _label(path)
+            old = _read_text(path) if installed[path] is not None else ""
+            new = _read_text(source) if isinstance(source, Path) else source
+            if old is None or new is None:
+                # Rendered output is a string; only resources have a source path to show
+                source_label = _label(source) if isinstance(source, Path) else label
+                blocks.append(f"Binary files {label} and {source_label} differ\n")
+                continue
+
+            lines = difflib.unified_diff(
+                old.splitlines(keepends=True),
+                new.splitlines(keepends=True),
+                fromfile=label if installed[path] is not None else "/dev/null",
+                tofile=label,
+            )
+            blocks.append("".join(line if line.endswith("\n") else line + "\n" for line in lines))
+    return blocks
+
+
+def _print_diff(block: str) -> None:
+    for line in block.splitlines():
+        if line.startswith(("+++", "---")):
+            style = "bold"
+        elif line.startswith("+"):
+            style = "green"
+        elif line.startswith("-"):
+            style = "red"
+        elif line.startswith("@@"):
+            style = "cyan"
+        else:
+            style = None
+        console.print(line, style=style, markup=False, highlight=False, soft_wrap=True)
+
+
+@click.command()
+@click.argument("agent", required=False, type=click.Choice(get_available_agents(), case_sensitive=False))
+@click.option("--skill", "-s", "skill_name", help="Only diff this skill")
+@click.option("--scope", type=click.Choice(["local", "global", "both"]), default="both",
+              help="Which install locations to compare")
+@click.option("--compact", is_flag=True, help="Compare against compact-mode output")
+@click.option("--split", is_flag=True, help="Compare against split-mode output")
+@click.option("--exit-code", is_flag=True, help="Exit with status 1 when there are differences")
+@click.pass_context
+def diff(ctx, agent: str, skill_name: str, scope: str, compact: bool, split: bool, exit_code: bool):
+    """Show what 'ask update' would change in installed skills.
+
+    Prints a unified diff between every installed file (main file, sections,
+    resources) and what the library produces now. Unchanged files are
+    skipped by hash without being read; agents are processed in parallel.
+
+    Examples:
+
+        ask diff
+
+        ask diff claude --skill ask-bug-finder
+    """
+    skills = get_all_skills()
+    if skill_name:
+        skills = [s for s in skills if s.get("name") == skill_name]
+        if not skills:
+            console.print(f"[red]❌ Skill not found: {skill_name}[/red]")
+            raise click.Abort()
+
+    agents = [agent] if agent else get_available_agents()
+    scopes = ["local", "global"] if scope == "both" else [scope]
+    adapters = [
+        adapter
+        for adapter in (
+            get_adapter(name, use_global=SCOPES[scope_name], compact=compact, split=split)
+            for name in agents
+            for scope_name in scopes
+        )
+        if adapter
+    ]
+
+    hasher = FileHashCache()
+    with ThreadPoolExecutor(max_workers=max(1, len(adapters))) as pool:
+        results = list(pool.map(lambda adapter: diff_adapter(adapter, skills, hasher), adapters))
+    hasher.save()
+
+    blocks = [block for result in results for block in result]
+    if not blocks:
+        console.print("[green]✨ Installed skills match the library.[/green]")
+        return
+
+    for block in blocks:
+        _print_diff(block)
+    console.print(f"\n[dim]{len(blocks)} file(s) differ.[/dim]")
+
+    if exit_code:
+        ctx.exit(1)
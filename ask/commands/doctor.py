@@ -0,0 +1,180 @@
+"""Doctor command - Detect drift between installed skills and the library."""
+
+import json
+from pathlib import Path
+from typing import Dict, List
+
+import click
+from rich.console import Console
+from rich.table import Table
+
+from ask.utils.skill_registry import get_all_skills
+from ask.utils.filesystem import SCOPES, get_adapter
+from ask.utils.agent_registry import get_available_agents
+from ask.utils.artifacts import skill_source_hash
+from ask.utils.cache import FileHashCache, hash_text
+from ask.utils.install_scan import rendered_name, scan_install_dir
+from ask.utils.lockfile import Lockfile
+
+console = Console()
+
+STATUS_STYLES = {
+    "modified": "yellow",
+    "missing": "red",
+    "orphaned": "magenta",
+    "stale": "cyan",
+}
+
+
+def _summarize(paths: List[Path], root: Path) -> str:
+    shown = ", ".join(str(path.relative_to(root)) for path in paths[:3])
+    return shown + (f" (+{len(paths) - 3} more)" if len(paths) > 3 else "")
+
+
+def check_adapter(adapter, scope: str, library: Dict[str, Dict], lock: Lockfile,
+                  hasher: FileHashCache, jobs: int = None) -> List[Dict]:
+    """
+    Compare one agent/scope install location against the library.
+
+    Returns:
+        One problem dict per finding: skill, status, detail.
+    """
+    locked = {}
+    if scope == "local":
+        for skill_name, entry, record in lock.installs():
+            if record["agent"] == adapter.agent_name:
+                locked[record["name"]] = (skill_name, entry, record)
+
+    # 1. Expected files (content hash) for every installed skill
+    plans = []
+    for name, skill in library.items():
+        target = adapter.get_target_path(skill)
+        if not target.exists():
+            continue
+        lock_entry = locked.get(name)
+        if lock_entry:
+            _, entry, record = lock_entry
+            expected = {adapter.target_dir / rel: digest for rel, digest in record["files"].items()}
+        else:
+            entry = None
+            plan = adapter.plan_install(skill)
+            source_hashes = hasher.hash_many([src for src in plan.values() if isinstance(src, Path)], jobs=jobs)
+            expected = {
+                path: source_hashes[src] if isinstance(src, Path) else hash_text(src)
+                for path, src in plan.items()
+            }
+        plans.append((name, skill, target, entry, expected))
+
+    # 2. Hash everything installed in one parallel pass
+    installed = hasher.hash_many([path for *_, expected in plans for path in expected], jobs=jobs)
+
+    problems = []
+    for name, skill, target, entry, expected in plans:
+        absent = [path for path in expected if installed[path] is None]
+        changed = [path for path in expected if installed[path] is not None and installed[path] != expected[path]]
+        if absent:
+            problems.append({"skill": name, "status": "missing", "detail": _summarize(absent, adapter.target_dir)})
+        if changed:
+            installed_version = adapter._parse_skill_version(target)
+            latest = str(skill.get("version", "0.0.0"))
+            if entry is None and installed_version not in ("0.0.0", latest):
+                problems.append({"skill": name, "status": "stale",
+                                 "detail": f"installed {installed_version}, library {latest}"})
+            else:
+                problems.append({"skill": name, "status": "modified",
+                                 "detail": _summarize(changed, adapter.target_dir)})
+        elif entry is not None and not absent and entry["source_hash"] != skill_source_hash(skill):
+            problems.append({"skill": name, "status": "stale",
+                             "detail": f"library changed since locked ({entry['version']})"})
+
+    # 3. Lock entries whose install disappeared
+    for name, (skill_name, _, record) in locked.items():
+        if skill_name not in library:
+            problems.append({"skill": name, "status": "orphaned", "detail": "locked skill no longer in the library"})
+        elif not adapter.get_target_path({"name": name}).exists():
+            problems.append({"skill": name, "status": "missing", "detail": "locked but not installed"})
+
+    # 4. Leftover skill folders / resource dirs without a main file, and
+    #    unlocked installs of skills the library no longer has. Only files
+    #    carrying ASK's frontmatter count: other files are the user's own
+    for name, info in sorted(scan_install_dir(adapter)["skills"].items()):
+        if info["main"] is None:
+            problems.append({"skill": name, "status": "orphaned", "detail": f"{info['dir']}/ has no main file"})
+        elif name not in library and name not in locked:
+            # Renamed copies keep the library name in their frontmatter
+            source = rendered_name(adapter.target_dir / info["main"])
+            if source is not None and source not in library:
+                problems.append({"skill": name, "status": "orphaned",
+                                 "detail": "installed skill no longer in the library"})
+    return problems
+
+
+@click.command()
+@click.option("--agent", "-a", "agent_names", multiple=True,
+              type=click.Choice(get_available_agents(), case_sensitive=False),
+              help="Only check these agents (repeatable)")
+@click.option("--scope", type=click.Choice(["local", "global", "both"]), default="both",
+              help="Which install locations to check")
+@click.option("--compact", is_flag=True, help="Expect compact-mode output for unlocked installs")
+@click.option("--split", is_flag=True, help="Expect split-mode output for unlocked installs")
+@click.option("--jobs", "-j", type=int, help="Parallel hashing threads (default: based on CPU count)")
+@click.option("--json", "as_json", is_flag=True, help="Print machine-readable JSON")
+@click.pass_context
+def doctor(ctx, agent_names: tuple, scope: str, compact: bool, split: bool, jobs: int, as_json: bool):
+    """Check installed skills for drift.
+
+    Every installed main file, section and resource is hashed (in parallel,
+    cached by inode/mtime/size) and compared with what the library would
+    install now - or with ask.lock for locked project installs. Reports:
+
+    \b
+      modified  installed files differ from the expected output
+      missing   expected files (e.g. scripts) or locked installs are gone
+      orphaned  leftovers with no main file, or ASK-rendered skills no longer in the library
+      stale     the library has moved on since the skill was installed
+
+    Exits with status 1 when anything is found.
+
+    Examples:
+
+        ask doctor
+
+        ask doctor --agent claude --scope local
+    """
+    library = {skill["name"]: skill for skill in get_all_skills()}
+    agents = list(agent_names) or get_available_agents()
+    scopes = ["local", "global"] if scope == "both" else [scope]
+    lock = Lockfile.load()
+    hasher = FileHashCache()
+
+    findings = []
+    for agent in agents:
+        for scope_name in scopes:
+            adapter = get_adapter(agent, use_global=SCOPES[scope_name], compact=compact, split=split)
+            if not adapter:
+                continue
+            for problem in check_adapter(adapter, scope_name, library, lock, hasher, jobs=jobs):
+                findings.append({"agent": agent, "scope": scope_name, **problem})
+    hasher.save()
+
+    if as_json:
+        click.echo(json.dumps(findings, indent=2))
+    elif not findings:
+        console.print("[green]✨ All installed skills match the library.[/green]")
+    else:
+        table = Table(title="🩺 Install Drift", show_header=True, header_style="bold")
+        table.add_column("Agent", style="cyan")
+        table.add_column("Scope", style="dim")
+        table.add_column("Skill", style="white")
+        table.add_column("Status")
+        table.add_column("Detail", style="dim")
+        for finding in findings:
+            style = STATUS_STYLES[finding["status"]]
+            table.add_row(finding["agent"], finding["scope"], finding["skill"],
+                          f"[{style}]{finding['status']}[/{style}]", finding["detail"])
+        console.print()
+        console.print(table)
+        console.print("\n[dim]Fix with 'ask update' or 'ask install' (locked project installs).[/dim]")
+
+    if findings:
+        ctx.exit(1)
@@ -0,0 +1,105 @@
+"""DU command - Disk usage of installed skills per agent, scope and skill."""
+
+import json
+from typing import Dict, List
+
+import click
+from rich.console import Console
+from rich.table import Table
+
+from ask.utils.filesystem import SCOPES, get_adapter
+from ask.utils.agent_registry import get_available_agents
+from ask.utils.install_scan import scan_install_dir
+
+console = Console()
+
+
+def usage_rows(agent: str, scope: str, adapter) -> List[Dict]:
+    """One row per skill (plus backups and other files) in an agent/scope install directory."""
+    scan = scan_install_dir(adapter)
+    rows = [
+        {"agent": agent, "scope": scope, "skill": name, "files": len(info["files"]), "bytes": info["bytes"],
+         "orphaned": info["main"] is None}
+        for name, info in scan["skills"].items()
+    ]
+    for label, files in (("(backups)", scan["backups"]), ("(backup store)", scan["backup_store"]),
+                         ("(other)", scan["other"])):
+        if files:
+            rows.append({"agent": agent, "scope": scope, "skill": label, "files": len(files),
+                         "bytes": sum(files.values()), "orphaned": False})
+    rows.sort(key=lambda row: row["bytes"], reverse=True)
+    return rows
+
+
+@click.command()
+@click.option("--agent", "-a", "agent_names", multiple=True,
+              type=click.Choice(get_available_agents(), case_sensitive=False),
+              help="Only report these agents (repeatable)")
+@click.option("--scope", type=click.Choice(["local", "global", "both"]), default="both",
+              help="Which install locations to report")
+@click.option("--summary", is_flag=True, help="Only show totals per agent and scope")
+@click.option("--json", "as_json", is_flag=True, help="Print machine-readable JSON")
+def du(agent_names: tuple, scope: str, summary: bool, as_json: bool):
+    """Show disk usage of installed skills.
+
+    Bytes are reported per agent, scope and skill - main file, sections and
+    resources together - from a single scan of each install directory.
+    Leftovers without a main file are marked; 'ask gc' removes them.
+
+    Examples:
+
+        ask du
+
+        ask du --agent claude --scope global
+    """
+    agents = list(agent_names) or get_available_agents()
+    scopes = ["local", "global"] if scope == "both" else [scope]
+
+    rows = []
+    for agent in agents:
+        for scope_name in scopes:
+            adapter = get_adapter(agent, use_global=SCOPES[scope_name])
+            if adapter:
+                rows.extend(usage_rows(agent, scope_name, adapter))
+
+    totals = {}
+    for row in rows:
+        total = totals.setdefault((row["agent"], row["scope"]), {"files": 0, "bytes": 0})
+        total["files"] += row["files"]
+        total["bytes"] += row["bytes"]
+
+    if as_json:
+        if summary:
+            rows = [{"agent": agent, "scope": scope_name, **total} for (agent, scope_name), total in totals.items()]
+        click.echo(json.dumps(rows, indent=2))
+        return
+
+    if not rows:
+        console.print("[yellow]No installed skills found.[/yellow]")
+        return
+
+    table = Table(title="💾 Disk Usage", show_header=True, header_style="bold")
+    table.add_column("Agent", style="cyan")
+    table.add_column("Scope", style="dim")
+    if not summary:
+        table.add_column("Skill", style="white")
+    table.add_column("Files", justify="right")
+    table.add_column("KB", justify="right")
+
+    for (agent, scope_name), total in totals.items():
+        if not summary:
+            for row in rows:
+                if (row["agent"], row["scope"]) != (agent, scope_name):
+                    continue
+                skill = f"{row['skill']} [magenta](orphaned)[/magenta]" if row["orphaned"] else row["skill"]
+                table.add_row(agent, scope_name, skill, str(row["files"]), f"{row['bytes'] / 1024:,.1f}")
+        cells = [str(total["files"]), f"{total['bytes'] / 1024:,.1f}"]
+        if summary:
+            table.add_row(agent, scope_name, *cells)
+        else:
+            table.add_row("", "", "[dim]total[/dim]", *(f"[dim]{cell}[/dim]" for cell in cells), end_section=True)
+
+    console.print()
+    console.print(table)
+    grand = sum(total["bytes"] for total in totals.values())
+    console.print(f"\n[dim]{grand / 1024:,.1f} KB across {len(totals)} install location(s).[/dim]")
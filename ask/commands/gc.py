@@ -0,0 +1,155 @@
+"""GC command - Remove leftovers from agent install directories."""
+
+import shutil
+from pathlib import Path
+from typing import Dict, List, Set
+
+import click
+from rich.console import Console
+from rich.prompt import Confirm
+from rich.table import Table
+
+from ask.utils.skill_registry import get_all_skills
+from ask.utils.filesystem import SCOPES, get_adapter
+from ask.utils.agent_registry import get_available_agents
+from ask.utils.install_scan import original_name, scan_install_dir
+from ask.utils.lockfile import Lockfile
+
+console = Console()
+
+KIND_STYLES = {
+    "orphan": "magenta",
+    "backup": "yellow",
+    "copy": "cyan",
+}
+
+def find_garbage(adapter, library: Set[str], copies: bool = False, renamed: Dict[str, str] = None) -> List[Dict]:
+    """
+    Leftovers in one agent/scope install directory.
+
+    Args:
+        renamed: Installed name -> library skill for known renamed installs (from ask.lock);
+            other copies are recognized by the 'name:' in their frontmatter
+
+    Returns:
+        One dict per item: kind (orphan/backup/copy), skill, path, bytes.
+    """
+    scan = scan_install_dir(adapter)
+    root = scan["root"]
+    items = []
+
+    for name, info in sorted(scan["skills"].items()):
+        if info["main"] is None:
+            # Resource/skill directory whose main file is gone
+            items.append({"kind": "orphan", "skill": name, "path": root / info["dir"], "bytes": info["bytes"]})
+        elif copies and name not in library:
+            # Renamed conflict copy of a library skill that is installed here too
+            original = (renamed or {}).get(name) or original_name(root / info["main"])
+            if original in library and original != name and scan["skills"].get(original, {}).get("main"):
+                items.append({"kind": "copy", "skill": name, "path": root / info["main"], "bytes": info["bytes"],
+                              "original": original})
+
+    for rel, size in sorted(scan["backups"].items()):
+        items.append({"kind": "backup", "skill": Path(rel).name[:-len(".md.bak")], "path": root / rel,
+                      "bytes": size})
+    return items
+
+
+def _delete(adapter, item: Dict) -> None:
+    if item["kind"] == "copy":
+        adapter.remove_skill({"name": item["skill"]})
+    elif item["path"].is_dir():
+        shutil.rmtree(item["path"])
+    else:
+        item["path"].unlink(missing_ok=True)
+
+
+@click.command()
+@click.option("--agent", "-a", "agent_names", multiple=True,
+              type=click.Choice(get_available_agents(), case_sensitive=False),
+              help="Only clean these agents (repeatable)")
+@click.option("--scope", type=click.Choice(["local", "global", "both"]), default="both",
+              help="Which install locations to clean")
+@click.option("--copies", is_flag=True, help="Also remove renamed conflict copies of installed library skills")
+@click.option("--keep-backups", is_flag=True, help="Keep '*.md.bak' files left by older versions of 'ask update'")
+@click.option("--dry-run", is_flag=True, help="Only report what would be removed")
+@click.option("--yes", "-y", is_flag=True, help="Skip confirmation")
+def gc(agent_names: tuple, scope: str, copies: bool, keep_backups: bool, dry_run: bool, yes: bool):
+    """Remove leftovers from agent install directories.
+
+    Each install directory is scanned once and its main files are matched
+    against resource directories and backups. Removes:
+
+    \b
+      orphan  skill folders / .scripts/<name> dirs whose main file is gone
+      backup  '*.md.bak' files left by older versions of 'ask update'
+      copy    renamed conflict copies (only with --copies)
+
+    Examples:
+
+        ask gc --dry-run
+
+        ask gc --agent claude --copies -y
+    """
+    library = {skill["name"] for skill in get_all_skills()}
+    agents = list(agent_names) or get_available_agents()
+    scopes = ["local", "global"] if scope == "both" else [scope]
+
+    lock = Lockfile.load()
+    found = []
+    for agent in agents:
+        for scope_name in scopes:
+            adapter = get_adapter(agent, use_global=SCOPES[scope_name])
+            if not adapter:
+                continue
+            renamed = {}
+            if scope_name == "local":
+                renamed = {record["name"]: skill_name for skill_name, _, record in lock.installs()
+                           if record["agent"] == agent}
+            for item in find_garbage(adapter, library, copies=copies, renamed=renamed):
+                if keep_backups and item["kind"] == "backup":
+                    continue
+                found.append((agent, scope_name, adapter, item))
+
+    if not found:
+        console.print("[green]✨ Nothing to clean up.[/green]")
+        return
+
+    table = Table(title="🧹 Leftovers", show_header=True, header_style="bold")
+    table.add_column("Agent", style="cyan")
+    table.add_column("Scope", style="dim")
+    table.add_column("Kind")
+    table.add_column("Path", style="white")
+    table.add_column("KB", justify="right")
+    for agent, scope_name, adapter, item in found:
+        style = KIND_STYLES[item["kind"]]
+        table.add_row(agent, scope_name, f"[{style}]{item['kind']}[/{style}]",
+                      str(item["path"].relative_to(adapter.target_dir)), f"{item['bytes'] / 1024:,.1f}")
+    console.print()
+    console.print(table)
+
+    total = sum(item["bytes"] for *_, item in found)
+    if dry_run:
+        console.print(f"\n[dim]Would remove {len(found)} item(s), {total / 1024:,.1f} KB.[/dim]")
+        return
+
+    if not yes:
+        if not Confirm.ask(f"Remove these {len(found)} item(s)?"):
+            console.print("Cancelled.")
+            raise click.Abort()
+
+    forgotten = False
+    removed = 0
+    for agent, scope_name, adapter, item in found:
+        try:
+            _delete(adapter, item)
+        except OSError as e:
+            console.print(f"  [red]✗[/red] {item['path']}: {e}")
+            continue
+        if item["kind"] == "copy" and scope_name == "local":
+            forgotten = lock.forget(agent, item["skill"]) or forgotten
+        removed += 1
+
+    if forgotten:
+        lock.save()
+    console.print(f"\n[green]✅ Removed {removed} item(s), {total / 1024:,.1f} KB[/green]")
@@ -0,0 +1,115 @@
+"""Install command - Restore a project's skills from ask.lock."""
+
+from pathlib import Path
+
+import click
+from rich.console import Console
+
+from ask.utils.skill_registry import get_all_skills
+from ask.utils.filesystem import get_adapter
+from ask.utils.artifacts import skill_source_hash
+from ask.utils.cache import hash_files, hash_text
+from ask.utils.lockfile import Lockfile
+
+console = Console()
+
+
+@click.command()
+@click.option("--frozen", is_flag=True,
+              help="Require skill sources to match ask.lock exactly; never update the lockfile")
+@click.option("--link", is_flag=True, help="Link resource files from the shared content-addressed store instead of copying")
+@click.option("--jobs", "-j", type=int, help="Parallel hashing threads (default: based on CPU count)")
+@click.pass_context
+def install(ctx, frozen: bool, link: bool, jobs: int):
+    """Install the skills recorded in the project's ask.lock.
+
+    Every recorded file is hashed in parallel and compared with the lock;
+    only installs with missing or modified files are written again. A
+    project whose installs are intact is verified without copying anything.
+
+    With --frozen, a skill whose source no longer matches the lock, or
+    whose rendered output would differ from it, is an error (exit status 1)
+    instead of being installed and re-locked; nothing is written for it.
+
+    Examples:
+
+        ask install
+
+        ask install --frozen
+    """
+    lock = Lockfile.load()
+    if not lock.skills:
+        console.print(f"[yellow]No skills recorded in {lock.path}[/yellow]")
+        console.print("[dim]Tip: 'ask copy' and 'ask sync' (local scope) record installs there.[/dim]")
+        return
+
+    # 1. Verify: hash every recorded file in one parallel pass
+    adapters = {}
+    planned = []
+    for skill_name, entry, record in lock.installs():
+        key = (record["agent"], record.get("compact", False), record.get("split", False))
+        if key not in adapters:
+            adapters[key] = get_adapter(record["agent"], compact=key[1], split=key[2], link=link)
+        adapter = adapters[key]
+        expected = {} if not adapter else {
+            adapter.target_dir / rel: digest for rel, digest in record["files"].items()
+        }
+        planned.append((skill_name, entry, record, adapter, expected))
+
+    hashes = hash_files([path for *_, expected in planned for path in expected], jobs=jobs)
+
+    # 2. Rewrite only mismatched installs
+    library = None
+    verified = reinstalled = 0
+    failures = []
+
+    for skill_name, entry, record, adapter, expected in planned:
+        label = f"{skill_name} → {record['agent']}"
+        if not adapter:
+            failures.append(f"{label}: no adapter for agent '{record['agent']}'")
+            continue
+        if expected and all(hashes[path] == digest for path, digest in expected.items()):
+            verified += 1
+            continue
+
+        if library is None:
+            library = {s["name"]: s for s in get_all_skills()}
+        skill = library.get(skill_name)
+        if not skill:
+            failures.append(f"{label}: skill not found in the library")
+            continue
+        if frozen and skill_source_hash(skill) != entry["source_hash"]:
+            failures.append(f"{label}: source changed since ask.lock was written "
+                            f"(locked {entry['version']}, library {skill.get('version', '0.0.0')})")
+            continue
+
+        if frozen:
+            # Compare what would be written with the lock before touching any file
+            plan = adapter.plan_install(skill, name=record["name"])
+            sources = hash_files([src for src in plan.values() if isinstance(src, Path)], jobs=jobs)
+            planned_hashes = {path: sources[src] if isinstance(src, Path) else hash_text(src)
+                              for path, src in plan.items()}
+            if planned_hashes != expected:
+                failures.append(f"{label}: output differs from ask.lock (adapter changed since locking?)")
+                continue
+
+        result = adapter.copy_skill(skill, new_name=record["name"], force=True)
+        if result["status"] != "copied":
+            failures.append(f"{label}: {result.get('reason', result['status'])}")
+            continue
+
+        if not frozen:
+            lock.record(skill, adapter, result, name=record["name"])
+
+        console.print(f"  [green]✓[/green] {label} [dim]({result['target']})[/dim]")
+        reinstalled += 1
+
+    if reinstalled and not frozen:
+        lock.save()
+
+    console.print(f"\n[green]Done![/green] {verified} verified, {reinstalled} reinstalled, "
+                  f"{len(failures)} failed.")
+    if failures:
+        for failure in failures:
+            console.print(f"  [red]✗[/red] {failure}")
+        ctx.exit(1)
@@ -5,6 +5,7 @@ from rich.console import Console
 from rich.table import Table
 
 from ask.utils.skill_registry import get_all_skills
+from ask.utils.daemon import DaemonError, request
 
 console = Console()
 
@@ -14,7 +15,12 @@ console = Console()
 @click.option("--verbose", "-v", is_flag=True, help="Show detailed info")
 def list_cmd(category: str, verbose: bool):
     """List all available skills."""
-    skills = get_all_skills()
+    try:
+        skills = request("list")
+    except DaemonError:
+        skills = None
+    if skills is None:
+        skills = get_all_skills()
     
     if category:
         skills = [s for s in skills if s.get("category") == category]
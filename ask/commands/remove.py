@@ -6,6 +6,7 @@ from rich.prompt import Confirm
 
 from ask.utils.filesystem import get_adapter
 from ask.utils.agent_registry import get_available_agents
+from ask.utils.lockfile import Lockfile
 
 console = Console()
 
@@ -71,12 +72,15 @@ def remove(agent: str, skill_name: str, yes: bool):
     
     # 4. Delete
     success_count = 0
+    lock = Lockfile.load()
     for target in targets_found:
         result = target['adapter'].remove_skill({"name": skill_name})
         
         if result["status"] == "removed":
             console.print(f"  [green]✓[/green] Removed from {target['agent']} ({target['scope']})")
             success_count += 1
+            if target["scope"] == "Local" and lock.forget(target["agent"], skill_name):
+                lock.save()
         elif result["status"] == "not_found":
             console.print(f"  [yellow]?[/yellow] {target['agent']} ({target['scope']}): Already gone?")
         else:
@@ -0,0 +1,125 @@
+"""Rollback command - Restore skills from the backup generations taken by update."""
+
+import click
+from rich.console import Console
+from rich.prompt import Confirm
+from rich.table import Table
+
+from ask.utils.filesystem import SCOPES, get_adapter
+from ask.utils.agent_registry import get_available_agents
+from ask.utils.backups import BackupStore
+from ask.utils.cache import FileHashCache
+from ask.utils.lockfile import Lockfile
+
+console = Console()
+
+
+@click.command()
+@click.argument("agent", required=False, type=click.Choice(get_available_agents(), case_sensitive=False))
+@click.option("--scope", type=click.Choice(["local", "global", "both"]), default="local",
+              help="Which install locations to restore")
+@click.option("--to", "generation_id", type=int, help="Generation to restore (default: the newest)")
+@click.option("--skill", "-s", "skill_names", multiple=True, help="Only restore these skills (repeatable)")
+@click.option("--list", "list_only", is_flag=True, help="List available generations and exit")
+@click.option("--yes", "-y", is_flag=True, help="Skip confirmation")
+def rollback(agent: str, scope: str, generation_id: int, skill_names: tuple, list_only: bool, yes: bool):
+    """Undo 'ask update' by restoring a backup generation.
+
+    Every update snapshots the skills it is about to overwrite - main file,
+    sections and resources - into the install directory's backup store.
+    Rollback puts a generation back in one pass: files that already match
+    are not rewritten, and files the skill gained since are removed.
+
+    Generation numbers belong to one install location, so --to must match
+    a single agent and scope.
+
+    Examples:
+
+        ask rollback --list
+
+        ask rollback claude --to 3
+    """
+    agents = [agent] if agent else get_available_agents()
+    scopes = ["local", "global"] if scope == "both" else [scope]
+
+    stores = []
+    for agent_name in agents:
+        for scope_name in scopes:
+            adapter = get_adapter(agent_name, use_global=SCOPES[scope_name])
+            if adapter:
+                store = BackupStore(adapter)
+                if store.generations:
+                    stores.append((agent_name, scope_name, store))
+
+    if not stores:
+        console.print("[yellow]No backup generations found.[/yellow]")
+        console.print("[dim]Tip: 'ask update' takes one before overwriting skills.[/dim]")
+        return
+
+    if list_only:
+        table = Table(title="💾 Backup Generations", show_header=True, header_style="bold")
+        table.add_column("Agent", style="cyan")
+        table.add_column("Scope", style="dim")
+        table.add_column("Gen", justify="right")
+        table.add_column("Created", style="dim")
+        table.add_column("Skills", style="white")
+        for agent_name, scope_name, store in stores:
+            for gen in reversed(store.generations):
+                table.add_row(agent_name, scope_name, str(gen["id"]), gen["created"],
+                              ", ".join(sorted(gen["skills"])))
+        console.print()
+        console.print(table)
+        return
+
+    # 1. Pick the generation in each store
+    selected = []
+    for agent_name, scope_name, store in stores:
+        gen = store.get(generation_id)
+        if gen is None:
+            continue
+        names = sorted(set(skill_names) & set(gen["skills"])) if skill_names else sorted(gen["skills"])
+        if names:
+            selected.append((agent_name, scope_name, store, gen, names))
+
+    if not selected:
+        wanted = f"generation {generation_id}" if generation_id else "a backup"
+        console.print(f"[red]❌ No {wanted} matching the selection[/red]")
+        raise click.Abort()
+
+    # Generation numbers are per install location; never restore "3" everywhere
+    if generation_id is not None and len(selected) > 1:
+        matches = ", ".join(f"{agent_name} ({scope_name})" for agent_name, scope_name, *_ in selected)
+        console.print(f"[red]❌ Generation {generation_id} exists in several install locations: {matches}[/red]")
+        console.print("[dim]Pick one with AGENT and --scope local|global.[/dim]")
+        raise click.Abort()
+
+    console.print("\n[bold]Restore:[/bold]")
+    for agent_name, scope_name, store, gen, names in selected:
+        console.print(f"  - [cyan]{agent_name}[/cyan] ({scope_name}) generation {gen['id']} "
+                      f"[dim]({gen['created']})[/dim]: {', '.join(names)}")
+    console.print()
+
+    if not yes:
+        if not Confirm.ask("Overwrite the installed files with this backup?"):
+            console.print("Cancelled.")
+            raise click.Abort()
+
+    # 2. Restore
+    lock = Lockfile.load()
+    lock_changed = False
+    hasher = FileHashCache()
+    for agent_name, scope_name, store, gen, names in selected:
+        counts = store.restore(gen, names, hasher=hasher)
+        console.print(f"  [green]✓[/green] {agent_name} ({scope_name}): {counts['restored']} restored, "
+                      f"{counts['unchanged']} unchanged, {counts['removed']} removed")
+        if scope_name == "local":
+            for name in names:
+                state = gen["skills"][name].get("lock")
+                if state:
+                    lock.restore_install(state)
+                    lock_changed = True
+    hasher.save()
+
+    if lock_changed:
+        lock.save()
+    console.print("\n[green]Done![/green]")
@@ -0,0 +1,164 @@
+"""Run command - Run a skill's helper script, through a warm worker pool when one is up."""
+
+import subprocess
+import sys
+
+import click
+from rich.console import Console
+
+from ask.utils.daemon import DaemonError
+from ask.utils.deps import DepsError, env_python, find_env, site_packages
+from ask.utils.runner import (
+    DEFAULT_WORKERS,
+    WorkerPool,
+    get_socket_path,
+    is_supported,
+    list_scripts,
+    module_names,
+    request,
+    resolve_script,
+    run_script,
+)
+
+# stdout belongs to the script being run
+console = Console(stderr=True)
+
+
+def _find_env(dependencies: list):
+    """The shared environment from 'ask deps' that provides these dependencies, if any."""
+    if not dependencies:
+        return None
+    try:
+        return find_env(dependencies)
+    except DepsError:
+        return None
+
+
+def _serve(workers: int) -> None:
+    from ask.utils.skill_registry import get_all_skills
+
+    socket_path = get_socket_path()
+    try:
+        status = request("status", socket_path)
+    except DaemonError:
+        status = None
+    if status is not None:
+        console.print(f"[yellow]A pool is already running (pid {status['pid']}) on {socket_path}[/yellow]")
+        return
+
+    skills = [skill for skill in get_all_skills() if skill.get("_scripts")]
+    dependencies = [dep for skill in skills for dep in skill.get("dependencies") or []]
+    env = _find_env(dependencies)
+    if env is not None:
+        # Built for this interpreter's version, so its packages import here too
+        sys.path.append(str(site_packages(env)))
+        console.print(f"[dim]Using dependency environment {env}[/dim]")
+    pool = WorkerPool(socket_path, workers, module_names(dependencies))
+    pool.preload()
+    console.print(f"[bold]🏊 {workers} worker(s) for {len(skills)} skill(s) with scripts on {socket_path}[/bold] "
+                  f"[dim](Ctrl+C or 'ask run --stop' to stop)[/dim]")
+    if pool.loaded:
+        console.print(f"  Preloaded: {', '.join(pool.loaded)}")
+    for module, error in pool.failed.items():
+        console.print(f"  [yellow]⚠️  Could not import {module}: {error}[/yellow]")
+    pool.serve()
+    console.print("[dim]Pool stopped.[/dim]")
+
+
+@click.command(context_settings={"ignore_unknown_options": True, "allow_interspersed_args": False})
+@click.argument("skill_name", required=False)
+@click.argument("script", required=False)
+@click.argument("args", nargs=-1, type=click.UNPROCESSED)
+@click.option("--serve", "start", is_flag=True, help="Run the warm worker pool in the foreground")
+@click.option("--workers", "-w", type=click.IntRange(min=1), default=DEFAULT_WORKERS, show_default=True,
+              help="Idle workers kept ready (with --serve)")
+@click.option("--status", "show_status", is_flag=True, help="Show the running pool's status and exit")
+@click.option("--stop", is_flag=True, help="Stop the running pool")
+@click.option("--no-pool", is_flag=True, help="Run in a fresh Python process even if a pool is up")
+@click.pass_context
+def run(ctx, skill_name: str, script: str, args: tuple, start: bool, workers: int, show_status: bool,
+        stop: bool, no_pool: bool):
+    """Run a skill's helper script (from its scripts/ directory).
+
+    Arguments after SCRIPT are passed to the script unchanged, and its exit
+    status becomes ask's. Options for ask itself go before SKILL_NAME.
+
+    With a pool started by 'ask run --serve', the script runs in a worker
+    that has already imported the dependencies listed in skill.yaml, instead
+    of a fresh interpreter. Without one, it runs as 'python script.py'.
+    Either way, an environment provisioned with 'ask deps' is used when it
+    provides the skill's dependencies.
+
+    Each skill library gets its own pool, with its socket in the cache
+    directory (override with ASK_RUN_SOCKET). Set ASK_NO_DAEMON=1 to bypass
+    a running pool. 'ask-run SKILL_NAME SCRIPT [ARGS]...' does the same as
+    this command, but reaches the pool without loading ask first.
+
+    Examples:
+
+        ask run --serve &
+
+        ask run ask-pdf-processing extract_text.py report.pdf --pages 1-3
+
+        ask run --status
+    """
+    if start or show_status or stop:
+        if not is_supported():
+            console.print("[red]❌ The worker pool needs fork() and Unix domain sockets[/red]")
+            raise click.Abort()
+        if start:
+            _serve(workers)
+            return
+
+        try:
+            status = request("status")
+        except DaemonError:
+            status = None
+        if status is None:
+            console.print("[yellow]No pool running.[/yellow]")
+            return
+        if stop:
+            request("shutdown")
+            console.print(f"[green]✅ Stopped pool (pid {status['pid']})[/green]")
+            return
+        console.print(f"[green]✅ Pool running[/green] (pid {status['pid']}, up {status['uptime']}s)")
+        console.print(f"  Socket:    {get_socket_path()}")
+        console.print(f"  Workers:   {status['workers']}, skills: {status['skills']}")
+        console.print(f"  Preloaded: {', '.join(status['modules']) or '—'}")
+        for module, error in status["failed"].items():
+            console.print(f"  [yellow]⚠️  {module}: {error}[/yellow]")
+        return
+
+    if not skill_name or not script:
+        console.print("[red]❌ Usage: ask run SKILL_NAME SCRIPT [ARGS]...[/red]")
+        raise click.Abort()
+
+    if not no_pool:
+        try:
+            code = run_script(skill_name, script, args)
+        except DaemonError as e:
+            console.print(f"[red]❌ {e}[/red]")
+            raise click.Abort()
+        if code is not None:
+            ctx.exit(code)
+
+    # Only the fallback needs the library; pool runs resolve skills in the pool
+    from ask.utils.skill_registry import get_skill
+
+    skill = get_skill(skill_name)
+    if not skill:
+        console.print(f"[red]❌ Skill not found: {skill_name}[/red]")
+        raise click.Abort()
+    path = resolve_script(skill, script)
+    if path is None:
+        available = list_scripts(skill)
+        console.print(f"[red]❌ Script not found in {skill_name}: {script}[/red]")
+        console.print(f"[dim]Available: {', '.join(available) or 'none'}[/dim]")
+        raise click.Abort()
+
+    env = _find_env(skill.get("dependencies") or [])
+    python = str(env_python(env)) if env is not None else sys.executable
+    try:
+        ctx.exit(subprocess.run([python, str(path), *args]).returncode)
+    except KeyboardInterrupt:
+        ctx.exit(130)
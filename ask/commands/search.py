@@ -0,0 +1,63 @@
+"""Search command - Full-text search across the skill library."""
+
+import click
+from rich.console import Console
+from rich.table import Table
+
+from ask.utils.search_index import search_skills
+from ask.utils.daemon import DaemonError, request
+
+console = Console()
+
+
+@click.command()
+@click.argument("query", nargs=-1, required=True)
+@click.option("--limit", "-n", default=10, show_default=True, help="Maximum number of results")
+@click.option("--rebuild", is_flag=True, help="Discard the cached index and rebuild it")
+def search(query: tuple, limit: int, rebuild: bool):
+    """Search skills by name, tags, description and instructions.
+
+    Results are ranked with BM25. The index is cached and only skills
+    whose files changed are re-indexed.
+
+    Examples:
+
+        ask search docker security
+
+        ask search "database migration" --limit 5
+    """
+    query_text = " ".join(query)
+
+    results = None
+    if not rebuild:
+        # A running 'ask serve' daemon already holds a fresh index
+        try:
+            results = request("search", query=query_text, limit=limit)
+        except DaemonError:
+            results = None
+
+    if results is None:
+        results = search_skills(query_text, limit=limit, rebuild=rebuild)
+
+    if not results:
+        console.print(f"[yellow]No skills match '{query_text}'.[/yellow]")
+        return
+
+    table = Table(title=f"🔎 Results for '{query_text}'", show_header=True, header_style="bold cyan")
+    table.add_column("#", style="dim", width=4)
+    table.add_column("Name", style="white")
+    table.add_column("Category", style="dim")
+    table.add_column("Score", style="green", justify="right")
+    table.add_column("Description", style="dim", max_width=60)
+
+    for idx, result in enumerate(results, 1):
+        table.add_row(
+            str(idx),
+            result["name"],
+            result["category"] or "—",
+            f"{result['score']:.2f}",
+            result["description"] or "—",
+        )
+
+    console.print()
+    console.print(table)
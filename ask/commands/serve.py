@@ -0,0 +1,81 @@
+"""Serve command - Run a warm `ask` daemon on a Unix socket."""
+
+import click
+from rich.console import Console
+
+from ask.utils.daemon import (
+    DaemonError,
+    SkillServer,
+    SkillService,
+    get_socket_path,
+    is_supported,
+    request,
+)
+
+console = Console()
+
+
+@click.command()
+@click.option("--status", "show_status", is_flag=True, help="Show the running daemon's status and exit")
+@click.option("--stop", is_flag=True, help="Stop the running daemon")
+def serve(show_status: bool, stop: bool):
+    """Run a daemon that keeps the skill registry and search index warm.
+
+    While it runs, 'ask list', 'ask search' and 'ask copy' go through the
+    daemon instead of rescanning the library; editor integrations can also
+    send list/search/copy/status requests (one JSON object per line) to the
+    socket. Commands fall back to running in-process when no daemon is up.
+
+    Each library gets its own socket in the cache directory, named after a
+    hash of the skills directory (override with ASK_SOCKET).
+    Set ASK_NO_DAEMON=1 to bypass a running daemon.
+
+    Examples:
+
+        ask serve &
+
+        ask serve --status
+
+        ask serve --stop
+    """
+    if not is_supported():
+        console.print("[red]❌ Unix domain sockets are not supported on this platform[/red]")
+        raise click.Abort()
+
+    socket_path = get_socket_path()
+
+    try:
+        status = request("status", socket_path)
+    except DaemonError:
+        status = None
+
+    if show_status:
+        if status is None:
+            console.print("[yellow]No daemon running.[/yellow]")
+            return
+        console.print(f"[green]✅ Daemon running[/green] (pid {status['pid']}, up {status['uptime']}s)")
+        console.print(f"  Socket:   {socket_path}")
+        console.print(f"  Skills:   {status['skills']} from {status['skills_dir']}")
+        console.print(f"  Requests: {status['requests']}, adapters cached: {status['adapters']}")
+        return
+
+    if stop:
+        if status is None:
+            console.print("[yellow]No daemon running.[/yellow]")
+            return
+        request("shutdown", socket_path)
+        console.print(f"[green]✅ Stopped daemon (pid {status['pid']})[/green]")
+        return
+
+    if status is not None:
+        console.print(f"[yellow]A daemon is already running (pid {status['pid']}) on {socket_path}[/yellow]")
+        return
+
+    service = SkillService()
+    server = SkillServer(socket_path, service)
+    console.print(f"[bold]🛰  Serving {len(service.registry.all())} skills on {socket_path}[/bold] "
+                  f"[dim](Ctrl+C or 'ask serve --stop' to stop)[/dim]")
+    try:
+        server.serve()
+    except KeyboardInterrupt:
+        console.print("\n[dim]Daemon stopped.[/dim]")
@@ -0,0 +1,126 @@
+"""Stats command - Token cost of transformed skills per agent."""
+
+import json
+
+import click
+from rich.console import Console
+from rich.table import Table
+
+from ask.utils.skill_registry import get_all_skills
+from ask.utils.filesystem import get_adapter
+from ask.utils.agent_registry import get_available_agents
+from ask.utils.tokens import estimate_tokens
+
+console = Console()
+
+
+@click.command()
+@click.option("--agent", "-a", "agent_names", multiple=True,
+              type=click.Choice(get_available_agents(), case_sensitive=False),
+              help="Only measure these agents (repeatable)")
+@click.option("--skill", "-s", "skill_name", help="Only measure this skill")
+@click.option("--budget", type=int, envvar="ASK_TOKEN_BUDGET",
+              help="Fail if any transformed skill exceeds N tokens [env: ASK_TOKEN_BUDGET]")
+@click.option("--agent-budget", type=int, envvar="ASK_AGENT_TOKEN_BUDGET",
+              help="Fail if installing every compatible skill for an agent exceeds N tokens "
+                   "[env: ASK_AGENT_TOKEN_BUDGET]")
+@click.option("--compact", is_flag=True, help="Measure compact-mode output")
+@click.option("--split", is_flag=True, help="Measure only the main file of split-mode output")
+@click.option("--json", "as_json", is_flag=True, help="Print machine-readable JSON")
+@click.pass_context
+def stats(ctx, agent_names: tuple, skill_name: str, budget: int, agent_budget: int, compact: bool, split: bool,
+          as_json: bool):
+    """Show the size and estimated token cost of skills per agent.
+
+    Each skill is transformed exactly as 'ask copy' would write it (the main
+    file only, in split mode). Token counts are a fast local estimate
+    that approximates cl100k-style tokenizers.
+
+    Exits with status 1 when a budget is exceeded, so it can gate CI.
+
+    Examples:
+
+        ask stats
+
+        ask stats --agent claude --budget 3000
+        
+        ask stats --compact
+    """
+    agents = list(agent_names) or get_available_agents()
+    skills = get_all_skills()
+    if skill_name:
+        skills = [s for s in skills if s.get("name") == skill_name]
+        if not skills:
+            console.print(f"[red]❌ Skill not found: {skill_name}[/red]")
+            raise click.Abort()
+
+    # rows: skill name -> agent -> {"bytes": int, "tokens": int}
+    rows = {}
+    totals = {agent: {"skills": 0, "bytes": 0, "tokens": 0} for agent in agents}
+
+    for agent in agents:
+        adapter = get_adapter(agent, compact=compact, split=split)
+        if not adapter:
+            continue
+
+        for skill in skills:
+            if agent not in skill.get("agents", []):
+                continue
+
+            # The main file is what an agent always loads
+            content = next(iter(adapter.render_outputs(skill).values()))
+            size = len(content.encode("utf-8"))
+            tokens = estimate_tokens(content)
+
+            rows.setdefault(skill["name"], {})[agent] = {"bytes": size, "tokens": tokens}
+            totals[agent]["skills"] += 1
+            totals[agent]["bytes"] += size
+            totals[agent]["tokens"] += tokens
+
+    # Budget checks
+    violations = []
+    if budget is not None:
+        for name, per_agent in rows.items():
+            for agent, measured in per_agent.items():
+                if measured["tokens"] > budget:
+                    violations.append(f"{name} ({agent}): {measured['tokens']} tokens > budget {budget}")
+    if agent_budget is not None:
+        for agent, total in totals.items():
+            if total["tokens"] > agent_budget:
+                violations.append(f"{agent} total: {total['tokens']} tokens > budget {agent_budget}")
+
+    if as_json:
+        click.echo(json.dumps({"skills": rows, "agents": totals, "violations": violations}, indent=2))
+    else:
+        table = Table(title="📊 Transformed Skill Cost (estimated tokens)", show_header=True, header_style="bold")
+        table.add_column("Skill", style="cyan")
+        for agent in agents:
+            table.add_column(agent, justify="right")
+
+        for name in sorted(rows):
+            row = [name]
+            for agent in agents:
+                measured = rows[name].get(agent)
+                if not measured:
+                    row.append("[dim]—[/dim]")
+                elif budget is not None and measured["tokens"] > budget:
+                    row.append(f"[red]{measured['tokens']:,}[/red]")
+                else:
+                    row.append(f"{measured['tokens']:,}")
+            table.add_row(*row)
+
+        table.add_section()
+        table.add_row("[bold]Total tokens[/bold]", *[f"[bold]{totals[a]['tokens']:,}[/bold]" for a in agents])
+        table.add_row("[dim]Total KB[/dim]", *[f"[dim]{totals[a]['bytes'] / 1024:,.1f}[/dim]" for a in agents])
+        table.add_row("[dim]Skills[/dim]", *[f"[dim]{totals[a]['skills']}[/dim]" for a in agents])
+
+        console.print()
+        console.print(table)
+
+        if violations:
+            console.print(f"\n[red]❌ {len(violations)} budget violation(s):[/red]")
+            for violation in violations:
+                console.print(f"  [red]•[/red] {violation}")
+
+    if violations:
+        ctx.exit(1)
@@ -0,0 +1,36 @@
+"""Store command - Inspect and clean the shared content-addressed store."""
+
+import click
+from rich.console import Console
+
+from ask.utils.store import get_store_dir, prune, store_status
+
+console = Console()
+
+
+@click.group()
+def store():
+    """Manage the shared store used by '--link' installs.
+
+    Resource files installed with --link are kept once per content hash in
+    the user cache directory and linked into each project.
+    """
+
+
+@store.command()
+def status():
+    """Show store size and how many objects are still in use."""
+    info = store_status()
+    console.print(f"[bold]🗄  Store:[/bold] {get_store_dir()}")
+    console.print(f"  Objects:    {info['objects']} ({info['bytes'] / 1024:,.1f} KB)")
+    console.print(f"  Referenced: {info['referenced']}")
+    console.print(f"  Unused:     {info['objects'] - info['referenced']}")
+
+
+@store.command(name="prune")
+@click.option("--dry-run", is_flag=True, help="Only report what would be removed")
+def prune_cmd(dry_run: bool):
+    """Remove objects no longer linked from any project."""
+    removed, freed = prune(dry_run=dry_run)
+    verb = "Would remove" if dry_run else "Removed"
+    console.print(f"[green]✅ {verb} {removed} unused object(s), {freed / 1024:,.1f} KB[/green]")
@@ -8,13 +8,17 @@ from rich.table import Table
 from ask.utils.skill_registry import get_all_skills
 from ask.utils.filesystem import get_adapter
 from ask.utils.agent_registry import get_available_agents, get_agent_scopes
+from ask.utils.lockfile import Lockfile
 
 console = Console()
 
 
 @click.command()
 @click.argument("target", type=click.Choice(["all"]))
-def sync(target: str):
+@click.option("--compact", is_flag=True, help="Strip duplicate frontmatter, comments and decoration from output")
+@click.option("--split", is_flag=True, help="Move large sections into on-demand files linked from a short main file")
+@click.option("--link", is_flag=True, help="Link resource files from the shared content-addressed store instead of copying")
+def sync(target: str, compact: bool, split: bool, link: bool):
     """Sync all skills to all agents.
     
     TARGET must be 'all' to sync to all supported agents.
@@ -62,8 +66,11 @@ def sync(target: str):
     # Results tracking
     results = {agent: {"copied": 0, "skipped": 0, "failed": 0} for agent in agents}
     
+    # Project installs are recorded in ask.lock
+    lock = None if use_global else Lockfile.load()
+    
     for agent in agents:
-        adapter = get_adapter(agent, use_global=use_global)
+        adapter = get_adapter(agent, use_global=use_global, compact=compact, split=split, link=link)
         if not adapter:
             console.print(f"[yellow]⚠️  No adapter for {agent}, skipping[/yellow]")
             continue
@@ -76,6 +83,8 @@ def sync(target: str):
                 
                 if result["status"] == "copied":
                     results[agent]["copied"] += 1
+                    if lock:
+                        lock.record(skill, adapter, result)
                 elif result["status"] == "conflict":
                     results[agent]["skipped"] += 1
                     
@@ -83,6 +92,9 @@ def sync(target: str):
                 results[agent]["failed"] += 1
                 console.print(f"[red]  ✗ {skill['name']} → {agent}: {e}[/red]")
     
+    if lock and any(counts["copied"] for counts in results.values()):
+        lock.save()
+    
     # Summary table
     table = Table(title="Sync Summary", show_header=True, header_style="bold")
     table.add_column("Agent", style="cyan")
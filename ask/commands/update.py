@@ -1,8 +1,6 @@
 """Update command - Update installed skills to the latest version."""
 
 import click
-import shutil
-from pathlib import Path
 from rich.console import Console
 from rich.prompt import Prompt
 from rich.table import Table
@@ -11,10 +9,13 @@ from typing import List, Dict, Any
 from ask.utils.skill_registry import get_skill, get_all_skills
 from ask.utils.filesystem import get_adapter
 from ask.utils.agent_registry import get_available_agents
+from ask.utils.lockfile import Lockfile
+from ask.utils.backups import BackupStore
+from ask.utils.cache import FileHashCache
 
 console = Console()
 
-def _scan_for_updates() -> List[Dict[str, Any]]:
+def _scan_for_updates(compact: bool = False, split: bool = False, link: bool = False) -> List[Dict[str, Any]]:
     """Scan all agents and scopes for available skill updates."""
     available_agents = get_available_agents()
     source_skills_map = {s["name"]: s for s in get_all_skills()}
@@ -23,7 +24,7 @@ def _scan_for_updates() -> List[Dict[str, Any]]:
     for agent in available_agents:
         # Check both local and global scopes
         for scope_name, scope_bool in [("local", False), ("global", True)]:
-            adapter = get_adapter(agent, use_global=scope_bool)
+            adapter = get_adapter(agent, use_global=scope_bool, compact=compact, split=split, link=link)
             if not adapter:
                 continue
                 
@@ -56,7 +57,10 @@ def _scan_for_updates() -> List[Dict[str, Any]]:
 
 @click.command()
 @click.option("--yes", "-y", is_flag=True, help="Auto-confirm all updates")
-def update(yes: bool):
+@click.option("--compact", is_flag=True, help="Strip duplicate frontmatter, comments and decoration from output")
+@click.option("--split", is_flag=True, help="Move large sections into on-demand files linked from a short main file")
+@click.option("--link", is_flag=True, help="Link resource files from the shared content-addressed store instead of copying")
+def update(yes: bool, compact: bool, split: bool, link: bool):
     """
     Update installed skills to the latest version.
     
@@ -64,14 +68,15 @@ def update(yes: bool):
     the source repository, and interactively updates them.
     
     Safe Update Strategy:
-    1. Backs up existing 'SKILL.md' to 'SKILL.md.bak'
+    1. Snapshots the installed files (main file, sections, resources) into
+       the install directory's backup store as a new generation
     2. Overwrites with new version
-    3. Option to clean up backup after success
+    3. 'ask rollback' restores a generation
     """
     
     # 1. Scan Phase
     console.print("[bold cyan]🔍 Scanning for updates...[/bold cyan]")
-    updates_found = _scan_for_updates()
+    updates_found = _scan_for_updates(compact=compact, split=split, link=link)
 
     if not updates_found:
         console.print("[green]✨ All skills are up to date![/green]")
@@ -136,12 +141,31 @@ def update(yes: bool):
         console.print("[yellow]No skills selected.[/yellow]")
         return
 
-    # Ask for cleanup preference once
-    auto_delete_backup = False
-    if not yes:
-        auto_delete_backup = click.confirm("Delete backups after successful update?", default=False)
+    # 4. Backup: one generation per install directory, taken before anything is written
+    lock = Lockfile.load()
+    hasher = FileHashCache()
+    groups = {}
+    for idx in selected_indices:
+        item = updates_found[idx]
+        groups.setdefault(id(item["adapter"]), []).append(item)
+    
+    for items in groups.values():
+        adapter = items[0]["adapter"]
+        lock_entries = {}
+        if items[0]["scope"] == "local":
+            for item in items:
+                state = lock.install_state(item["agent"], item["skill"])
+                if state:
+                    lock_entries[item["skill"]] = state
+        generation = BackupStore(adapter).snapshot(
+            [item["source_skill"] for item in items], lock_entries=lock_entries, hasher=hasher
+        )
+        if generation:
+            console.print(f"[dim]💾 Backed up {len(generation['skills'])} skill(s) for "
+                          f"{items[0]['agent']} ({items[0]['scope']}) as generation {generation['id']}[/dim]")
+    hasher.save()
     
-    # 4. Execution
+    # 5. Execution
     console.print("\n[bold]🚀 Updating...[/bold]\n")
     
     success_count = 0
@@ -153,32 +177,24 @@ def update(yes: bool):
         skill_name = item["skill"]
         agent = item["agent"]
         
-        target_path = adapter.get_target_path(skill)
-        backup_path = target_path.with_suffix(".md.bak")
-        
         try:
-            # A. Backup
-            if target_path.exists():
-                # Overwrite existing backup if any
-                shutil.copy2(target_path, backup_path)
-            
-            # B. Update (Force Copy)
+            # Update (Force Copy)
             result = adapter.copy_skill(skill, force=True)
             
             if result["status"] == "copied":
                 console.print(f"  [green]✓[/green] Updated {agent}/{skill_name}")
                 success_count += 1
-                
-                # C. Cleanup determined by global preference
-                if auto_delete_backup:
-                     backup_path.unlink(missing_ok=True)
-                     console.print("    [dim]Backup deleted[/dim]")
-                else:
-                     console.print(f"    [dim]Backup saved to {backup_path.name}[/dim]")
+                if item["scope"] == "local":
+                    lock.record(skill, adapter, result)
             else:
                 console.print(f"  [red]✗[/red] Failed to update {skill_name}: {result.get('reason')}")
                 
         except Exception as e:
             console.print(f"  [red]✗[/red] Error updating {skill_name}: {e}")
             
+    if lock.skills:
+        lock.save()
+    
     console.print(f"\n[green]Done! Updated {success_count} skill(s).[/green]")
+    if success_count:
+        console.print("[dim]Undo with 'ask rollback'.[/dim]")
@@ -0,0 +1,114 @@
+"""Watch command - Redeploy skills as they are edited."""
+
+import time
+from pathlib import Path
+from typing import Dict, Iterable, List, Tuple
+
+import click
+from rich.console import Console
+
+from ask.utils.skill_registry import SkillRegistry
+from ask.utils.filesystem import SCOPES, get_adapter
+from ask.utils.agent_registry import get_available_agents
+from ask.utils.watcher import create_watcher, debounced_changes
+
+console = Console()
+
+
+def redeploy(registry: SkillRegistry, adapters: Dict[Tuple[str, str], object],
+             changed_paths: Iterable[Path]) -> List[Dict]:
+    """
+    Reload the skills touched by changed_paths and rewrite their existing installs.
+
+    Only (skill, agent, scope) pairs where the skill is already installed are
+    redeployed; watching never installs a skill somewhere new.
+
+    Returns:
+        One result dict per redeployed or removed skill:
+        skill, agent, scope, status and (for copies) target.
+    """
+    results = []
+    for skill_dir, skill in registry.refresh(changed_paths).items():
+        if skill is None:
+            results.append({"skill": skill_dir.name, "agent": None, "scope": None, "status": "removed"})
+            continue
+
+        for (agent, scope), adapter in adapters.items():
+            if agent not in skill.get("agents", []) or not adapter.get_target_path(skill).exists():
+                continue
+            try:
+                result = adapter.copy_skill(skill, force=True)
+            except Exception as e:
+                result = {"status": "error", "error": str(e)}
+            results.append({"skill": skill["name"], "agent": agent, "scope": scope, **result})
+    return results
+
+
+@click.command()
+@click.option("--agent", "-a", "agent_names", multiple=True,
+              type=click.Choice(get_available_agents(), case_sensitive=False),
+              help="Only redeploy to these agents (repeatable)")
+@click.option("--scope", type=click.Choice(["local", "global", "both"]), default="both",
+              help="Which installs to keep up to date")
+@click.option("--compact", is_flag=True, help="Strip duplicate frontmatter, comments and decoration from output")
+@click.option("--split", is_flag=True, help="Move large sections into on-demand files linked from a short main file")
+@click.option("--debounce", type=float, default=0.3, show_default=True,
+              help="Seconds of quiet before a burst of edits is deployed")
+@click.option("--interval", type=float, default=0.5, show_default=True,
+              help="Polling interval in seconds (when native file events are unavailable)")
+@click.option("--polling", is_flag=True, help="Force stdlib polling even if watchdog is installed")
+def watch(agent_names: tuple, scope: str, compact: bool, split: bool, debounce: float, interval: float,
+          polling: bool):
+    """Watch skills/ and redeploy edited skills to where they are installed.
+
+    Each change reloads only the affected skill and rewrites only its
+    existing installs (per agent and scope). Skills that are not installed
+    anywhere are left alone - use 'ask copy' first.
+
+    Uses native file events when the optional 'watchdog' package is
+    installed, polling otherwise. Press Ctrl+C to stop.
+
+    Examples:
+
+        ask watch
+
+        ask watch --agent claude --scope local
+    """
+    registry = SkillRegistry()
+    agents = list(agent_names) or get_available_agents()
+    scopes = ["local", "global"] if scope == "both" else [scope]
+
+    # Adapters stay warm for the whole session
+    adapters = {}
+    for agent in agents:
+        for scope_name in scopes:
+            adapter = get_adapter(agent, use_global=SCOPES[scope_name], compact=compact, split=split)
+            if adapter:
+                adapters[(agent, scope_name)] = adapter
+
+    watcher = create_watcher(registry.skills_dir, interval=interval, polling=polling)
+    console.print(f"[bold]👀 Watching {registry.skills_dir}[/bold] "
+                  f"[dim]({len(registry.all())} skills, {watcher.name} mode, Ctrl+C to stop)[/dim]")
+
+    try:
+        for changed in debounced_changes(watcher, debounce):
+            start = time.perf_counter()
+            results = redeploy(registry, adapters, changed)
+            elapsed = (time.perf_counter() - start) * 1000
+
+            for result in results:
+                if result["status"] == "removed":
+                    console.print(f"[yellow]⚠️  {result['skill']} removed from the library "
+                                  f"(installed copies are kept)[/yellow]")
+                elif result["status"] == "copied":
+                    console.print(f"[green]✓[/green] {result['skill']} → {result['agent']} "
+                                  f"[dim]({result['scope']})[/dim]")
+                else:
+                    console.print(f"[red]✗ {result['skill']} → {result['agent']} ({result['scope']}): "
+                                  f"{result.get('error') or result.get('reason')}[/red]")
+            if results:
+                console.print(f"[dim]  redeployed in {elapsed:.0f} ms[/dim]")
+    except KeyboardInterrupt:
+        console.print("\n[dim]Stopped watching.[/dim]")
+    finally:
+        watcher.close()
@@ -0,0 +1,182 @@
+"""Prebuilt artifacts - ahead-of-time rendered skills produced by `ask build`.
+
+Layout:
+    dist/manifest.json
+    dist/<agent>/...      mirrors each adapter's target directory
+
+The manifest records, per agent and skill, a render key (a content hash of
+everything the adapters read: the skill's metadata and its instruction
+file), a hash of the code that renders it (adapter + transform helpers) and
+the hash of every emitted file. Installs reuse an artifact only when all of
+these still match, so prebuilt output is always identical to rendering on
+the spot.
+
+Render keys hash content, not paths or mtimes, so artifacts built before a
+commit stay valid in a fresh clone. Instruction file hashes are cached by
+stat (see FileHashCache), so checking a key is a stat plus a dict lookup.
+"""
+
+import atexit
+import json
+from pathlib import Path
+from typing import Dict, Optional
+
+from ask.utils.cache import FileHashCache, hash_file, hash_text
+from ask.utils.filesystem import get_agents_dir, get_project_root
+
+
+MANIFEST_NAME = "manifest.json"
+MANIFEST_VERSION = 2
+
+# Code that influences rendered output besides the adapter itself
+_RENDER_SOURCES = [
+    Path(__file__).parent / "compact.py",
+    Path(__file__).parent / "splitter.py",
+]
+
+# Registry fields the adapters look at besides the metadata from skill.yaml
+_RENDER_FLAGS = ("_reference", "_examples", "_scripts")
+
+_manifest_cache: Dict[str, Optional[Dict]] = {}
+_code_hash_cache: Dict[str, str] = {}
+_hasher: Optional[FileHashCache] = None
+
+
+class SourceHashCache(FileHashCache):
+    """Instruction file hashes for render keys, kept apart from the install hash cache."""
+
+    CACHE_NAME = "artifact-source-hashes"
+
+
+def _get_hasher() -> FileHashCache:
+    global _hasher
+    if _hasher is None:
+        _hasher = SourceHashCache()
+        # One write per process, however many skills were checked
+        atexit.register(save_hash_cache)
+    return _hasher
+
+
+def save_hash_cache() -> None:
+    """Persist instruction file hashes computed during this run."""
+    if _hasher is not None:
+        _hasher.save()
+
+
+def reset_caches() -> None:
+    """Forget everything memoized in this process (manifests, code and file hashes)."""
+    global _hasher
+    _manifest_cache.clear()
+    _code_hash_cache.clear()
+    _hasher = None
+
+
+def get_dist_dir() -> Path:
+    """Get the default build output directory."""
+    return get_project_root() / "dist"
+
+
+def render_key(skill: Dict) -> Optional[str]:
+    """
+    Content hash of everything an adapter reads to render a skill.
+
+    Returns None when the instruction file cannot be read.
+    """
+    metadata = {key: value for key, value in skill.items() if not key.startswith("_")}
+    flags = [bool(skill.get(flag)) for flag in _RENDER_FLAGS]
+    instruction = skill.get("_instruction_file")
+    digest = None
+    if instruction:
+        digest = _get_hasher().hash_many([Path(instruction)])[Path(instruction)]
+        if digest is None:
+            return None
+    payload = json.dumps([metadata, flags, Path(instruction).name if instruction else None, digest],
+                         sort_keys=True, default=str)
+    return hash_text(payload)
+
+
+def skill_source_hash(skill: Dict) -> str:
+    """Content hash of every file in a skill directory."""
+    skill_path = Path(skill["_path"])
+    parts = []
+    for path in sorted(skill_path.rglob("*")):
+        if path.is_file():
+            parts.append(f"{path.relative_to(skill_path).as_posix()}:{hash_file(path)}")
+    return hash_text("\n".join(parts))
+
+
+def adapter_code_hash(agent: str) -> str:
+    """Hash of the code that renders skills for an agent."""
+    if agent not in _code_hash_cache:
+        agents_dir = get_agents_dir()
+        sources = [agents_dir / "base.py", agents_dir / agent / "adapter.py"] + _RENDER_SOURCES
+        _code_hash_cache[agent] = hash_text("\n".join(
+            hash_file(path) if path.exists() else "-" for path in sources
+        ))
+    return _code_hash_cache[agent]
+
+
+def load_manifest(dist_dir: Path = None) -> Optional[Dict]:
+    """Load a build manifest (None if missing or incompatible)."""
+    path = (dist_dir or get_dist_dir()) / MANIFEST_NAME
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if manifest.get("version") != MANIFEST_VERSION:
+        return None
+    return manifest
+
+
+def save_manifest(manifest: Dict, dist_dir: Path = None) -> None:
+    """Write a build manifest."""
+    dist_dir = dist_dir or get_dist_dir()
+    dist_dir.mkdir(parents=True, exist_ok=True)
+    manifest["version"] = MANIFEST_VERSION
+    with open(dist_dir / MANIFEST_NAME, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=1, sort_keys=True)
+    _manifest_cache.pop(str(dist_dir), None)
+
+
+def get_prebuilt_outputs(adapter, skill: Dict, name: str = None) -> Optional[Dict[Path, str]]:
+    """
+    Return an adapter's rendered outputs for a skill from fresh build artifacts.
+
+    Returns:
+        Dict of install path -> content (same shape as render_outputs()), or None
+        when there is no usable artifact and the skill must be rendered.
+    """
+    if not adapter.agent_name or (name and name != skill.get("name")) or not skill.get("_path"):
+        return None
+    # Plain output is the source with new frontmatter; rendering it costs less than checking an artifact
+    if not (adapter.compact or adapter.split):
+        return None
+
+    dist_dir = get_dist_dir()
+    key = str(dist_dir)
+    if key not in _manifest_cache:
+        _manifest_cache[key] = load_manifest(dist_dir)
+    manifest = _manifest_cache[key]
+    if not manifest:
+        return None
+
+    if manifest.get("options") != {"compact": adapter.compact, "split": adapter.split}:
+        return None
+
+    agent_entry = manifest.get("agents", {}).get(adapter.agent_name)
+    if not agent_entry or agent_entry.get("adapter_hash") != adapter_code_hash(adapter.agent_name):
+        return None
+
+    entry = agent_entry.get("skills", {}).get(skill.get("name"))
+    if not entry or entry.get("render_key") != render_key(skill):
+        return None
+
+    agent_dir = dist_dir / adapter.agent_name
+    outputs = {}
+    try:
+        for rel in entry["outputs"]:
+            outputs[adapter.target_dir / rel] = (agent_dir / rel).read_text(encoding="utf-8")
+    except OSError:
+        return None
+    return outputs
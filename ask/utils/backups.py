@@ -0,0 +1,213 @@
+"""Backup generations - deduplicated, compressed snapshots of installed skills.
+
+Before 'ask update' overwrites skills, the install directory's backup store
+records one generation holding every file of those skills (main file,
+sections, resources):
+
+    <install dir>/.ask-backups/generations.json    generation index
+    <install dir>/.ask-backups/objects/ab/cdef.gz  gzip'd content, named by SHA-256
+
+Content already in the store is never written again, and hashes come from
+the stat-keyed FileHashCache, so snapshotting unchanged files reads nothing.
+Only the newest generations are kept (ASK_BACKUP_GENERATIONS, default 5);
+objects no longer referenced by any generation are deleted.
+"""
+
+import gzip
+import json
+import os
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+from ask.utils.cache import FileHashCache
+from ask.utils.install_scan import get_backup_dir, scan_install_dir
+
+INDEX_NAME = "generations.json"
+INDEX_VERSION = 1
+DEFAULT_GENERATIONS = 5
+
+
+def get_generation_limit() -> int:
+    """How many generations each backup store keeps."""
+    try:
+        return max(1, int(os.environ.get("ASK_BACKUP_GENERATIONS", DEFAULT_GENERATIONS)))
+    except ValueError:
+        return DEFAULT_GENERATIONS
+
+
+class BackupStore:
+    """Backup generations for one agent/scope install directory."""
+
+    def __init__(self, adapter):
+        self.adapter = adapter
+        self.root = get_backup_dir(adapter)
+        self.index_path = self.root / INDEX_NAME
+        self.generations: List[Dict] = []
+        self.next_id = 1
+        try:
+            data = json.loads(self.index_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            data = None
+        if isinstance(data, dict) and data.get("version") == INDEX_VERSION:
+            self.generations = data.get("generations", [])
+            self.next_id = data.get("next_id", len(self.generations) + 1)
+
+    def _object_path(self, digest: str) -> Path:
+        return self.root / "objects" / digest[:2] / f"{digest[2:]}.gz"
+
+    def save(self) -> None:
+        self.root.mkdir(parents=True, exist_ok=True)
+        tmp = self.index_path.with_name(f".{INDEX_NAME}.{os.getpid()}.tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"version": INDEX_VERSION, "next_id": self.next_id, "generations": self.generations}, f,
+                      indent=2, sort_keys=True)
+        os.replace(tmp, self.index_path)
+
+    def get(self, generation_id: Optional[int] = None) -> Optional[Dict]:
+        """A generation by id (default: the newest)."""
+        if not self.generations:
+            return None
+        if generation_id is None:
+            return self.generations[-1]
+        return next((gen for gen in self.generations if gen["id"] == generation_id), None)
+
+    def _skill_files(self, scan: Dict, skill: Dict) -> List[Path]:
+        """Installed files of a skill: everything it owns plus planned files in shared dirs."""
+        root = self.adapter.target_dir
+        owned = scan["skills"].get(skill["name"], {}).get("files", {})
+        paths = {root / rel for rel in owned}
+        if "_path" in skill:
+            paths.update(path for path in self.adapter.plan_install(skill) if path.is_file())
+        return sorted(paths)
+
+    def snapshot(self, skills: Iterable[Dict], reason: str = "update", lock_entries: Dict[str, Dict] = None,
+                 hasher: FileHashCache = None) -> Optional[Dict]:
+        """
+        Record a new generation holding the current install of these skills.
+
+        Args:
+            skills: Skill dicts (at least 'name'; library skills also cover shared resource dirs)
+            lock_entries: Skill name -> ask.lock state to restore on rollback
+
+        Returns:
+            The generation, or None if none of the skills is installed.
+        """
+        hasher = hasher or FileHashCache()
+        scan = scan_install_dir(self.adapter)
+        root = self.adapter.target_dir
+
+        per_skill = {skill["name"]: self._skill_files(scan, skill) for skill in skills}
+        hashes = hasher.hash_many([path for paths in per_skill.values() for path in paths])
+
+        entries = {}
+        written = 0
+        for name, paths in per_skill.items():
+            files = {}
+            for path in paths:
+                digest = hashes.get(path)
+                if digest is None:
+                    continue
+                obj = self._object_path(digest)
+                if not obj.exists():
+                    obj.parent.mkdir(parents=True, exist_ok=True)
+                    tmp = obj.with_name(f".{obj.name}.{os.getpid()}.tmp")
+                    with open(path, "rb") as src, gzip.open(tmp, "wb") as dst:
+                        dst.write(src.read())
+                    os.replace(tmp, obj)
+                    written += 1
+                files[path.relative_to(root).as_posix()] = {"hash": digest, "mode": path.stat().st_mode & 0o777}
+            if files:
+                entries[name] = {"files": files}
+                if lock_entries and name in lock_entries:
+                    entries[name]["lock"] = lock_entries[name]
+
+        if not entries:
+            return None
+
+        generation = {
+            "id": self.next_id,
+            "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "reason": reason,
+            "skills": entries,
+            "new_objects": written,
+        }
+        self.next_id += 1
+        self.generations.append(generation)
+        self.prune()
+        self.save()
+        return generation
+
+    def restore(self, generation: Dict, skill_names: Iterable[str] = None,
+                hasher: FileHashCache = None) -> Dict[str, int]:
+        """
+        Put the files of a generation back in place.
+
+        Files whose current content already matches are left untouched; files
+        a skill owns now but did not have in the generation are removed.
+
+        Returns:
+            Counts: restored, unchanged, removed
+        """
+        hasher = hasher or FileHashCache()
+        root = self.adapter.target_dir
+        scan = scan_install_dir(self.adapter)
+        names = set(skill_names) if skill_names is not None else set(generation["skills"])
+
+        wanted = {}
+        stray = []
+        for name in sorted(names & set(generation["skills"])):
+            files = generation["skills"][name]["files"]
+            wanted.update((root / rel, info) for rel, info in files.items())
+            owned = scan["skills"].get(name, {}).get("files", {})
+            stray.extend(root / rel for rel in owned if rel not in files)
+
+        current = hasher.hash_many(wanted)
+        counts = {"restored": 0, "unchanged": 0, "removed": 0}
+        for path, info in wanted.items():
+            if current[path] == info["hash"]:
+                counts["unchanged"] += 1
+                continue
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+            with gzip.open(self._object_path(info["hash"]), "rb") as src, open(tmp, "wb") as dst:
+                dst.write(src.read())
+            os.chmod(tmp, info["mode"])
+            # Replacing (not writing through) also detaches '--link' installs from the shared store
+            os.replace(tmp, path)
+            counts["restored"] += 1
+
+        for path in stray:
+            path.unlink(missing_ok=True)
+            counts["removed"] += 1
+        for path in {path.parent for path in stray}:
+            # Drop directories emptied by the removals (e.g. a sections/ dir the old version lacked)
+            while path != root and path.is_dir() and not any(path.iterdir()):
+                path.rmdir()
+                path = path.parent
+        return counts
+
+    def prune(self, keep: Optional[int] = None) -> int:
+        """Drop generations beyond the newest `keep` and delete unreferenced objects. Returns objects removed."""
+        keep = keep or get_generation_limit()
+        self.generations = self.generations[-keep:]
+        referenced = {
+            info["hash"]
+            for gen in self.generations
+            for entry in gen["skills"].values()
+            for info in entry["files"].values()
+        }
+
+        removed = 0
+        objects_dir = self.root / "objects"
+        if not objects_dir.is_dir():
+            return removed
+        for bucket in os.scandir(objects_dir):
+            if not bucket.is_dir():
+                continue
+            for entry in os.scandir(bucket.path):
+                digest = bucket.name + entry.name[:-len(".gz")]
+                if entry.name.endswith(".gz") and digest not in referenced:
+                    os.unlink(entry.path)
+                    removed += 1
+        return removed
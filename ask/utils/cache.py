@@ -0,0 +1,182 @@
+"""Cache utilities for Agent Skill Kit.
+
+Persistent caches (search index, signatures, token counts, ...) live under the
+user cache directory so they survive across invocations and projects.
+"""
+
+import hashlib
+import json
+import mmap
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional
+
+
+CACHE_VERSION = 1
+
+
+def get_cache_dir() -> Path:
+    """Get the ASK cache directory (honours ASK_CACHE_DIR and XDG_CACHE_HOME)."""
+    override = os.environ.get("ASK_CACHE_DIR")
+    if override:
+        return Path(override).expanduser()
+
+    xdg = os.environ.get("XDG_CACHE_HOME")
+    base = Path(xdg).expanduser() if xdg else Path.home() / ".cache"
+    return base / "ask"
+
+
+def hash_bytes(data: bytes) -> str:
+    """Return the hex SHA-256 digest of some bytes."""
+    return hashlib.sha256(data).hexdigest()
+
+
+def hash_text(text: str) -> str:
+    """Return the hex SHA-256 digest of a string (UTF-8 encoded)."""
+    return hash_bytes(text.encode("utf-8"))
+
+
+def hash_file(path: Path) -> str:
+    """Return the hex SHA-256 digest of a file's contents."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def hash_file_mmap(path: Path) -> Optional[str]:
+    """
+    Hash a file through a memory map (no read copies; hashlib releases the GIL).
+
+    Returns None if the file does not exist or cannot be read.
+    """
+    try:
+        with open(path, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return hash_bytes(b"")
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                return hashlib.sha256(mapped).hexdigest()
+    except (OSError, ValueError):
+        return None
+
+
+def hash_files(paths: Iterable[Path], jobs: Optional[int] = None) -> Dict[Path, Optional[str]]:
+    """
+    Hash many files in parallel threads.
+
+    Returns:
+        Dict of path -> hex digest (None for missing or unreadable files).
+    """
+    paths = list(paths)
+    if len(paths) < 2 or jobs == 1:
+        return {path: hash_file_mmap(path) for path in paths}
+    with ThreadPoolExecutor(max_workers=jobs or min(32, (os.cpu_count() or 1) * 2)) as pool:
+        return dict(zip(paths, pool.map(hash_file_mmap, paths)))
+
+
+def stat_signature(path: Path) -> Optional[list]:
+    """
+    Cheap change-detection signature for a file: [mtime_ns, size].
+
+    Returns None if the file does not exist.
+    """
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return [st.st_mtime_ns, st.st_size]
+
+
+def load_json_cache(name: str) -> Optional[Any]:
+    """
+    Load a named JSON cache file.
+
+    Returns None if the cache is missing, unreadable, or from another cache version.
+    """
+    path = get_cache_dir() / f"{name}.json"
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    if not isinstance(data, dict) or data.get("version") != CACHE_VERSION:
+        return None
+    return data.get("data")
+
+
+def save_json_cache(name: str, data: Any) -> None:
+    """
+    Atomically write a named JSON cache file.
+
+    Cache writes are best-effort: failures (read-only home, full disk) are ignored.
+    """
+    cache_dir = get_cache_dir()
+    path = cache_dir / f"{name}.json"
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"version": CACHE_VERSION, "data": data}, f, separators=(",", ":"))
+        os.replace(tmp_path, path)
+    except OSError:
+        try:
+            tmp_path.unlink()
+        except OSError:
+            pass
+
+
+class FileHashCache:
+    """
+    Persistent file hashes keyed by (inode, mtime_ns, size).
+
+    Repeat runs only re-hash files whose stat changed; misses are hashed in
+    parallel (see hash_files). One instance can be shared between threads;
+    hashing itself runs outside the lock.
+    """
+
+    CACHE_NAME = "file-hashes"
+
+    def __init__(self):
+        self.entries = load_json_cache(self.CACHE_NAME) or {}
+        self.dirty = False
+        self._lock = threading.Lock()
+
+    def hash_many(self, paths: Iterable[Path], jobs: Optional[int] = None) -> Dict[Path, Optional[str]]:
+        """Return path -> digest (None for missing or unreadable files)."""
+        results = {}
+        misses = {}
+        for path in paths:
+            try:
+                st = os.stat(path)
+            except OSError:
+                results[path] = None
+                with self._lock:
+                    if self.entries.pop(str(path), None) is not None:
+                        self.dirty = True
+                continue
+            key = [st.st_ino, st.st_mtime_ns, st.st_size]
+            with self._lock:
+                cached = self.entries.get(str(path))
+            if cached and cached[:3] == key:
+                results[path] = cached[3]
+            else:
+                misses[path] = key
+
+        hashed = hash_files(misses, jobs=jobs)
+        with self._lock:
+            for path, digest in hashed.items():
+                results[path] = digest
+                if digest is not None:
+                    self.entries[str(path)] = misses[path] + [digest]
+                    self.dirty = True
+        return results
+
+    def save(self) -> None:
+        with self._lock:
+            if self.dirty:
+                save_json_cache(self.CACHE_NAME, self.entries)
+                self.dirty = False
@@ -0,0 +1,214 @@
+"""Compact transform - shrink markdown skill output without changing its meaning.
+
+Used by adapters when a skill is installed with --compact. The rewrite is
+deterministic and never touches fenced code blocks. It:
+
+- keeps the document's leading frontmatter, drops frontmatter blocks embedded
+  later on (the source SKILL.md's own header nested under an adapter header)
+- removes HTML comments
+- strips decorative emoji from headings and drops banner lines/images
+- drops paragraphs that repeat an earlier one (e.g. description == intro line)
+- collapses runs of blank lines and repeated horizontal rules
+"""
+
+import re
+from typing import Callable, Dict, List, Tuple
+
+
+_HTML_COMMENT = re.compile(r"<!--.*?-->", re.DOTALL)
+_HEADING = re.compile(r"^(#{1,6})\s+(.*)$")
+_FRONTMATTER_LINE = re.compile(r"^([A-Za-z_][\w-]*:|\s+\S|-\s)")
+_FRONTMATTER_KEY = re.compile(r"^([A-Za-z_][\w-]*):(.*)$")
+_EMOJI = re.compile(
+    "["
+    "\U0001F000-\U0001FAFF"  # pictographs, emoticons, transport, symbols
+    "\u2600-\u27BF"          # misc symbols, dingbats
+    "\u2B00-\u2BFF"          # arrows, stars
+    "\uFE0F\u200D"           # variation selector, zero-width joiner
+    "\uFFFD"                 # replacement char left behind by broken emoji
+    "]+"
+)
+_BANNER_LINE = re.compile("^[\\s\u2500-\u257F\u2580-\u259F\u2600-\u27BF\U0001F000-\U0001FAFF=*~_#\\-]{3,}$")
+_BANNER_IMAGE = re.compile(r"^!\[[^\]]*banner[^\]]*\]\([^)]*\)$", re.IGNORECASE)
+
+# Paragraphs shorter than this are never treated as repeated boilerplate
+_MIN_DEDUPE_LENGTH = 20
+
+
+def split_frontmatter(lines: List[str]) -> Tuple[List[str], List[str]]:
+    """Split a leading frontmatter block from the remaining lines."""
+    if lines and lines[0].strip() == "---":
+        for idx in range(1, len(lines)):
+            if lines[idx].strip() == "---":
+                return lines[:idx + 1], lines[idx + 1:]
+    return [], lines
+
+
+def split_code_segments(lines: List[str]) -> List[Tuple[bool, List[str]]]:
+    """Split lines into (is_code, lines) segments around fenced code blocks."""
+    segments = []
+    current = []
+    fence = None
+
+    for line in lines:
+        stripped = line.lstrip()
+        if fence is None and stripped.startswith(("```", "~~~")):
+            if current:
+                segments.append((False, current))
+            marker = stripped[0]
+            fence = marker * (len(stripped) - len(stripped.lstrip(marker)))
+            current = [line]
+        elif fence is not None and stripped.startswith(fence) and not stripped[len(fence):].strip():
+            current.append(line)
+            segments.append((True, current))
+            current = []
+            fence = None
+        else:
+            current.append(line)
+
+    if current:
+        # An unterminated fence is still code: keep it verbatim
+        segments.append((fence is not None, current))
+    return segments
+
+
+def _parse_frontmatter(lines: List[str]) -> Dict[str, str]:
+    """Read simple 'key: value' pairs from frontmatter lines."""
+    values = {}
+    for line in lines:
+        match = _FRONTMATTER_KEY.match(line)
+        if match:
+            values[match.group(1)] = match.group(2).strip()
+    return values
+
+
+def _drop_embedded_frontmatter(lines: List[str], absorb: Callable[[Dict[str, str]], List[str]]) -> List[str]:
+    """
+    Remove '---' delimited key/value blocks that carry skill metadata.
+    
+    absorb() receives each dropped block's values and returns any lines that
+    must stay in its place (metadata not found anywhere else in the document).
+    """
+    result = []
+    idx = 0
+    while idx < len(lines):
+        if lines[idx].strip() == "---":
+            end = idx + 1
+            while end < len(lines) and lines[end].strip() != "---" and _FRONTMATTER_LINE.match(lines[end]):
+                end += 1
+            body = lines[idx + 1:end]
+            if (
+                end < len(lines)
+                and lines[end].strip() == "---"
+                and any(l.startswith(("name:", "description:")) for l in body)
+            ):
+                result.extend(absorb(_parse_frontmatter(body)))
+                idx = end + 1
+                continue
+        result.append(lines[idx])
+        idx += 1
+    return result
+
+
+def _clean_line(line: str) -> str:
+    """Strip decorative emoji from headings and trailing whitespace from any line."""
+    line = line.rstrip()
+    match = _HEADING.match(line)
+    if match:
+        title = " ".join(_EMOJI.sub(" ", match.group(2)).split())
+        if title:
+            return f"{match.group(1)} {title}"
+    return line
+
+
+def _is_banner(line: str) -> bool:
+    stripped = line.strip()
+    if _BANNER_IMAGE.match(stripped):
+        return True
+    # Plain rules and setext underlines ('---', '===', '***') are structure, not decoration
+    if not _BANNER_LINE.match(stripped) or len(set(stripped)) == 1 and stripped[0] in "-=*_~#":
+        return False
+    return not any(ch.isalnum() for ch in stripped)
+
+
+def _normalize(paragraph: str) -> str:
+    return " ".join(paragraph.lower().split()).rstrip(".!:;")
+
+
+def compact_markdown(text: str) -> str:
+    """Return a compact, deterministic rewrite of a markdown document."""
+    frontmatter, lines = split_frontmatter(text.splitlines())
+    header = _parse_frontmatter(frontmatter[1:-1])
+    filled = {}
+    normalized_text = _normalize(text)
+
+    def absorb(values: Dict[str, str]) -> List[str]:
+        # Fill empty header fields from the nested block; keep a description
+        # that would otherwise disappear from the document entirely.
+        kept = []
+        for key, value in values.items():
+            if not value:
+                continue
+            if key in header and not header[key] and key not in filled:
+                filled[key] = value
+            elif key == "description" and normalized_text.count(_normalize(value)) < 2:
+                kept.extend(["", value, ""])
+        return kept
+
+    # blocks: (text, tight) - tight blocks follow the previous one without a blank line
+    blocks = []
+    seen = set()
+    prev_ended_blank = True
+
+    for is_code, segment in split_code_segments(lines):
+        if is_code:
+            blocks.append(("\n".join(segment), bool(blocks) and not prev_ended_blank))
+            prev_ended_blank = False
+            continue
+
+        tight = bool(blocks) and bool(segment[0].strip())
+        prev_ended_blank = not segment[-1].strip()
+
+        segment_text = _HTML_COMMENT.sub("", "\n".join(segment))
+        segment_lines = _drop_embedded_frontmatter(segment_text.split("\n"), absorb)
+
+        paragraph = []
+        for line in segment_lines + [""]:
+            if line.strip():
+                if not _is_banner(line):
+                    paragraph.append(_clean_line(line))
+                continue
+            if not paragraph:
+                tight = False
+                continue
+
+            block = "\n".join(paragraph)
+            paragraph = []
+            block_tight, tight = tight, False
+
+            key = _normalize(block)
+            if len(key) >= _MIN_DEDUPE_LENGTH:
+                if key in seen:
+                    continue
+                seen.add(key)
+            if block.strip() == "---" and blocks and blocks[-1][0].strip() == "---":
+                continue
+            blocks.append((block, block_tight))
+
+    if frontmatter:
+        header_lines = []
+        for line in frontmatter:
+            match = _FRONTMATTER_KEY.match(line)
+            if match and match.group(1) in filled:
+                line = f"{match.group(1)}: {filled[match.group(1)]}"
+            header_lines.append(line.rstrip())
+        blocks.insert(0, ("\n".join(header_lines), False))
+
+    if not blocks:
+        return ""
+
+    output = [blocks[0][0]]
+    for block, tight in blocks[1:]:
+        output.append("\n" if tight else "\n\n")
+        output.append(block)
+    return "".join(output) + "\n"
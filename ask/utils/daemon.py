@@ -0,0 +1,265 @@
+"""Skill daemon - a warm `ask` process answering requests over a Unix socket.
+
+`ask serve` keeps the skill registry, search index and adapters loaded.
+Clients send one JSON object per line and get one JSON object back:
+
+    {"op": "search", "query": "docker", "limit": 5}
+    {"ok": true, "result": [...]}
+
+Ops: status, list, search, copy, shutdown. Errors come back as
+{"ok": false, "error": "..."}. Commands call request() first and run
+in-process whenever it returns None (no daemon, or ASK_NO_DAEMON set).
+
+A daemon serves one skill library. Its socket is named after a hash of the
+library's resolved path, and every request carries the client's
+"skills_dir"; a daemon serving a different library answers
+{"ok": false, "wrong_library": true} and the client runs in-process.
+"""
+
+import json
+import os
+import socket
+import socketserver
+import stat
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional, Set
+
+from ask.utils.cache import get_cache_dir
+from ask.utils.run_client import library_key
+
+
+SOCKET_PREFIX = "ask"
+
+# Clients give up quickly so a wedged daemon never makes the CLI slower
+CONNECT_TIMEOUT = 0.2
+REQUEST_TIMEOUT = 30.0
+
+
+class DaemonError(Exception):
+    """The daemon answered with an error."""
+
+
+def current_library() -> Path:
+    """The resolved skills directory this process works on."""
+    # Imported late: the registry pulls in yaml, which the client path does not need until here
+    from ask.utils import skill_registry
+
+    return Path(skill_registry.get_skills_dir()).resolve()
+
+
+def get_socket_path(skills_dir: Path = None) -> Path:
+    """Socket path for a library's daemon (honours ASK_SOCKET, defaults to the cache directory)."""
+    override = os.environ.get("ASK_SOCKET")
+    if override:
+        return Path(override).expanduser()
+    return get_cache_dir() / f"{SOCKET_PREFIX}-{library_key(skills_dir or current_library())}.sock"
+
+
+def is_supported() -> bool:
+    return hasattr(socket, "AF_UNIX")
+
+
+def request(op: str, socket_path: Path = None, **params) -> Optional[Any]:
+    """
+    Send a request to a running daemon.
+
+    Returns:
+        The daemon's result, or None when no daemon for this library is
+        reachable (the caller should then do the work in-process).
+
+    Raises:
+        DaemonError: the daemon handled the request and reported an error.
+    """
+    if os.environ.get("ASK_NO_DAEMON") or not is_supported():
+        return None
+    library = current_library()
+    path = socket_path or get_socket_path(library)
+    if not path.exists():
+        return None
+
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.settimeout(CONNECT_TIMEOUT)
+        sock.connect(str(path))
+        sock.settimeout(REQUEST_TIMEOUT)
+        sock.sendall(json.dumps({"op": op, "skills_dir": str(library), **params}).encode("utf-8") + b"\n")
+        with sock.makefile("rb") as stream:
+            line = stream.readline()
+    except OSError:
+        return None
+    finally:
+        sock.close()
+
+    try:
+        response = json.loads(line)
+    except ValueError:
+        return None
+    if response.get("wrong_library"):
+        return None
+    if not response.get("ok"):
+        raise DaemonError(response.get("error", "unknown daemon error"))
+    return response.get("result")
+
+
+class SkillService:
+    """Request handlers over warm state. Transport-independent so it can be tested directly."""
+
+    def __init__(self):
+        # Heavy imports happen once, in the daemon
+        from ask.utils import skill_registry
+        from ask.utils.search_index import SearchIndex
+        from ask.utils.skill_registry import SkillRegistry
+        from ask.utils.watcher import create_watcher
+
+        # Watch before loading so edits made while starting up are not missed
+        skills_dir = skill_registry.get_skills_dir()
+        self.library = str(Path(skills_dir).resolve())
+        self.watcher = create_watcher(skills_dir)
+        self.registry = SkillRegistry()
+        self.index = SearchIndex.load()
+        if self.index.refresh():
+            self.index.save()
+        self.adapters: Dict[tuple, object] = {}
+        self.started = time.time()
+        self.requests = 0
+        self.stopping = False
+
+        # The watcher runs off the request path; requests only apply what it reported
+        self._pending: Set[Path] = set()
+        self._pending_lock = threading.Lock()
+        self._watch_thread = threading.Thread(target=self._watch, daemon=True)
+        self._watch_thread.start()
+
+    def _watch(self) -> None:
+        while not self.stopping:
+            changed = self.watcher.changes(timeout=1.0)
+            if changed:
+                with self._pending_lock:
+                    self._pending |= changed
+
+    def _sync(self) -> None:
+        """Apply skill edits the watcher reported since the last request."""
+        if not self._pending:
+            return
+        with self._pending_lock:
+            changed, self._pending = self._pending, set()
+        self.registry.refresh(changed)
+        if self.index.refresh():
+            self.index.save()
+
+    def close(self) -> None:
+        # The watch thread is a daemon thread and exits after its current wait
+        self.stopping = True
+        self.watcher.close()
+
+    def _adapter(self, agent: str, use_global: bool, compact: bool, split: bool, link: bool, cwd: Optional[str]):
+        """Cached adapter. Local adapters install into the client's cwd."""
+        from ask.utils.filesystem import get_adapter
+
+        project_root = None if use_global else Path(cwd or os.getcwd())
+        key = (agent, use_global, compact, split, link, project_root)
+        if key not in self.adapters:
+            self.adapters[key] = get_adapter(agent, use_global=use_global, compact=compact, split=split,
+                                             link=link, project_root=project_root)
+        return self.adapters[key]
+
+    def handle(self, message: Dict) -> Dict:
+        """Handle one request message and return the response message."""
+        self.requests += 1
+        op = message.get("op")
+        handler = getattr(self, f"op_{op}", None) if isinstance(op, str) else None
+        if handler is None:
+            return {"ok": False, "error": f"Unknown op: {op}"}
+        library = message.get("skills_dir")
+        if library and library != self.library:
+            return {"ok": False, "wrong_library": True, "error": f"This daemon serves {self.library}"}
+        try:
+            self._sync()
+            return {"ok": True, "result": handler(message)}
+        except Exception as e:
+            return {"ok": False, "error": str(e)}
+
+    def op_status(self, message: Dict) -> Dict:
+        return {
+            "pid": os.getpid(),
+            "uptime": round(time.time() - self.started, 1),
+            "requests": self.requests,
+            "skills": len(self.registry.all()),
+            "skills_dir": self.library,
+            "adapters": len(self.adapters),
+        }
+
+    def op_list(self, message: Dict) -> list:
+        return self.registry.all()
+
+    def op_search(self, message: Dict) -> list:
+        return self.index.search(message["query"], limit=int(message.get("limit", 10)))
+
+    def op_copy(self, message: Dict) -> Dict:
+        skill = self.registry.get(message["skill"])
+        if not skill:
+            raise ValueError(f"Skill not found: {message['skill']}")
+        adapter = self._adapter(
+            message["agent"], bool(message.get("global")), bool(message.get("compact")),
+            bool(message.get("split")), bool(message.get("link")), message.get("cwd"),
+        )
+        if not adapter:
+            raise ValueError(f"No adapter for agent: {message['agent']}")
+        return adapter.copy_skill(
+            skill, dry_run=bool(message.get("dry_run")), new_name=message.get("new_name"),
+            force=bool(message.get("force")),
+        )
+
+    def op_shutdown(self, message: Dict) -> str:
+        self.stopping = True
+        return "bye"
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    # One request per connection; a silent client cannot stall the server for long
+    timeout = REQUEST_TIMEOUT
+
+    def handle(self):
+        try:
+            message = json.loads(self.rfile.readline())
+        except (OSError, ValueError):
+            response = {"ok": False, "error": "Invalid JSON"}
+        else:
+            response = self.server.service.handle(message)
+        self.wfile.write(json.dumps(response, default=str).encode("utf-8") + b"\n")
+
+
+class SkillServer(socketserver.UnixStreamServer):
+    """Single-threaded Unix socket server; requests are short and handled in order."""
+
+    def __init__(self, socket_path: Path, service: SkillService):
+        self.service = service
+        self.socket_path = Path(socket_path)
+        self.socket_path.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            if stat.S_ISSOCK(os.lstat(self.socket_path).st_mode):
+                # Leftover from a daemon that did not shut down cleanly
+                self.socket_path.unlink()
+        except FileNotFoundError:
+            pass
+        # Created owner-only; there is no window where others can connect
+        previous = os.umask(0o177)
+        try:
+            super().__init__(str(self.socket_path), _Handler)
+        finally:
+            os.umask(previous)
+
+    def serve(self) -> None:
+        """Serve until a shutdown request arrives."""
+        try:
+            while not self.service.stopping:
+                self.handle_request()
+        finally:
+            self.server_close()
+            self.service.close()
+            try:
+                self.socket_path.unlink()
+            except OSError:
+                pass
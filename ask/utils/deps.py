@@ -0,0 +1,258 @@
+"""Shared dependency environments for skill scripts.
+
+Skills list the Python packages their scripts need in skill.yaml
+(`dependencies:`). `ask deps` installs the union of those lists into one
+virtual environment in the cache directory, named by a hash of the
+normalised requirements and the Python it was built for:
+
+    <cache>/envs/<key>/                 the environment
+    <cache>/envs/<key>/ask-env.json     requirements and build info, written last
+    <cache>/wheels/                     local wheel cache (ASK_WHEELHOUSE overrides)
+
+An environment is only used once its ask-env.json exists, so a failed or
+interrupted build is never picked up. Any later install with the same
+dependency set (another project, a re-run) reuses it as is.
+
+Packages are installed from the wheel cache only (pip --no-index
+--find-links), never from an index; `ask deps --fetch` fills the cache
+with `pip download` first. The environment itself is created without pip
+and the running interpreter's pip installs into it, so a build costs the
+package installs and nothing more.
+"""
+
+import hashlib
+import json
+import os
+import re
+import shutil
+import subprocess
+import sys
+import sysconfig
+import time
+import venv
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+from ask.utils.cache import get_cache_dir
+
+try:
+    import fcntl
+except ImportError:  # Windows: concurrent builds of the same set are not serialised
+    fcntl = None
+
+
+MARKER_NAME = "ask-env.json"
+ENV_VERSION = 1
+
+# Environments not used for this long are removed by `ask deps --prune`
+PRUNE_DAYS = 30
+
+
+class DepsError(Exception):
+    """Dependencies could not be resolved or installed."""
+
+
+def get_envs_dir() -> Path:
+    return get_cache_dir() / "envs"
+
+
+def get_wheel_dir() -> Path:
+    """Local wheel cache (honours ASK_WHEELHOUSE)."""
+    override = os.environ.get("ASK_WHEELHOUSE")
+    if override:
+        return Path(override).expanduser()
+    return get_cache_dir() / "wheels"
+
+
+def normalize_requirement(requirement: str) -> str:
+    """
+    Canonical form of a requirement, so equal sets hash equally.
+
+    "PyYAML >= 6" and "pyyaml>=6" both become "pyyaml>=6".
+    """
+    text = re.sub(r"\s+", "", str(requirement))
+    match = re.match(r"[A-Za-z0-9][A-Za-z0-9._-]*", text)
+    if not match:
+        raise DepsError(f"Invalid requirement: {requirement!r}")
+    name = re.sub(r"[-_.]+", "-", match.group(0)).lower()
+    return name + text[match.end():]
+
+
+def collect_requirements(skills: Iterable[Dict]) -> Dict[str, List[str]]:
+    """Normalised requirement -> names of the skills that declare it."""
+    required: Dict[str, List[str]] = {}
+    for skill in skills:
+        for dependency in skill.get("dependencies") or []:
+            required.setdefault(normalize_requirement(dependency), []).append(skill["name"])
+    return dict(sorted(required.items()))
+
+
+def python_tag() -> str:
+    """The interpreter an environment is built for (e.g. 'cpython-3.11-linux-x86_64')."""
+    return f"{sys.implementation.name}-{sys.version_info[0]}.{sys.version_info[1]}-{sysconfig.get_platform()}"
+
+
+def env_key(requirements: Iterable[str]) -> str:
+    payload = json.dumps({"python": python_tag(), "requirements": sorted(set(requirements))})
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+
+
+def env_python(env: Path) -> Path:
+    if os.name == "nt":
+        return env / "Scripts" / "python.exe"
+    return env / "bin" / "python"
+
+
+def site_packages(env: Path) -> Path:
+    return Path(sysconfig.get_path("purelib", vars={"base": str(env), "platbase": str(env)}))
+
+
+def _read_marker(env: Path) -> Optional[Dict]:
+    try:
+        with open(env / MARKER_NAME, "r", encoding="utf-8") as f:
+            info = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(info, dict) or info.get("version") != ENV_VERSION:
+        return None
+    return info
+
+
+def _touch(env: Path) -> None:
+    # The marker's mtime is the environment's last use (see prune_envs)
+    try:
+        os.utime(env / MARKER_NAME)
+    except OSError:
+        pass
+
+
+def list_envs() -> List[Dict]:
+    """Complete environments, most recently used first."""
+    envs = []
+    root = get_envs_dir()
+    if not root.is_dir():
+        return envs
+    for env in root.iterdir():
+        info = _read_marker(env) if env.is_dir() else None
+        if info is None:
+            continue
+        envs.append({**info, "path": env, "used": (env / MARKER_NAME).stat().st_mtime})
+    envs.sort(key=lambda info: info["used"], reverse=True)
+    return envs
+
+
+def find_env(requirements: Iterable[str]) -> Optional[Path]:
+    """
+    The most recently used environment for this Python that provides every
+    requirement (possibly among others), or None.
+    """
+    wanted = {normalize_requirement(requirement) for requirement in requirements}
+    for info in list_envs():
+        if info.get("python") == python_tag() and wanted <= set(info.get("requirements", [])):
+            _touch(info["path"])
+            return info["path"]
+    return None
+
+
+def _pip(*args: str) -> subprocess.CompletedProcess:
+    command = [sys.executable, "-m", "pip", "--disable-pip-version-check", "--no-input", *args]
+    try:
+        result = subprocess.run(command, capture_output=True, text=True)
+    except OSError as e:
+        raise DepsError(f"Could not run pip: {e}")
+    if result.returncode != 0:
+        output = (result.stderr or result.stdout).strip().splitlines()
+        raise DepsError("\n".join(output[-10:]) or f"pip exited with status {result.returncode}")
+    return result
+
+
+def fetch_wheels(requirements: List[str], wheel_dir: Path = None) -> Path:
+    """Download wheels for the requirements (and their dependencies) into the wheel cache."""
+    wheel_dir = wheel_dir or get_wheel_dir()
+    wheel_dir.mkdir(parents=True, exist_ok=True)
+    _pip("download", "--only-binary", ":all:", "--dest", str(wheel_dir), *requirements)
+    return wheel_dir
+
+
+def ensure_env(requirements: List[str], wheel_dir: Path = None, rebuild: bool = False) -> Dict:
+    """
+    Return the environment for exactly this requirement set, building it from
+    the wheel cache if it does not exist yet.
+
+    Returns:
+        {"path": Path, "key": str, "built": bool, "seconds": float}
+
+    Raises:
+        DepsError: a requirement is invalid or could not be installed offline.
+    """
+    requirements = sorted({normalize_requirement(requirement) for requirement in requirements})
+    key = env_key(requirements)
+    root = get_envs_dir()
+    env = root / key
+    start = time.perf_counter()
+
+    if not rebuild and _read_marker(env) is not None:
+        _touch(env)
+        return {"path": env, "key": key, "built": False, "seconds": time.perf_counter() - start}
+
+    root.mkdir(parents=True, exist_ok=True)
+    with open(root / f"{key}.lock", "w") as lock:
+        if fcntl is not None:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+        # Another process may have finished the same build while we waited
+        if not rebuild and _read_marker(env) is not None:
+            _touch(env)
+            return {"path": env, "key": key, "built": False, "seconds": time.perf_counter() - start}
+
+        install = ["install", "--no-index", "--find-links", str(wheel_dir or get_wheel_dir()),
+                   "--only-binary", ":all:", *requirements]
+        if rebuild and _read_marker(env) is not None and requirements:
+            # Keep the working environment unless the wheels for its replacement are all there
+            _pip(*install, "--dry-run", "--ignore-installed", "--quiet")
+
+        # Whatever is there is incomplete (a failed build) or being replaced
+        shutil.rmtree(env, ignore_errors=True)
+        try:
+            venv.EnvBuilder(with_pip=False, symlinks=os.name != "nt").create(env)
+            if requirements:
+                _pip("--python", str(env_python(env)), *install)
+        except BaseException:
+            shutil.rmtree(env, ignore_errors=True)
+            raise
+
+        info = {"version": ENV_VERSION, "key": key, "python": python_tag(), "requirements": requirements,
+                "created": time.time()}
+        tmp = env / f"{MARKER_NAME}.{os.getpid()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(info, f, indent=2)
+        os.replace(tmp, env / MARKER_NAME)
+
+    return {"path": env, "key": key, "built": True, "seconds": time.perf_counter() - start}
+
+
+def prune_envs(days: float = PRUNE_DAYS, dry_run: bool = False) -> List[Path]:
+    """Remove environments unused for `days` and leftovers of failed builds."""
+    root = get_envs_dir()
+    if not root.is_dir():
+        return []
+    cutoff = time.time() - days * 86400
+    removed = []
+    for env in sorted(root.iterdir()):
+        if not env.is_dir():
+            continue
+        marker = env / MARKER_NAME
+        if _read_marker(env) is not None and marker.stat().st_mtime >= cutoff:
+            continue
+        # A build in progress holds its lock; leave it alone
+        if _read_marker(env) is None and fcntl is not None:
+            with open(root / f"{env.name}.lock", "w") as lock:
+                try:
+                    fcntl.flock(lock, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                except OSError:
+                    continue
+                if not dry_run:
+                    shutil.rmtree(env, ignore_errors=True)
+        elif not dry_run:
+            shutil.rmtree(env, ignore_errors=True)
+        removed.append(env)
+    return removed
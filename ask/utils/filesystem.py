@@ -7,6 +7,10 @@ from pathlib import Path
 from typing import Optional
 
 
+# Install scope name -> use_global flag for get_adapter()
+SCOPES = {"local": False, "global": True}
+
+
 def get_project_root() -> Path:
     """Get the Agent Skill Kit project root directory."""
     current = Path(__file__).resolve()
@@ -24,6 +28,11 @@ def get_project_root() -> Path:
     return current.parent.parent.parent
 
 
+def is_dev_mode() -> bool:
+    """True when running from a source checkout (pyproject.toml present) rather than an installed package."""
+    return (get_project_root() / "pyproject.toml").exists()
+
+
 def get_skills_dir() -> Path:
     """Get the skills directory."""
     return get_project_root() / "skills"
@@ -55,12 +64,21 @@ def safe_copy_file(src: Path, dst: Path, force: bool = False) -> dict:
     return {"status": "copied", "target": str(dst)}
 
 
-def get_adapter(agent_name: str, use_global: bool = False):
+def get_adapter(agent_name: str, use_global: bool = False, compact: bool = False, split: bool = False,
+                link: bool = False, project_root: Path = None):
     """
     Dynamic adapter loader for agent-specific transformations.
     
     Uses importlib to dynamically load the adapter module from agents/<agent_name>/adapter.py.
     Expected class name: <AgentName>Adapter (e.g., GeminiAdapter, ClaudeAdapter).
+    
+    Args:
+        agent_name: Agent to load (directory name under agents/)
+        use_global: Target the user-wide (global) location instead of the project
+        compact: Emit compacted output (see ask.utils.compact)
+        split: Split large skills into a main file plus section files (see ask.utils.splitter)
+        link: Install resources as links into the shared store (see ask.utils.store)
+        project_root: Project for local installs (default: the current directory)
     """
     try:
         # 1. Dynamically import the module
@@ -74,8 +92,17 @@ def get_adapter(agent_name: str, use_global: bool = False):
         # 3. Get the class from the module
         adapter_class = getattr(module, class_name)
         
-        # 4. Instantiate and return
-        return adapter_class(use_global=use_global)
+        # 4. Instantiate, apply output options and return
+        # Adapters generated before project_root existed only take use_global
+        if project_root is not None:
+            adapter = adapter_class(use_global=use_global, project_root=project_root)
+        else:
+            adapter = adapter_class(use_global=use_global)
+        adapter.agent_name = agent_name
+        adapter.compact = compact
+        adapter.split = split
+        adapter.link = link
+        return adapter
         
     except (ImportError, AttributeError) as e:
         # Fallback or error logging could go here
@@ -0,0 +1,164 @@
+"""Install directory scanning - classify everything under an adapter's target directory.
+
+One os.scandir walk per target directory attributes every file to a skill:
+its main file (e.g. <name>.md or <name>/SKILL.md), or its per-skill
+directory (e.g. .scripts/<name>/ or the <name>/ skill folder). Update
+backups (*.md.bak), the backup store (.ask-backups/) and unrelated files
+are listed separately.
+
+The layout is derived from the adapter itself (get_target_path and
+get_sections_dir on a probe name), so new adapters need no changes here.
+"""
+
+import os
+import re
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+PROBE = "__ask_probe__"
+BACKUP_SUFFIX = ".md.bak"
+BACKUP_DIR = ".ask-backups"
+
+# Rendered skills keep the library name in their frontmatter, even when
+# installed under another name
+NAME_PATTERN = re.compile(r"^name:\s*['\"]?([\w.-]+)", re.MULTILINE)
+
+
+def _split_probe(rel: str) -> Tuple[str, str]:
+    prefix, _, suffix = rel.partition(PROBE)
+    return prefix, suffix
+
+
+def get_layout(adapter) -> Dict[str, str]:
+    """Path patterns of an adapter's install directory, relative to its target_dir."""
+    probe = {"name": PROBE}
+    target = adapter.get_target_path(probe)
+    main_rel = target.relative_to(adapter.target_dir).as_posix()
+    dir_rel = adapter.get_sections_dir(probe, target).parent.relative_to(adapter.target_dir).as_posix()
+    main_prefix, main_suffix = _split_probe(main_rel)
+    dir_prefix, _ = _split_probe(dir_rel)
+    # Only the part of the tree the layout can own is scanned (e.g. instructions/
+    # for Codex, whose target directory is the project root itself)
+    base = os.path.commonpath([os.path.dirname(main_prefix + "x"), os.path.dirname(dir_prefix + "x")])
+    return {"main_prefix": main_prefix, "main_suffix": main_suffix, "dir_prefix": dir_prefix,
+            "base": f"{base}/" if base else ""}
+
+
+def original_name(path: Path) -> Optional[str]:
+    """Library skill name recorded near the top of an installed main file."""
+    try:
+        with open(path, encoding="utf-8", errors="replace") as f:
+            head = f.read(4096)
+    except OSError:
+        return None
+    match = NAME_PATTERN.search(head)
+    return match.group(1) if match else None
+
+
+def rendered_name(path: Path) -> Optional[str]:
+    """
+    Library skill name from the frontmatter ASK renders (name and version).
+
+    None for files ASK did not render this way, such as commands or rules
+    users wrote themselves.
+    """
+    try:
+        with open(path, encoding="utf-8", errors="replace") as f:
+            head = f.read(4096)
+    except OSError:
+        return None
+    if not head.startswith("---\n"):
+        return None
+    end = head.find("\n---", 3)
+    frontmatter = head[4:end] if end != -1 else ""
+    if not re.search(r"^version:", frontmatter, re.MULTILINE):
+        return None
+    match = NAME_PATTERN.search(frontmatter)
+    return match.group(1) if match else None
+
+
+def get_backup_dir(adapter) -> Path:
+    """Where 'ask update' keeps backup generations for this install directory."""
+    return adapter.target_dir / get_layout(adapter)["base"] / BACKUP_DIR
+
+
+def scan_install_dir(adapter) -> Dict:
+    """
+    Walk an adapter's target directory once.
+
+    Returns:
+        {
+          "root": target directory,
+          "skills": {name: {"main": relpath or None, "dir": relpath or None,
+                            "files": {relpath: size}, "bytes": int}},
+          "backups": {relpath: size},
+          "backup_store": {relpath: size},
+          "other": {relpath: size},
+        }
+        "main" is None for leftovers whose main file is gone; "dir" is the
+        skill's own directory (resources/sections), when it has one.
+    """
+    root = adapter.target_dir
+    layout = get_layout(adapter)
+    main_prefix, main_suffix = layout["main_prefix"], layout["main_suffix"]
+    dir_prefix, base_rel = layout["dir_prefix"], layout["base"]
+    store_rel = base_rel + BACKUP_DIR + "/"
+
+    result = {"root": root, "skills": {}, "backups": {}, "backup_store": {}, "other": {}}
+
+    def skill_entry(name: str) -> Dict:
+        return result["skills"].setdefault(name, {"main": None, "dir": None, "files": {}, "bytes": 0})
+
+    def classify(rel: str) -> Optional[Tuple[str, bool]]:
+        """(skill name, is_main) for a file path, or None."""
+        if rel.startswith(main_prefix) and rel.endswith(main_suffix):
+            name = rel[len(main_prefix):len(rel) - len(main_suffix)]
+            if name and "/" not in name and not name.startswith("."):
+                return name, True
+        if rel.startswith(dir_prefix):
+            name = rel[len(dir_prefix):].split("/", 1)[0]
+            if name and not name.startswith(".") and "/" in rel[len(dir_prefix):]:
+                return name, False
+        return None
+
+    if not (root / base_rel).is_dir():
+        return result
+
+    stack = [(str(root / base_rel), base_rel)]
+    while stack:
+        path, rel_dir = stack.pop()
+        try:
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    rel = f"{rel_dir}{entry.name}"
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            # Register skill directories even when they are empty
+                            if rel_dir == dir_prefix and not entry.name.startswith("."):
+                                skill_entry(entry.name)["dir"] = rel
+                            stack.append((entry.path, rel + "/"))
+                            continue
+                        size = entry.stat(follow_symlinks=False).st_size
+                    except OSError:
+                        continue
+
+                    if rel.startswith(store_rel):
+                        result["backup_store"][rel] = size
+                        continue
+                    if rel.endswith(BACKUP_SUFFIX):
+                        result["backups"][rel] = size
+                        continue
+                    owner = classify(rel)
+                    if owner is None:
+                        result["other"][rel] = size
+                        continue
+                    name, is_main = owner
+                    entry_info = skill_entry(name)
+                    if is_main:
+                        entry_info["main"] = rel
+                    entry_info["files"][rel] = size
+                    entry_info["bytes"] += size
+        except OSError:
+            continue
+
+    return result
@@ -0,0 +1,125 @@
+"""Project lockfile (ask.lock) - which skills a project installed, and what they produced.
+
+copy, sync and update record every local (project) install; remove forgets it.
+Each entry holds the skill version, a hash of its source files and the hash
+of every file written for each agent, relative to the agent's target
+directory:
+
+    {
+      "version": 1,
+      "skills": {
+        "<skill>": {
+          "version": "1.0.0",
+          "source_hash": "...",
+          "installs": {
+            "<agent>:<install name>": {
+              "agent": "claude", "name": "<install name>",
+              "compact": false, "split": false,
+              "files": {"<relpath>": "<sha256>"}
+            }
+          }
+        }
+      }
+    }
+
+`ask install --frozen` verifies those hashes and rewrites only what differs.
+"""
+
+import json
+from pathlib import Path
+from typing import Dict, Iterator, Optional, Tuple
+
+from ask.utils.artifacts import skill_source_hash
+from ask.utils.cache import hash_files
+
+
+LOCKFILE_NAME = "ask.lock"
+LOCKFILE_VERSION = 1
+
+
+def get_lockfile_path() -> Path:
+    """The lockfile for the current project."""
+    return Path.cwd() / LOCKFILE_NAME
+
+
+class Lockfile:
+    """In-memory ask.lock with load/save."""
+
+    def __init__(self, path: Path = None, skills: Optional[Dict] = None):
+        self.path = path or get_lockfile_path()
+        self.skills = skills or {}
+
+    @classmethod
+    def load(cls, path: Path = None) -> "Lockfile":
+        """Load a lockfile (empty if missing or unreadable)."""
+        path = path or get_lockfile_path()
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return cls(path)
+        if data.get("version") != LOCKFILE_VERSION:
+            return cls(path)
+        return cls(path, data.get("skills"))
+
+    def save(self) -> None:
+        """Write the lockfile (deterministic, diff-friendly)."""
+        with open(self.path, "w", encoding="utf-8") as f:
+            json.dump({"version": LOCKFILE_VERSION, "skills": self.skills}, f, indent=2, sort_keys=True)
+            f.write("\n")
+
+    def record(self, skill: Dict, adapter, result: Dict, name: str = None) -> None:
+        """Record a successful copy_skill() result."""
+        name = name or skill["name"]
+        target_dir = adapter.target_dir
+        paths = [Path(path) for path in result.get("files", [])]
+        files = {
+            path.relative_to(target_dir).as_posix(): digest
+            for path, digest in hash_files(paths).items()
+            if digest is not None
+        }
+
+        entry = self.skills.setdefault(skill["name"], {"installs": {}})
+        entry["version"] = str(skill.get("version", "0.0.0"))
+        entry["source_hash"] = skill_source_hash(skill)
+        entry["installs"][f"{adapter.agent_name}:{name}"] = {
+            "agent": adapter.agent_name,
+            "name": name,
+            "compact": adapter.compact,
+            "split": adapter.split,
+            "files": files,
+        }
+
+    def forget(self, agent: str, name: str) -> bool:
+        """Drop an install (and its skill once nothing is installed). Returns True if found."""
+        key = f"{agent}:{name}"
+        for skill_name, entry in list(self.skills.items()):
+            if entry["installs"].pop(key, None) is not None:
+                if not entry["installs"]:
+                    del self.skills[skill_name]
+                return True
+        return False
+
+    def install_state(self, agent: str, name: str) -> Optional[Dict]:
+        """Everything recorded for one install (used to undo an update), or None."""
+        key = f"{agent}:{name}"
+        for skill_name, entry in self.skills.items():
+            if key in entry["installs"]:
+                return {"skill": skill_name, "version": entry["version"], "source_hash": entry["source_hash"],
+                        "install": entry["installs"][key]}
+        return None
+
+    def restore_install(self, state: Dict) -> None:
+        """Put back an install_state() snapshot."""
+        install = state["install"]
+        self.forget(install["agent"], install["name"])
+        entry = self.skills.setdefault(state["skill"], {"installs": {}})
+        entry["version"] = state["version"]
+        entry["source_hash"] = state["source_hash"]
+        entry["installs"][f"{install['agent']}:{install['name']}"] = install
+
+    def installs(self) -> Iterator[Tuple[str, Dict, Dict]]:
+        """Yield (skill name, skill entry, install entry) for every recorded install."""
+        for skill_name, entry in sorted(self.skills.items()):
+            for _, install in sorted(entry["installs"].items()):
+                yield skill_name, entry, install
@@ -0,0 +1,124 @@
+"""MinHash / LSH utilities for near-duplicate skill detection.
+
+Each document is reduced to a set of word shingles, summarised by a MinHash
+signature, and bucketed with LSH banding so only documents sharing at least
+one band are ever compared. That keeps detection sub-quadratic in practice.
+"""
+
+import hashlib
+import random
+import re
+from collections import defaultdict
+from typing import Dict, Iterable, List, Set, Tuple
+
+
+SHINGLE_SIZE = 5
+NUM_PERM = 128
+BANDS = 32
+ROWS = NUM_PERM // BANDS
+
+# Mersenne prime used for the universal hash family (a * x + b) mod p
+_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+
+_rng = random.Random(0x5EED)
+_PERMUTATIONS = [
+    (_rng.randrange(1, _PRIME), _rng.randrange(0, _PRIME))
+    for _ in range(NUM_PERM)
+]
+
+_WORD_PATTERN = re.compile(r"\w+")
+
+
+def _hash32(text: str) -> int:
+    return int.from_bytes(hashlib.blake2b(text.encode("utf-8"), digest_size=4).digest(), "big")
+
+
+def strip_frontmatter(text: str) -> str:
+    """Remove a leading YAML frontmatter block from markdown text."""
+    if text.startswith("---"):
+        end = text.find("\n---", 3)
+        if end != -1:
+            newline = text.find("\n", end + 4)
+            return text[newline + 1:] if newline != -1 else ""
+    return text
+
+
+def shingles(text: str, size: int = SHINGLE_SIZE) -> Set[int]:
+    """Hash the word k-grams of a text into a set of 32-bit integers."""
+    words = _WORD_PATTERN.findall(text.lower())
+    if len(words) < size:
+        return {_hash32(" ".join(words))} if words else set()
+    return {_hash32(" ".join(words[i:i + size])) for i in range(len(words) - size + 1)}
+
+
+def signature(shingle_set: Iterable[int]) -> List[int]:
+    """Compute the MinHash signature of a shingle set."""
+    shingle_list = list(shingle_set)
+    if not shingle_list:
+        return [_MAX_HASH] * NUM_PERM
+    return [
+        min(((a * x + b) % _PRIME) & _MAX_HASH for x in shingle_list)
+        for a, b in _PERMUTATIONS
+    ]
+
+
+def similarity(sig_a: List[int], sig_b: List[int]) -> float:
+    """Estimate the Jaccard similarity of two documents from their signatures."""
+    return sum(1 for x, y in zip(sig_a, sig_b) if x == y) / len(sig_a)
+
+
+def candidate_pairs(signatures: Dict[str, List[int]]) -> Set[Tuple[str, str]]:
+    """Find candidate near-duplicate pairs by LSH banding."""
+    buckets = defaultdict(list)
+    for key, sig in signatures.items():
+        for band in range(BANDS):
+            start = band * ROWS
+            buckets[(band, tuple(sig[start:start + ROWS]))].append(key)
+
+    pairs = set()
+    for members in buckets.values():
+        if len(members) < 2:
+            continue
+        members = sorted(members)
+        for i, first in enumerate(members):
+            for second in members[i + 1:]:
+                pairs.add((first, second))
+    return pairs
+
+
+def cluster_pairs(pairs: Iterable[Tuple[str, str]]) -> List[List[str]]:
+    """Group similar pairs into connected clusters (union-find)."""
+    parent = {}
+
+    def find(key):
+        parent.setdefault(key, key)
+        while parent[key] != key:
+            parent[key] = parent[parent[key]]
+            key = parent[key]
+        return key
+
+    for first, second in pairs:
+        root_a, root_b = find(first), find(second)
+        if root_a != root_b:
+            parent[root_b] = root_a
+
+    groups = defaultdict(list)
+    for key in parent:
+        groups[find(key)].append(key)
+    return sorted((sorted(g) for g in groups.values()), key=lambda g: (-len(g), g))
+
+
+def paragraphs(text: str, min_length: int = 80) -> Dict[str, str]:
+    """
+    Split markdown into normalized paragraphs.
+
+    Returns:
+        Dict of paragraph hash -> paragraph text, for paragraphs of at least min_length chars.
+    """
+    result = {}
+    for block in re.split(r"\n\s*\n", text):
+        normalized = " ".join(block.split())
+        if len(normalized) >= min_length:
+            result[hashlib.sha1(normalized.lower().encode("utf-8")).hexdigest()] = normalized
+    return result
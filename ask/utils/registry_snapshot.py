@@ -0,0 +1,82 @@
+"""Registry snapshot - precomputed skill metadata shipped inside the wheel.
+
+An installed package has a fixed skill library, so walking skills/ and parsing
+every skill.yaml on each invocation is wasted work (and slow on zipped or
+network installs). The wheel build hook (hatch_build.py) writes the loaded
+registry to skills/_registry.json; get_all_skills() reads that single file in
+package mode and falls back to live scanning in a source checkout.
+
+Paths are stored relative to the skills directory so the snapshot stays valid
+wherever the package is installed.
+"""
+
+import copy
+import json
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from ask.utils.filesystem import get_skills_dir
+
+
+SNAPSHOT_NAME = "_registry.json"
+SNAPSHOT_VERSION = 1
+
+# Skill keys holding absolute paths into the skills directory
+_PATH_KEYS = ("_path", "_instruction_file", "_reference", "_examples", "_scripts")
+
+_loaded: Dict[str, Optional[List[Dict]]] = {}
+
+
+def build_snapshot(skills: List[Dict], skills_dir: Path) -> Dict:
+    """Serialize loaded skills with paths made relative to skills_dir."""
+    entries = []
+    for skill in skills:
+        entry = dict(skill)
+        for key in _PATH_KEYS:
+            if key in entry:
+                entry[key] = Path(entry[key]).relative_to(skills_dir).as_posix()
+        entries.append(entry)
+    return {"version": SNAPSHOT_VERSION, "skills": entries}
+
+
+def write_snapshot(skills: List[Dict], skills_dir: Path, path: Path = None) -> Path:
+    """Write a registry snapshot (defaults to skills_dir/_registry.json)."""
+    path = path or skills_dir / SNAPSHOT_NAME
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(build_snapshot(skills, skills_dir), f, separators=(",", ":"), sort_keys=True, default=str)
+    return path
+
+
+def load_snapshot(skills_dir: Path = None) -> Optional[List[Dict]]:
+    """
+    Load skills from the snapshot in skills_dir.
+
+    Returns:
+        List of skill dictionaries (same shape as live scanning), or None when
+        there is no usable snapshot.
+    """
+    skills_dir = skills_dir or get_skills_dir()
+    key = str(skills_dir)
+    if key not in _loaded:
+        _loaded[key] = _read(skills_dir)
+    cached = _loaded[key]
+    # Callers may mutate skill dicts and their lists (tags, agents, ...); hand out copies
+    return None if cached is None else copy.deepcopy(cached)
+
+
+def _read(skills_dir: Path) -> Optional[List[Dict]]:
+    try:
+        with open(skills_dir / SNAPSHOT_NAME, "r", encoding="utf-8") as f:
+            snapshot = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if snapshot.get("version") != SNAPSHOT_VERSION:
+        return None
+
+    skills = []
+    for entry in snapshot.get("skills", []):
+        for key in _PATH_KEYS:
+            if key in entry:
+                entry[key] = str(skills_dir / entry[key])
+        skills.append(entry)
+    return skills
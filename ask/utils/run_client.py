@@ -0,0 +1,123 @@
+"""Thin client for the script pool - `ask-run SKILL SCRIPT [ARGS]...`.
+
+`ask run` pays for importing click, rich and the skill registry before it
+ever reaches the pool, which can cost more than the imports the pool saves.
+This entry point imports only os, sys, json, socket and binascii, hands the
+script to a running pool (see ask.utils.runner) and exits with its status.
+Only when no pool for this library answers does it load the full CLI, as
+`ask run --no-pool`.
+
+Also runnable as `python -m ask.utils.run_client`. ask.utils.runner and
+ask.utils.daemon build on the helpers here, so every client names and
+checks sockets the same way.
+"""
+
+import binascii
+import json
+import os
+import socket
+import sys
+
+
+SOCKET_PREFIX = "ask-run"
+
+# Clients give up quickly so a wedged pool never makes a run slower
+CONNECT_TIMEOUT = 0.2
+
+
+def get_cache_dir() -> str:
+    """Same as ask.utils.cache.get_cache_dir, without its imports."""
+    override = os.environ.get("ASK_CACHE_DIR")
+    if override:
+        return os.path.expanduser(override)
+    xdg = os.environ.get("XDG_CACHE_HOME")
+    return os.path.join(os.path.expanduser(xdg) if xdg else os.path.join(os.path.expanduser("~"), ".cache"), "ask")
+
+
+def default_skills_dir() -> str:
+    """Resolved skills directory, found like ask.utils.filesystem.get_skills_dir()."""
+    here = os.path.dirname(os.path.realpath(__file__))
+    current = here
+    while True:
+        if os.path.exists(os.path.join(current, "pyproject.toml")):
+            return os.path.join(current, "skills")
+        parent = os.path.dirname(current)
+        if parent == current:
+            break
+        current = parent
+    return os.path.join(os.path.dirname(os.path.dirname(here)), "skills")
+
+
+def library_key(skills_dir) -> str:
+    """Short, stable name for a skill library (its resolved path), used in socket names."""
+    path = os.path.realpath(os.fspath(skills_dir))
+    return f"{binascii.crc32(path.encode('utf-8')):08x}"
+
+
+def get_socket_path(skills_dir=None) -> str:
+    """Pool socket for a library (honours ASK_RUN_SOCKET, defaults to the cache directory)."""
+    override = os.environ.get("ASK_RUN_SOCKET")
+    if override:
+        return os.path.expanduser(override)
+    return os.path.join(get_cache_dir(), f"{SOCKET_PREFIX}-{library_key(skills_dir or default_skills_dir())}.sock")
+
+
+def exchange(socket_path, message: dict, fds=()):
+    """
+    Send one request (plus file descriptors) and read the response.
+
+    Returns:
+        The response dict, or None when nothing accepts the connection. A
+        connection that breaks after the request was sent is reported as an
+        error response: the script may have run, so it must not be retried.
+    """
+    if os.environ.get("ASK_NO_DAEMON") or not hasattr(socket, "send_fds"):
+        return None
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.settimeout(CONNECT_TIMEOUT)
+        try:
+            sock.connect(os.fspath(socket_path))
+        except OSError:
+            return None
+        # Scripts run as long as they need to
+        sock.settimeout(None)
+        try:
+            socket.send_fds(sock, [json.dumps(message).encode("utf-8") + b"\n"], list(fds))
+            with sock.makefile("rb") as stream:
+                return json.loads(stream.readline())
+        except (OSError, ValueError):
+            return {"ok": False, "error": "the worker exited without reporting a result"}
+    finally:
+        sock.close()
+
+
+def run_message(skill: str, script: str, args, skills_dir) -> dict:
+    return {"op": "run", "skills_dir": os.path.realpath(os.fspath(skills_dir)), "skill": skill, "script": script,
+            "args": list(args), "cwd": os.getcwd(), "env": dict(os.environ)}
+
+
+def main(argv=None) -> None:
+    argv = sys.argv[1:] if argv is None else list(argv)
+    if len(argv) >= 2 and not argv[0].startswith("-"):
+        skills_dir = default_skills_dir()
+        try:
+            response = exchange(get_socket_path(skills_dir), run_message(argv[0], argv[1], argv[2:], skills_dir),
+                                fds=[0, 1, 2])
+        except KeyboardInterrupt:
+            sys.exit(130)
+        if response is not None and not response.get("wrong_library"):
+            if not response.get("ok"):
+                print(f"❌ {response.get('error', 'unknown pool error')}", file=sys.stderr)
+                sys.exit(1)
+            sys.exit(int(response["result"]["exit"]))
+        argv = ["--no-pool", *argv]
+
+    # No pool (or options for ask itself): the full command
+    from ask.cli import main as cli_main
+
+    cli_main(["run", *argv], prog_name="ask")
+
+
+if __name__ == "__main__":
+    main()
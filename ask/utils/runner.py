@@ -0,0 +1,420 @@
+"""Script runner - a pre-forked worker pool for skill helper scripts.
+
+`ask run --serve` imports the dependencies that skills declare in
+skill.yaml (`dependencies:`) once, then keeps a few forked workers waiting
+on a Unix socket. `ask run <skill> <script> [args]` hands one of them the
+script's argv, cwd and environment plus its own stdin/stdout/stderr (as
+file descriptors), so the script reads and writes the caller's terminal or
+pipe directly without paying for interpreter start-up and imports again.
+A worker runs a single script and exits; the pool forks a replacement
+straight away, so runs never share state.
+
+Requests are one JSON object per line, like the skill daemon's:
+
+    {"op": "run", "skill": "ask-pdf-processing", "script": "extract_text.py",
+     "args": ["doc.pdf"], "cwd": "/work", "env": {...}}
+    {"ok": true, "result": {"exit": 0}}
+
+Ops: run, status, shutdown. run_script() returns None when no pool is
+reachable (or ASK_NO_DAEMON is set) and the caller runs the script in a
+fresh interpreter instead.
+
+Like the skill daemon, a pool serves one skill library: the socket is named
+after the library (see ask.utils.run_client.library_key) and requests for
+another library are answered with "wrong_library". The `ask-run` entry point
+(ask.utils.run_client) talks to the pool without importing the CLI.
+"""
+
+import importlib
+import json
+import os
+import re
+import runpy
+import selectors
+import signal
+import socket
+import stat
+import sys
+import threading
+import time
+import traceback
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+from ask.utils import run_client
+from ask.utils.daemon import DaemonError, current_library
+
+
+DEFAULT_WORKERS = 2
+
+# Large enough for any request's first chunk; the rest is read up to the newline
+RECV_SIZE = 65536
+
+
+def get_socket_path(skills_dir: Path = None) -> Path:
+    """Socket path for a library's pool (honours ASK_RUN_SOCKET, defaults to the cache directory)."""
+    return Path(run_client.get_socket_path(skills_dir or current_library()))
+
+
+def is_supported() -> bool:
+    return hasattr(socket, "AF_UNIX") and hasattr(socket, "send_fds") and hasattr(os, "fork")
+
+
+def resolve_script(skill: Dict, script: str) -> Optional[Path]:
+    """Find a script in the skill's scripts/ directory ('extract_text' or 'extract_text.py')."""
+    scripts_dir = skill.get("_scripts")
+    if not scripts_dir:
+        return None
+    root = Path(scripts_dir).resolve()
+    for candidate in (script, f"{script}.py"):
+        path = (root / candidate).resolve()
+        # Never run anything outside the skill's scripts/ directory
+        if path.is_file() and root in path.parents:
+            return path
+    return None
+
+
+def list_scripts(skill: Dict) -> List[str]:
+    scripts_dir = skill.get("_scripts")
+    if not scripts_dir:
+        return []
+    return sorted(path.name for path in Path(scripts_dir).glob("*.py"))
+
+
+def _canonical(name: str) -> str:
+    return re.sub(r"[-_.]+", "-", name).lower()
+
+
+def module_names(dependencies: Iterable[str]) -> List[str]:
+    """
+    Map skill.yaml dependencies (distribution names) to importable modules.
+
+    "pyyaml>=6" becomes "yaml"; names that are not installed fall back to the
+    distribution name, so the import fails (and is reported) later.
+    """
+    from importlib.metadata import packages_distributions
+
+    provided: Dict[str, List[str]] = {}
+    for module, dists in packages_distributions().items():
+        if module.startswith("_"):
+            continue
+        for dist in dists:
+            provided.setdefault(_canonical(dist), []).append(module)
+
+    names: List[str] = []
+    for dependency in dependencies:
+        name = re.split(r"[\s<>=!~;\[]", str(dependency).strip(), maxsplit=1)[0]
+        if not name:
+            continue
+        for module in sorted(provided.get(_canonical(name), [name.replace("-", "_")])):
+            if module not in names:
+                names.append(module)
+    return names
+
+
+def _receive(conn: socket.socket):
+    """Read one request line plus any file descriptors sent along with it."""
+    data, fds, _, _ = socket.recv_fds(conn, RECV_SIZE, 3)
+    while data and not data.endswith(b"\n"):
+        chunk = conn.recv(RECV_SIZE)
+        if not chunk:
+            break
+        data += chunk
+    return json.loads(data), fds
+
+
+def request(op: str, socket_path: Path = None, fds: List[int] = None, **params) -> Optional[Any]:
+    """
+    Send a request to a running pool.
+
+    Returns:
+        The pool's result, or None when no pool for this library is reachable.
+
+    Raises:
+        DaemonError: the pool reported an error, or the connection broke after
+        the request was sent (the script may have run, so it is not retried).
+    """
+    if os.environ.get("ASK_NO_DAEMON") or not is_supported():
+        return None
+    library = current_library()
+    path = socket_path or get_socket_path(library)
+    if not path.exists():
+        return None
+
+    response = run_client.exchange(path, {"op": op, "skills_dir": str(library), **params}, fds or [])
+    if response is None or response.get("wrong_library"):
+        return None
+    if not response.get("ok"):
+        raise DaemonError(response.get("error", "unknown pool error"))
+    return response.get("result")
+
+
+def run_script(skill: str, script: str, args: Iterable[str], socket_path: Path = None) -> Optional[int]:
+    """
+    Run a skill script in a pool worker, on this process's stdin/stdout/stderr.
+
+    Returns:
+        The script's exit status, or None when no pool is reachable.
+    """
+    # Anything already buffered must reach the terminal before the script's output
+    sys.stdout.flush()
+    sys.stderr.flush()
+    result = request(
+        "run", socket_path, fds=[0, 1, 2], skill=skill, script=script, args=list(args),
+        cwd=os.getcwd(), env=dict(os.environ),
+    )
+    return None if result is None else int(result["exit"])
+
+
+class WorkerPool:
+    """
+    Pre-forked pool: the parent preloads modules, then keeps `workers` idle
+    children blocked in accept() on the shared socket, forking a replacement
+    whenever one of them takes a request. The parent never handles requests
+    itself and runs no threads, so forking from it is safe.
+    """
+
+    def __init__(self, socket_path: Path, workers: int = DEFAULT_WORKERS, modules: Iterable[str] = ()):
+        from ask.utils.skill_registry import SkillRegistry
+        from ask.utils.watcher import PollingWatcher
+
+        self.socket_path = Path(socket_path)
+        self.workers = max(1, workers)
+        self.modules = list(modules)
+        self.loaded: List[str] = []
+        self.failed: Dict[str, str] = {}
+        self.registry = SkillRegistry()
+        self.library = str(Path(self.registry.skills_dir).resolve())
+        self.watcher = PollingWatcher(self.registry.skills_dir)
+        self.started = time.time()
+        self.idle = set()
+        self.stopping = False
+        self.listener = None
+
+    def preload(self) -> None:
+        """Import the modules once, so every worker inherits them already loaded."""
+        for module in self.modules:
+            try:
+                importlib.import_module(module)
+                self.loaded.append(module)
+            except Exception as e:
+                self.failed[module] = f"{type(e).__name__}: {e}"
+
+    def serve(self) -> None:
+        """Serve until SIGTERM, SIGINT or a shutdown request."""
+        self.socket_path.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            if stat.S_ISSOCK(os.lstat(self.socket_path).st_mode):
+                # Leftover from a pool that did not shut down cleanly
+                self.socket_path.unlink()
+        except FileNotFoundError:
+            pass
+        self.listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        # Created owner-only; there is no window where others can connect
+        previous = os.umask(0o177)
+        try:
+            self.listener.bind(str(self.socket_path))
+        finally:
+            os.umask(previous)
+        self.listener.listen(64)
+
+        # Workers report "<pid>\n" on busy_w when they take a request; signals
+        # (SIGCHLD, SIGTERM) wake the selector through wake_r
+        busy_r, self._busy_w = os.pipe()
+        wake_r, wake_w = os.pipe()
+        os.set_blocking(wake_w, False)
+        handlers = {sig: signal.getsignal(sig) for sig in (signal.SIGCHLD, signal.SIGTERM, signal.SIGINT)}
+        previous_wakeup = signal.set_wakeup_fd(wake_w)
+        signal.signal(signal.SIGCHLD, lambda *_: None)
+        signal.signal(signal.SIGTERM, self._stop)
+        signal.signal(signal.SIGINT, self._stop)
+
+        try:
+            for _ in range(self.workers):
+                self._spawn()
+            with selectors.DefaultSelector() as selector:
+                selector.register(busy_r, selectors.EVENT_READ)
+                selector.register(wake_r, selectors.EVENT_READ)
+                while not self.stopping:
+                    for key, _ in selector.select():
+                        data = os.read(key.fd, 4096)
+                        if key.fd == busy_r:
+                            for pid in data.split():
+                                if int(pid) in self.idle:
+                                    self.idle.discard(int(pid))
+                                    self._replace()
+                    self._reap()
+        finally:
+            for pid in self.idle:
+                try:
+                    os.kill(pid, signal.SIGTERM)
+                except OSError:
+                    pass
+            self.listener.close()
+            try:
+                self.socket_path.unlink()
+            except OSError:
+                pass
+            signal.set_wakeup_fd(previous_wakeup)
+            for sig, handler in handlers.items():
+                signal.signal(sig, handler)
+            for fd in (busy_r, self._busy_w, wake_r, wake_w):
+                os.close(fd)
+            self._reap()
+
+    def _stop(self, signum, frame) -> None:
+        self.stopping = True
+
+    def _reap(self) -> None:
+        """Collect finished workers; replace idle ones that died without taking a request."""
+        while True:
+            try:
+                pid, _ = os.waitpid(-1, os.WNOHANG)
+            except ChildProcessError:
+                return
+            if pid == 0:
+                return
+            if pid in self.idle:
+                self.idle.discard(pid)
+                self._replace()
+
+    def _replace(self) -> None:
+        if self.stopping:
+            return
+        # Pick up skill edits before forking, so new workers resolve them
+        changed = self.watcher.poll()
+        if changed:
+            self.registry.refresh(changed)
+        self._spawn()
+
+    def _spawn(self) -> None:
+        # Hold signals until the child has dropped the parent's handlers, or a
+        # SIGTERM sent right after fork() would only set the child's `stopping`
+        signals = {signal.SIGCHLD, signal.SIGTERM, signal.SIGINT}
+        signal.pthread_sigmask(signal.SIG_BLOCK, signals)
+        try:
+            pid = os.fork()
+            if pid == 0:
+                signal.set_wakeup_fd(-1)
+                signal.signal(signal.SIGCHLD, signal.SIG_DFL)
+                signal.signal(signal.SIGTERM, signal.SIG_DFL)
+                # Ctrl+C in the pool's terminal is for the parent to handle
+                signal.signal(signal.SIGINT, signal.SIG_IGN)
+                signal.pthread_sigmask(signal.SIG_UNBLOCK, signals)
+                code = 1
+                try:
+                    code = self._worker()
+                except BaseException:
+                    traceback.print_exc()
+                finally:
+                    os._exit(code)
+        finally:
+            signal.pthread_sigmask(signal.SIG_UNBLOCK, signals)
+        self.idle.add(pid)
+
+    def _worker(self) -> int:
+        """Body of a forked worker: take one request, answer it, exit."""
+        conn, _ = self.listener.accept()
+        os.write(self._busy_w, f"{os.getpid()}\n".encode())
+        self.listener.close()
+
+        with conn:
+            fds = []
+            try:
+                message, fds = _receive(conn)
+                op = message.get("op") if isinstance(message, dict) else None
+                library = message.get("skills_dir") if isinstance(message, dict) else None
+                if library and library != self.library:
+                    response = {"ok": False, "wrong_library": True, "error": f"This pool serves {self.library}"}
+                elif op == "run":
+                    response = {"ok": True, "result": {"exit": self._run(conn, message, fds)}}
+                elif op == "status":
+                    response = {"ok": True, "result": self._status()}
+                elif op == "shutdown":
+                    os.kill(os.getppid(), signal.SIGTERM)
+                    response = {"ok": True, "result": "bye"}
+                else:
+                    response = {"ok": False, "error": f"Unknown op: {op}"}
+            except Exception as e:
+                response = {"ok": False, "error": str(e)}
+            finally:
+                for fd in fds:
+                    try:
+                        os.close(fd)
+                    except OSError:
+                        pass
+            try:
+                conn.sendall(json.dumps(response).encode("utf-8") + b"\n")
+            except OSError:
+                pass
+        return 0
+
+    def _status(self) -> Dict:
+        return {
+            "pid": os.getppid(),
+            "uptime": round(time.time() - self.started, 1),
+            "workers": self.workers,
+            "modules": self.loaded,
+            "failed": self.failed,
+            "skills": len(self.registry.all()),
+            "skills_dir": self.library,
+        }
+
+    def _run(self, conn: socket.socket, message: Dict, fds: List[int]) -> int:
+        """Run the requested script as __main__ on the client's stdio; return its exit status."""
+        skill = self.registry.get(message.get("skill"))
+        if not skill:
+            raise ValueError(f"Skill not found: {message.get('skill')}")
+        script = resolve_script(skill, str(message.get("script")))
+        if script is None:
+            raise ValueError(f"Script not found in {skill['name']}: {message.get('script')}")
+        if len(fds) != 3:
+            raise ValueError("run needs the client's stdin, stdout and stderr")
+
+        for target, fd in enumerate(fds):
+            os.dup2(fd, target)
+        sys.stdin = open(0, "r", encoding="utf-8", closefd=False)
+        sys.stdout = open(1, "w", encoding="utf-8", buffering=1 if os.isatty(1) else -1, closefd=False)
+        sys.stderr = open(2, "w", encoding="utf-8", errors="backslashreplace", buffering=1, closefd=False)
+        os.chdir(message.get("cwd") or "/")
+        os.environ.clear()
+        os.environ.update(message.get("env") or {})
+        sys.argv = [str(script), *message.get("args", [])]
+        sys.path.insert(0, str(script.parent))
+
+        # If the client goes away (e.g. Ctrl+C), interrupt the script
+        done = threading.Event()
+
+        def watch_client():
+            try:
+                conn.recv(1)
+            except OSError:
+                pass
+            if not done.is_set():
+                os.kill(os.getpid(), signal.SIGINT)
+
+        signal.signal(signal.SIGINT, signal.default_int_handler)
+        threading.Thread(target=watch_client, daemon=True).start()
+
+        try:
+            runpy.run_path(str(script), run_name="__main__")
+            code = 0
+        except SystemExit as e:
+            if e.code is None or isinstance(e.code, int):
+                code = e.code or 0
+            else:
+                print(e.code, file=sys.stderr)
+                code = 1
+        except KeyboardInterrupt:
+            code = 130
+        except BaseException:
+            traceback.print_exc()
+            code = 1
+        finally:
+            done.set()
+            for stream in (sys.stdout, sys.stderr):
+                try:
+                    stream.flush()
+                except (OSError, ValueError):
+                    pass
+        return code
@@ -0,0 +1,204 @@
+"""Full-text search index - BM25 ranking over skill metadata and instructions.
+
+The index is an inverted index (term -> {skill_dir: weighted term frequency})
+persisted in the ASK cache directory. Each refresh only stats skill files and
+re-tokenizes the skills whose skill.yaml or instruction file changed.
+"""
+
+import math
+import re
+from collections import Counter
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from ask.utils.cache import load_json_cache, save_json_cache, stat_signature
+from ask.utils.skill_registry import iter_skill_dirs, load_skill
+
+
+INDEX_CACHE_NAME = "search-index"
+
+# BM25 parameters
+K1 = 1.2
+B = 0.75
+
+# Field weights: a term in the name counts as much as several body mentions
+FIELD_WEIGHTS = {
+    "name": 5,
+    "tags": 3,
+    "description": 2,
+    "body": 1,
+}
+
+STOPWORDS = frozenset("""
+a an and are as at be by for from has have how if in into is it its of on or
+that the this to was were will with you your
+""".split())
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+
+def tokenize(text: str) -> List[str]:
+    """Split text into lowercase alphanumeric terms, dropping stopwords."""
+    return [
+        t for t in TOKEN_PATTERN.findall(text.lower())
+        if len(t) > 1 and t not in STOPWORDS
+    ]
+
+
+def _skill_signature(skill_dir: Path) -> list:
+    """Stat signature of the files that feed a skill's index entry."""
+    return [
+        stat_signature(skill_dir / "skill.yaml"),
+        stat_signature(skill_dir / "SKILL.md"),
+        stat_signature(skill_dir / "README.md"),
+    ]
+
+
+def _weighted_terms(skill: Dict) -> Counter:
+    """Compute field-weighted term frequencies for a skill."""
+    terms = Counter()
+
+    fields = {
+        "name": skill.get("name", ""),
+        "tags": " ".join(str(t) for t in skill.get("tags", []) or []),
+        "description": skill.get("description", "") or "",
+        "body": "",
+    }
+
+    instruction_file = skill.get("_instruction_file")
+    if instruction_file:
+        try:
+            fields["body"] = Path(instruction_file).read_text(encoding="utf-8")
+        except (OSError, UnicodeDecodeError):
+            pass
+
+    for field, text in fields.items():
+        weight = FIELD_WEIGHTS[field]
+        for term in tokenize(str(text)):
+            terms[term] += weight
+
+    return terms
+
+
+class SearchIndex:
+    """Persistent inverted index over the skill library."""
+
+    def __init__(self, docs: Optional[Dict] = None, postings: Optional[Dict] = None):
+        # docs: skill_dir -> {name, category, description, sig, len, terms}
+        self.docs = docs or {}
+        # postings: term -> {skill_dir: weighted tf}
+        self.postings = postings or {}
+
+    @classmethod
+    def load(cls) -> "SearchIndex":
+        """Load the index from the cache (empty index if missing)."""
+        data = load_json_cache(INDEX_CACHE_NAME)
+        if not data:
+            return cls()
+        return cls(data.get("docs"), data.get("postings"))
+
+    def save(self) -> None:
+        """Persist the index to the cache."""
+        save_json_cache(INDEX_CACHE_NAME, {"docs": self.docs, "postings": self.postings})
+
+    def _remove(self, key: str) -> None:
+        doc = self.docs.pop(key, None)
+        if not doc:
+            return
+        for term in doc["terms"]:
+            posting = self.postings.get(term)
+            if posting is None:
+                continue
+            posting.pop(key, None)
+            if not posting:
+                del self.postings[term]
+
+    def _add(self, key: str, skill: Dict, sig: list) -> None:
+        terms = _weighted_terms(skill)
+        for term, tf in terms.items():
+            self.postings.setdefault(term, {})[key] = tf
+        self.docs[key] = {
+            "name": skill.get("name", ""),
+            "category": skill.get("category", ""),
+            "description": skill.get("description", "") or "",
+            "sig": sig,
+            "len": sum(terms.values()),
+            "terms": list(terms),
+        }
+
+    def refresh(self) -> int:
+        """
+        Bring the index up to date with the skills directory.
+
+        Only skills whose files changed since the last refresh are re-read.
+
+        Returns:
+            Number of index entries added, updated or removed.
+        """
+        changes = 0
+        seen = set()
+
+        for skill_dir in iter_skill_dirs():
+            key = str(skill_dir)
+            seen.add(key)
+            sig = _skill_signature(skill_dir)
+
+            doc = self.docs.get(key)
+            if doc and doc["sig"] == sig:
+                continue
+
+            self._remove(key)
+            skill = load_skill(skill_dir)
+            if skill:
+                self._add(key, skill, sig)
+            changes += 1
+
+        for key in [k for k in self.docs if k not in seen]:
+            self._remove(key)
+            changes += 1
+
+        return changes
+
+    def search(self, query: str, limit: int = 10) -> List[Dict]:
+        """
+        Rank skills against a query with BM25.
+
+        Returns:
+            List of dicts with name, category, description and score, best first.
+        """
+        terms = tokenize(query)
+        n_docs = len(self.docs)
+        if not terms or not n_docs:
+            return []
+
+        avg_len = sum(doc["len"] for doc in self.docs.values()) / n_docs or 1.0
+        scores = Counter()
+
+        for term in set(terms):
+            posting = self.postings.get(term)
+            if not posting:
+                continue
+            idf = math.log(1 + (n_docs - len(posting) + 0.5) / (len(posting) + 0.5))
+            for key, tf in posting.items():
+                doc_len = self.docs[key]["len"]
+                norm = tf * (K1 + 1) / (tf + K1 * (1 - B + B * doc_len / avg_len))
+                scores[key] += idf * norm
+
+        results = []
+        for key, score in scores.most_common(limit):
+            doc = self.docs[key]
+            results.append({
+                "name": doc["name"],
+                "category": doc["category"],
+                "description": doc["description"],
+                "score": round(score, 3),
+            })
+        return results
+
+
+def search_skills(query: str, limit: int = 10, rebuild: bool = False) -> List[Dict]:
+    """Refresh the persistent index if needed (or rebuild it) and run a query against it."""
+    index = SearchIndex() if rebuild else SearchIndex.load()
+    if index.refresh() or rebuild:
+        index.save()
+    return index.search(query, limit=limit)
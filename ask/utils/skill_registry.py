@@ -5,20 +5,20 @@ from typing import List, Dict, Optional
 
 import yaml
 
-from ask.utils.filesystem import get_skills_dir
+from ask.utils.filesystem import get_skills_dir, is_dev_mode
+from ask.utils.registry_snapshot import load_snapshot
 
 
-def get_all_skills() -> List[Dict]:
+def iter_skill_dirs():
     """
-    Discover and parse all skills in the skills directory.
+    Yield every skill directory (one containing a skill.yaml) in the skills directory.
     
-    Returns a list of skill dictionaries with their metadata.
+    Layout is skills/<category>/<skill>/skill.yaml. Unreadable directories are skipped.
     """
     skills_dir = get_skills_dir()
-    skills = []
     
     if not skills_dir.exists():
-        return skills
+        return
     
     # Walk through category directories
     for category_dir in skills_dir.iterdir():
@@ -35,45 +35,138 @@ def get_all_skills() -> List[Dict]:
                 except (PermissionError, OSError):
                     continue
                 
-                skill_yaml = skill_dir / "skill.yaml"
-                if skill_yaml.exists():
-                    try:
-                        skill = parse_skill(skill_yaml)
-                        if skill:
-                            skill["_path"] = str(skill_dir)
-                            
-                            # Detect instruction file (prefer SKILL.md)
-                            skill_md = skill_dir / "SKILL.md"
-                            readme_md = skill_dir / "README.md"
-                            if skill_md.exists():
-                                skill["_instruction_file"] = str(skill_md)
-                            elif readme_md.exists():
-                                skill["_instruction_file"] = str(readme_md)
-                                
-                            # Detect sidecars
-                            ref_md = skill_dir / "reference.md"
-                            if ref_md.exists():
-                                skill["_reference"] = str(ref_md)
-                                
-                            ex_md = skill_dir / "examples.md"
-                            if ex_md.exists():
-                                skill["_examples"] = str(ex_md)
-                                
-                            # Detect scripts
-                            scripts_dir = skill_dir / "scripts"
-                            if scripts_dir.exists() and scripts_dir.is_dir():
-                                skill["_scripts"] = str(scripts_dir)
-                                
-                            skills.append(skill)
-                    except Exception:
-                        # Skip malformed skills
-                        pass
+                if (skill_dir / "skill.yaml").exists():
+                    yield skill_dir
         except (PermissionError, OSError):
             continue
+
+
+def load_skill(skill_dir: Path) -> Optional[Dict]:
+    """
+    Load a single skill from its directory.
+    
+    Parses skill.yaml and detects the instruction file, sidecars and scripts.
+    _resources lists the top-level entries of the skill directory so adapters
+    can resolve resources without touching the filesystem.
+    Returns None if the skill is malformed.
+    """
+    try:
+        skill = parse_skill(skill_dir / "skill.yaml")
+        if not skill:
+            return None
+        
+        skill["_path"] = str(skill_dir)
+        
+        # Detect instruction file (prefer SKILL.md)
+        skill_md = skill_dir / "SKILL.md"
+        readme_md = skill_dir / "README.md"
+        if skill_md.exists():
+            skill["_instruction_file"] = str(skill_md)
+        elif readme_md.exists():
+            skill["_instruction_file"] = str(readme_md)
+            
+        # Detect sidecars
+        ref_md = skill_dir / "reference.md"
+        if ref_md.exists():
+            skill["_reference"] = str(ref_md)
+            
+        ex_md = skill_dir / "examples.md"
+        if ex_md.exists():
+            skill["_examples"] = str(ex_md)
+            
+        # Detect scripts
+        scripts_dir = skill_dir / "scripts"
+        if scripts_dir.exists() and scripts_dir.is_dir():
+            skill["_scripts"] = str(scripts_dir)
+        
+        skill["_resources"] = sorted(entry.name for entry in skill_dir.iterdir())
+            
+        return skill
+    except Exception:
+        # Skip malformed skills
+        return None
+
+
+def get_all_skills() -> List[Dict]:
+    """
+    Discover and parse all skills in the skills directory.
+    
+    Installed packages read the registry snapshot generated at wheel build
+    time; source checkouts (and packages without a snapshot) scan live.
+    
+    Returns a list of skill dictionaries with their metadata.
+    """
+    if not is_dev_mode():
+        snapshot = load_snapshot(get_skills_dir())
+        if snapshot is not None:
+            return snapshot
+    
+    skills = []
+    
+    for skill_dir in iter_skill_dirs():
+        skill = load_skill(skill_dir)
+        if skill:
+            skills.append(skill)
     
     return skills
 
 
+class SkillRegistry:
+    """
+    In-memory skill registry for long-running processes (watch, serve).
+    
+    Loads the library once, then reloads only the skill directories that changed.
+    """
+    
+    def __init__(self):
+        self.skills_dir = get_skills_dir()
+        self._skills: Dict[Path, Dict] = {}
+        self.reload()
+    
+    def reload(self) -> None:
+        """Load every skill from scratch."""
+        self._skills = {Path(skill["_path"]): skill for skill in get_all_skills()}
+    
+    def skill_dir_for(self, path: Path) -> Optional[Path]:
+        """Return the skill directory (skills/<category>/<skill>) a path belongs to."""
+        try:
+            parts = Path(path).relative_to(self.skills_dir).parts
+        except ValueError:
+            return None
+        if len(parts) < 2 or any(part.startswith(".") for part in parts[:2]):
+            return None
+        return self.skills_dir / parts[0] / parts[1]
+    
+    def refresh(self, paths) -> Dict[Path, Optional[Dict]]:
+        """
+        Reload the skills containing the given changed paths.
+        
+        Returns:
+            Dict of skill directory -> reloaded skill, or None if the skill was
+            removed or is now malformed.
+        """
+        changed = {}
+        for skill_dir in {self.skill_dir_for(path) for path in paths} - {None}:
+            skill = load_skill(skill_dir) if (skill_dir / "skill.yaml").exists() else None
+            if skill:
+                self._skills[skill_dir] = skill
+            else:
+                self._skills.pop(skill_dir, None)
+            changed[skill_dir] = skill
+        return changed
+    
+    def all(self) -> List[Dict]:
+        """All loaded skills."""
+        return list(self._skills.values())
+    
+    def get(self, name: str) -> Optional[Dict]:
+        """Get a loaded skill by name."""
+        for skill in self._skills.values():
+            if skill.get("name") == name:
+                return skill
+        return None
+
+
 def get_skill(name: str) -> Optional[Dict]:
     """
     Get a specific skill by name.
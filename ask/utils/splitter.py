@@ -0,0 +1,119 @@
+"""Progressive-disclosure splitting of large skills.
+
+A rendered skill is cut along its markdown heading tree into a short main file
+(the summary before the first section plus a table of contents) and one file
+per heavy section. Agents read the main file and pull in sections on demand.
+Small sections stay inline so short skills are not fragmented.
+"""
+
+import re
+from typing import List, Optional, Tuple
+
+from ask.utils.compact import split_code_segments, split_frontmatter
+
+
+# Sections at least this large (bytes) are moved out of the main file
+MIN_SECTION_BYTES = 1500
+
+_HEADING = re.compile(r"^(#{1,6})\s+(.+?)\s*#*\s*$")
+
+# Names split_markdown gives section files (e.g. 02-large-section.md)
+SECTION_FILE = re.compile(r"^\d{2,}-[a-z0-9-]+\.md$")
+
+
+def _slugify(title: str) -> str:
+    slug = re.sub(r"[^a-z0-9]+", "-", title.lower()).strip("-")
+    return slug[:60].rstrip("-") or "section"
+
+
+def _headings(lines: List[str]) -> List[Tuple[int, int, str]]:
+    """Return (line index, level, title) for every heading outside code blocks."""
+    headings = []
+    idx = 0
+    for is_code, segment in split_code_segments(lines):
+        if not is_code:
+            for offset, line in enumerate(segment):
+                match = _HEADING.match(line)
+                if match:
+                    headings.append((idx + offset, len(match.group(1)), match.group(2)))
+        idx += len(segment)
+    return headings
+
+
+def _split_level(headings: List[Tuple[int, int, str]]) -> Optional[int]:
+    """
+    Pick the heading level that divides the document into sections.
+
+    Leading H1 titles are skipped (adapters may prepend their own), then the
+    shallowest level with at least two headings wins.
+    """
+    start = 0
+    while start < len(headings) and headings[start][1] == 1:
+        start += 1
+
+    counts = {}
+    for _, level, _ in headings[start:]:
+        counts[level] = counts.get(level, 0) + 1
+
+    levels = [level for level, count in sorted(counts.items()) if count >= 2]
+    return levels[0] if levels else None
+
+
+def split_markdown(
+    text: str,
+    link_prefix: str,
+    min_section_bytes: int = MIN_SECTION_BYTES,
+) -> Tuple[str, List[Tuple[str, str]]]:
+    """
+    Split a markdown document into a main file and on-demand section files.
+
+    Args:
+        text: Rendered skill content
+        link_prefix: Relative path from the main file to the sections directory
+        min_section_bytes: Sections smaller than this stay inline
+
+    Returns:
+        (main_content, [(section_filename, section_content), ...]).
+        The section list is empty when nothing is worth splitting.
+    """
+    frontmatter, lines = split_frontmatter(text.splitlines())
+    headings = _headings(lines)
+    level = _split_level(headings)
+    if level is None:
+        return text, []
+
+    # Section boundaries: every heading at the split level or shallower, after the titles
+    boundaries = [idx for idx, lvl, _ in headings if lvl == level]
+    first = boundaries[0]
+    boundaries = [idx for idx, lvl, _ in headings if lvl <= level and idx >= first]
+    titles = {idx: title for idx, _, title in headings}
+
+    preamble = frontmatter + lines[:first]
+    inline = []
+    toc = []
+    sections = []
+
+    for number, start in enumerate(boundaries, 1):
+        end = boundaries[number] if number < len(boundaries) else len(lines)
+        body = "\n".join(lines[start:end]).strip("\n")
+        title = titles[start]
+
+        size = len(body.encode("utf-8"))
+        if size >= min_section_bytes:
+            filename = f"{number:02d}-{_slugify(title)}.md"
+            sections.append((filename, body + "\n"))
+            toc.append(f"- [{title}]({link_prefix}/{filename}) (~{size / 1024:.1f} KB)")
+        else:
+            inline.append(body)
+            toc.append(f"- {title} (below)")
+
+    if not sections:
+        return text, []
+
+    main_parts = [
+        "\n".join(preamble).rstrip("\n"),
+        "#" * level + " Sections",
+        "This skill is split into sections. Read a linked section file only when the task needs it.",
+        "\n".join(toc),
+    ] + inline
+    return "\n\n".join(part for part in main_parts if part) + "\n", sections
@@ -0,0 +1,201 @@
+"""Content-addressed store - one copy of each resource file, shared by every project.
+
+With --link, adapters install resource files (scripts, references, assets)
+as links into the store instead of copies:
+
+    <cache>/store/objects/ab/cdef...        file content, named by SHA-256
+    <cache>/store/objects/ab/cdef...-x      same, executable
+
+Hardlinks are preferred; when the project is on another filesystem a symlink
+is used instead (and recorded in links.json so prune can see it). Objects are
+read-only so an edit through a link cannot corrupt every project at once.
+
+An object is referenced while it has more than one hardlink or a recorded
+symlink still points at it; `ask store prune` removes the rest.
+"""
+
+import errno
+import json
+import os
+import shutil
+import stat
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+from ask.utils.cache import get_cache_dir, hash_file, load_json_cache, save_json_cache, stat_signature
+
+
+LINKS_NAME = "links.json"
+
+# Source file hashes keyed by path + (mtime_ns, size), so unchanged files are hashed once
+HASH_CACHE_NAME = "store-hashes"
+
+_hash_cache: Optional[Dict] = None
+
+# Symlinks created since the last save_links(), merged into links.json in one write
+_new_links: Dict[str, str] = {}
+
+
+def get_store_dir() -> Path:
+    """Root of the content-addressed store."""
+    return get_cache_dir() / "store"
+
+
+def _objects_dir() -> Path:
+    return get_store_dir() / "objects"
+
+
+def _source_hash(src: Path) -> str:
+    global _hash_cache
+    if _hash_cache is None:
+        _hash_cache = load_json_cache(HASH_CACHE_NAME) or {}
+    key = str(src.resolve())
+    sig = stat_signature(src)
+    cached = _hash_cache.get(key)
+    if cached and cached[0] == sig:
+        return cached[1]
+    digest = hash_file(src)
+    _hash_cache[key] = [sig, digest]
+    return digest
+
+
+def save_hash_cache() -> None:
+    """Persist source hashes computed during this run."""
+    if _hash_cache is not None:
+        save_json_cache(HASH_CACHE_NAME, _hash_cache)
+
+
+def add_file(src: Path) -> Path:
+    """Add a file to the store (no-op if its content is already there) and return the object path."""
+    executable = bool(src.stat().st_mode & stat.S_IXUSR)
+    digest = _source_hash(src)
+    obj = _objects_dir() / digest[:2] / (digest[2:] + ("-x" if executable else ""))
+    if obj.exists():
+        return obj
+
+    obj.parent.mkdir(parents=True, exist_ok=True)
+    tmp = obj.with_name(f".{obj.name}.{os.getpid()}.tmp")
+    shutil.copyfile(src, tmp)
+    os.chmod(tmp, 0o555 if executable else 0o444)
+    os.replace(tmp, obj)
+    return obj
+
+
+def _load_links() -> Dict[str, str]:
+    try:
+        with open(get_store_dir() / LINKS_NAME, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_links(links: Dict[str, str]) -> None:
+    path = get_store_dir() / LINKS_NAME
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(".tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(links, f, indent=1, sort_keys=True)
+    os.replace(tmp, path)
+
+
+def save_links() -> None:
+    """Record the symlinks created during this run in links.json."""
+    if _new_links:
+        links = _load_links()
+        links.update(_new_links)
+        _save_links(links)
+        _new_links.clear()
+
+
+def link_file(src: Path, dst: Path) -> str:
+    """
+    Install src at dst as a link to its store object.
+
+    Symlinks are recorded on the next save_links().
+
+    Returns:
+        "hardlink" or "symlink", whichever was created.
+    """
+    obj = add_file(src)
+    dst.parent.mkdir(parents=True, exist_ok=True)
+    if dst.exists() or dst.is_symlink():
+        dst.unlink()
+    try:
+        os.link(obj, dst)
+        return "hardlink"
+    except OSError as e:
+        if e.errno not in (errno.EXDEV, errno.EPERM, errno.EMLINK, errno.ENOTSUP):
+            raise
+    os.symlink(obj, dst)
+    _new_links[str(dst.absolute())] = str(obj)
+    return "symlink"
+
+
+def link_tree(src: Path, dst: Path) -> None:
+    """Install a file or directory tree from the store (see link_file)."""
+    if src.is_dir():
+        for path in sorted(src.rglob("*")):
+            if path.is_file():
+                link_file(path, dst / path.relative_to(src))
+    else:
+        link_file(src, dst)
+
+
+def store_status() -> Dict[str, int]:
+    """Object count, total size and how many objects are referenced."""
+    referenced = _referenced_objects()
+    objects = size = used = 0
+    for obj in _iter_objects():
+        objects += 1
+        size += obj.stat().st_size
+        used += obj in referenced or obj.stat().st_nlink > 1
+    return {"objects": objects, "bytes": size, "referenced": used}
+
+
+def _iter_objects():
+    objects_dir = _objects_dir()
+    if not objects_dir.exists():
+        return
+    for shard in objects_dir.iterdir():
+        if shard.is_dir():
+            for obj in shard.iterdir():
+                if not obj.name.startswith("."):
+                    yield obj
+
+
+def _referenced_objects() -> set:
+    """Objects still targeted by a recorded symlink (dead symlink records are dropped)."""
+    links = _load_links()
+    live = {}
+    for link, target in links.items():
+        path = Path(link)
+        if path.is_symlink() and os.readlink(path) == target:
+            live[link] = target
+    if live != links:
+        _save_links(live)
+    return {Path(target) for target in live.values()}
+
+
+def prune(dry_run: bool = False) -> Tuple[int, int]:
+    """
+    Remove objects no project references any more.
+
+    Returns:
+        (objects removed, bytes freed)
+    """
+    referenced = _referenced_objects()
+    removed = freed = 0
+    for obj in list(_iter_objects()):
+        st = obj.stat()
+        if st.st_nlink > 1 or obj in referenced:
+            continue
+        if not dry_run:
+            obj.unlink()
+        removed += 1
+        freed += st.st_size
+
+    if not dry_run:
+        for shard in _objects_dir().iterdir() if _objects_dir().exists() else []:
+            if shard.is_dir() and not any(shard.iterdir()):
+                shard.rmdir()
+    return removed, freed
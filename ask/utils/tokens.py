@@ -0,0 +1,29 @@
+"""Token estimation utilities.
+
+A fast local approximation of BPE tokenizers (cl100k-style): text is split the
+way those tokenizers pre-tokenize it, and long words are charged roughly one
+token per four characters. It is an estimate, but a stable one, which is what
+budget checks need, and it avoids shipping a tokenizer.
+"""
+
+import re
+
+
+_PRETOKEN_PATTERN = re.compile(r"[A-Za-z]+|\d{1,3}|[^\sA-Za-z\d]+|\n+")
+
+
+def estimate_tokens(text: str) -> int:
+    """Estimate the number of tokens a model would see for some text."""
+    count = 0
+    for piece in _PRETOKEN_PATTERN.findall(text):
+        first = piece[0]
+        if first == "\n":
+            count += 1
+        elif first.isalpha():
+            count += 1 if len(piece) <= 6 else (len(piece) + 3) // 4
+        elif first.isdigit():
+            count += 1
+        else:
+            # Punctuation runs (markdown tables, rules) merge in pairs
+            count += (len(piece) + 1) // 2
+    return count
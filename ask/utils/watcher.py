@@ -0,0 +1,139 @@
+"""File watching for `ask watch`.
+
+Uses native filesystem events (inotify, FSEvents, ...) through the optional
+watchdog package when it is installed, otherwise polls with os.scandir.
+Changes are debounced so a burst of saves is handled as one batch.
+"""
+
+import os
+import queue
+import time
+from pathlib import Path
+from typing import Dict, Iterator, Optional, Set, Tuple
+
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+except ImportError:  # pragma: no cover - optional dependency
+    FileSystemEventHandler = object
+    Observer = None
+
+
+_IGNORED_DIRS = {"__pycache__", ".git"}
+
+
+class PollingWatcher:
+    """Stdlib watcher: compares (mtime_ns, size) snapshots of every file under root."""
+
+    name = "polling"
+
+    def __init__(self, root: Path, interval: float = 0.5):
+        self.root = Path(root)
+        self.interval = interval
+        self._state = self._scan()
+
+    def _scan(self) -> Dict[str, Tuple[int, int]]:
+        state = {}
+        stack = [str(self.root)]
+        while stack:
+            try:
+                with os.scandir(stack.pop()) as entries:
+                    for entry in entries:
+                        try:
+                            if entry.is_dir(follow_symlinks=False):
+                                if entry.name not in _IGNORED_DIRS:
+                                    stack.append(entry.path)
+                            else:
+                                st = entry.stat()
+                                state[entry.path] = (st.st_mtime_ns, st.st_size)
+                        except OSError:
+                            continue
+            except OSError:
+                continue
+        return state
+
+    def poll(self) -> Set[Path]:
+        """Return files added, removed or modified since the last poll."""
+        state = self._scan()
+        old = self._state
+        self._state = state
+        changed = {path for path, sig in state.items() if old.get(path) != sig}
+        changed.update(path for path in old if path not in state)
+        return {Path(path) for path in changed}
+
+    def changes(self, timeout: Optional[float] = None) -> Set[Path]:
+        """Wait up to timeout seconds (forever if None) for changes."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            changed = self.poll()
+            if changed:
+                return changed
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return set()
+                time.sleep(min(self.interval, remaining))
+            else:
+                time.sleep(self.interval)
+
+    def close(self) -> None:
+        pass
+
+
+class _QueueHandler(FileSystemEventHandler):
+    def __init__(self, events: "queue.Queue[Path]"):
+        super().__init__()
+        self.events = events
+
+    def on_any_event(self, event):
+        if not event.is_directory:
+            self.events.put(Path(event.src_path))
+            dest = getattr(event, "dest_path", None)
+            if dest:
+                self.events.put(Path(dest))
+
+
+class NativeWatcher:
+    """Event-driven watcher backed by watchdog."""
+
+    name = "native"
+
+    def __init__(self, root: Path):
+        self.events: "queue.Queue[Path]" = queue.Queue()
+        self.observer = Observer()
+        self.observer.schedule(_QueueHandler(self.events), str(root), recursive=True)
+        self.observer.start()
+
+    def changes(self, timeout: Optional[float] = None) -> Set[Path]:
+        try:
+            changed = {self.events.get(timeout=timeout)}
+        except queue.Empty:
+            return set()
+        while True:
+            try:
+                changed.add(self.events.get_nowait())
+            except queue.Empty:
+                return changed
+
+    def close(self) -> None:
+        self.observer.stop()
+        self.observer.join()
+
+
+def create_watcher(root: Path, interval: float = 0.5, polling: bool = False):
+    """Create the best available watcher for root."""
+    if Observer is not None and not polling:
+        return NativeWatcher(root)
+    return PollingWatcher(root, interval)
+
+
+def debounced_changes(watcher, debounce: float = 0.3) -> Iterator[Set[Path]]:
+    """Yield batches of changed paths, each once no new change arrived for `debounce` seconds."""
+    while True:
+        batch = watcher.changes()
+        while True:
+            more = watcher.changes(timeout=debounce)
+            if not more:
+                break
+            batch |= more
+        yield batch
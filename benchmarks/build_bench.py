@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Benchmark installing from prebuilt artifacts (ask build) vs. rendering.
+
+Usage:
+    python benchmarks/build_bench.py [--skills 300] [--kb 24] [--agent claude] [--compact] [--split]
+
+Generates a synthetic skill library, builds it into a dist/ directory and
+times render_outputs() for every skill three ways: rendering on the spot,
+from artifacts with a warm hash cache, and from artifacts right after a
+fresh clone (new mtimes and inodes, empty cache).
+"""
+
+import argparse
+import io
+import os
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import ask.commands.build as build_cmd  # noqa: E402
+import ask.utils.artifacts as artifacts  # noqa: E402
+import ask.utils.skill_registry as skill_registry  # noqa: E402
+from ask.utils.filesystem import get_adapter  # noqa: E402
+from rich.console import Console  # noqa: E402
+
+
+def make_library(root: Path, count: int, kb: int, agent: str) -> None:
+    paragraph = "Keep the change small, test it, and describe why it was made. " * 8
+    for i in range(count):
+        skill_dir = root / "coding" / f"bench-skill-{i:04d}"
+        skill_dir.mkdir(parents=True)
+        (skill_dir / "skill.yaml").write_text(
+            f"name: bench-skill-{i:04d}\nversion: 1.0.0\ncategory: coding\n"
+            f"description: Benchmark skill {i}\ntags: []\nagents:\n  - {agent}\n",
+            encoding="utf-8",
+        )
+        sections = []
+        while sum(map(len, sections)) < kb * 1024:
+            n = len(sections)
+            sections.append(f"## Section {n}\n\n<!-- note {n} -->\n\n{paragraph}\n\n```bash\nmake test-{n}\n```\n")
+        (skill_dir / "SKILL.md").write_text(f"# Skill {i}\n\nSummary.\n\n" + "\n".join(sections), encoding="utf-8")
+
+
+def clone(src: Path, dst: Path) -> None:
+    """Copy without preserving metadata, like a fresh git checkout."""
+    shutil.copytree(src, dst, copy_function=shutil.copyfile)
+
+
+def time_render(agent: str, compact: bool, split: bool, target: Path, prebuilt: bool) -> float:
+    """Time render_outputs() for every skill (the library scan is timed separately)."""
+    adapter = get_adapter(agent, compact=compact, split=split)
+    adapter.target_dir = target
+    adapter.use_prebuilt = prebuilt
+    skills = skill_registry.get_all_skills()
+    start = time.perf_counter()
+    for skill in skills:
+        adapter.render_outputs(skill)
+    artifacts.save_hash_cache()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--skills", type=int, default=300, help="Skills in the generated library")
+    parser.add_argument("--kb", type=int, default=24, help="Approximate SKILL.md size in KB")
+    parser.add_argument("--agent", default="claude", help="Agent to render for")
+    parser.add_argument("--compact", action="store_true", help="Render compact-mode output")
+    parser.add_argument("--split", action="store_true", help="Render split-mode output")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        os.environ["ASK_CACHE_DIR"] = str(tmp / "cache")
+        library, dist = tmp / "skills", tmp / "dist"
+        make_library(library, args.skills, args.kb, args.agent)
+        skill_registry.get_skills_dir = lambda: library
+        artifacts.get_dist_dir = build_cmd.get_dist_dir = lambda: dist
+
+        build_args = ["--agent", args.agent] + (["--compact"] if args.compact else []) + (["--split"] if args.split else [])
+        build_cmd.console = Console(file=io.StringIO())
+        build_cmd.build.main(build_args, standalone_mode=False)
+
+        print(f"{args.skills} skills x {args.kb} KB, agent={args.agent}, compact={args.compact}, split={args.split}")
+        target = tmp / "install"
+        start = time.perf_counter()
+        skill_registry.get_all_skills()
+        print(f"  library scan      {(time.perf_counter() - start) * 1000:8.1f} ms  (paid either way)")
+        render = time_render(args.agent, args.compact, args.split, target, prebuilt=False)
+        print(f"  render            {render * 1000:8.1f} ms")
+        warm = time_render(args.agent, args.compact, args.split, target, prebuilt=True)
+        print(f"  prebuilt (warm)   {warm * 1000:8.1f} ms  x{render / warm:5.2f}")
+
+        # Fresh clone: same content, new mtimes/inodes, no hash cache
+        cloned = tmp / "clone"
+        clone(library, cloned)
+        skill_registry.get_skills_dir = lambda: cloned
+        shutil.rmtree(tmp / "cache", ignore_errors=True)
+        artifacts.reset_caches()
+        fresh = time_render(args.agent, args.compact, args.split, target, prebuilt=True)
+        print(f"  prebuilt (clone)  {fresh * 1000:8.1f} ms  x{render / fresh:5.2f}")
+
+
+if __name__ == "__main__":
+    main()
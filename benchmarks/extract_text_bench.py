@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+Benchmark extract_text.py: serial vs. --jobs page sharding.
+
+Usage:
+    python benchmarks/extract_text_bench.py [--pages 300] [--jobs 1,2,4]
+
+Generates a multi-hundred-page PDF, extracts it at each job count, checks
+that the output is identical to serial mode and prints wall time.
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from pdf_fixtures import SKILL_SCRIPTS, make_text_pdf
+
+
+# Importable by name, so worker processes can unpickle the script's functions
+sys.path.insert(0, str(SKILL_SCRIPTS))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pages", type=int, default=300, help="Pages in the generated PDF")
+    parser.add_argument("--jobs", default=f"1,2,{os.cpu_count() or 1}", help="Comma-separated job counts")
+    args = parser.parse_args()
+
+    import extract_text as extract
+    jobs_list = sorted({int(j) for j in args.jobs.split(",")})
+
+    with tempfile.TemporaryDirectory() as tmp:
+        pdf = make_text_pdf(Path(tmp) / "bench.pdf", pages=args.pages)
+        print(f"{args.pages} pages, {pdf.stat().st_size / 1024:,.0f} KB, {os.cpu_count()} CPU(s)")
+
+        baseline = None
+        for jobs in jobs_list:
+            start = time.perf_counter()
+            text = extract.extract_text(str(pdf), jobs=jobs)
+            elapsed = time.perf_counter() - start
+            if baseline is None:
+                baseline = (text, elapsed)
+            same = "identical" if text == baseline[0] else "DIFFERENT"
+            print(f"  jobs={jobs:<3} {elapsed:6.2f}s  x{baseline[1] / elapsed:4.2f}  {same}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Benchmark fill_form.py: one fill_form() call per record vs. batch mode.
+
+Usage:
+    python benchmarks/fill_form_bench.py [--records 200] [--pages 80] [--jobs 1,2,4]
+
+Generates a multi-page form and a set of records, fills them the old way
+(template re-read for every record) and through fill_batch() at each job
+count, and prints wall time and forms per second.
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from pdf_fixtures import SKILL_SCRIPTS, make_form_pdf
+
+
+# Importable by name, so worker processes can unpickle the script's functions
+sys.path.insert(0, str(SKILL_SCRIPTS))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--records", type=int, default=200, help="Forms to fill")
+    parser.add_argument("--pages", type=int, default=80, help="Pages in the generated form")
+    parser.add_argument("--jobs", default=f"1,2,{os.cpu_count() or 1}", help="Comma-separated job counts")
+    args = parser.parse_args()
+
+    import fill_form
+    jobs_list = sorted({int(j) for j in args.jobs.split(",")})
+
+    with tempfile.TemporaryDirectory() as tmp:
+        template = str(make_form_pdf(Path(tmp) / "form.pdf", pages=args.pages))
+        records = [
+            {"id": f"r{i}", "p1_f0": f"Applicant {i}", f"p{args.pages}_f9": f"{i:06d}"}
+            for i in range(args.records)
+        ]
+        print(f"{args.records} records, {args.pages}-page form, {os.cpu_count()} CPU(s)")
+
+        start = time.perf_counter()
+        for record in records:
+            fill_form.fill_form(template, f"{tmp}/single-{record['id']}.pdf", record)
+        baseline = time.perf_counter() - start
+        print(f"  per-record  {baseline:6.2f}s  {args.records / baseline:6.1f} forms/s")
+
+        for jobs in jobs_list:
+            report = fill_form.fill_batch(template, records, f"{tmp}/batch{jobs}/{{id}}.pdf", jobs)
+            elapsed = report["seconds"]
+            print(f"  batch j={jobs:<3} {elapsed:6.2f}s  {report['filled'] / elapsed:6.1f} forms/s"
+                  f"  x{baseline / elapsed:4.2f}  {len(report['failed'])} failed")
+
+
+if __name__ == "__main__":
+    main()
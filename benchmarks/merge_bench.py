@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Benchmark merge_pdfs.py: in-memory merge vs. --stream.
+
+Usage:
+    python benchmarks/merge_bench.py [--files 200] [--pages 4] [--image-kb 256]
+
+Generates a set of "scanned" PDFs (one incompressible image per page plus a
+letterhead shared by every file) and merges them with each mode in a fresh
+process, printing wall time, peak RSS and output size.
+"""
+
+import argparse
+import json
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from pdf_fixtures import SKILL_SCRIPTS, make_scan_pdf
+
+
+def run_child(mode: str, list_file: str, output: str) -> None:
+    """Merge in this process and report time and peak RSS as JSON."""
+    sys.path.insert(0, str(SKILL_SCRIPTS))
+    import merge_pdfs
+
+    inputs = Path(list_file).read_text().split("\n")
+    start = time.perf_counter()
+    pages = merge_pdfs.merge_pdfs(inputs, output, add_bookmarks=True, stream=mode == "stream")
+    print(json.dumps({
+        "seconds": time.perf_counter() - start,
+        "pages": pages,
+        "rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+    }))
+
+
+def main():
+    if len(sys.argv) == 5 and sys.argv[1] == "--child":
+        return run_child(*sys.argv[2:])
+
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--files", type=int, default=200, help="Input PDFs")
+    parser.add_argument("--pages", type=int, default=4, help="Pages per input")
+    parser.add_argument("--image-kb", type=int, default=256, help="Scan image size per page")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        inputs = [
+            str(make_scan_pdf(Path(tmp) / f"scan{i:05d}.pdf", args.pages, args.image_kb, seed=i))
+            for i in range(args.files)
+        ]
+        list_file = Path(tmp) / "inputs.txt"
+        list_file.write_text("\n".join(inputs))
+        total_mb = sum(Path(path).stat().st_size for path in inputs) / 1024 / 1024
+        print(f"{args.files} files x {args.pages} pages, {total_mb:,.0f} MB of input")
+
+        for mode in ("memory", "stream"):
+            output = Path(tmp) / f"merged-{mode}.pdf"
+            result = subprocess.run(
+                [sys.executable, __file__, "--child", mode, str(list_file), str(output)],
+                capture_output=True, text=True, check=True,
+            )
+            stats = json.loads(result.stdout.strip().splitlines()[-1])
+            print(f"  {mode:<7} {stats['seconds']:6.2f}s  peak RSS {stats['rss_mb']:7.1f} MB  "
+                  f"{output.stat().st_size / 1024 / 1024:7.1f} MB out  {stats['pages']} pages")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,154 @@
+"""Generate large synthetic PDFs for the pdf-processing benchmarks (needs pypdf)."""
+
+import random
+from pathlib import Path
+
+from pypdf import PdfWriter
+from pypdf.generic import (
+    ArrayObject,
+    BooleanObject,
+    DecodedStreamObject,
+    DictionaryObject,
+    FloatObject,
+    NameObject,
+    NumberObject,
+    TextStringObject,
+)
+
+WORDS = (
+    "agreement party shall notice term payment invoice clause service liability "
+    "confidential period effective date schedule amount delivery termination"
+).split()
+
+SKILL_SCRIPTS = Path(__file__).resolve().parent.parent / "skills" / "tooling" / "ask-pdf-processing" / "scripts"
+
+
+def _new_writer():
+    writer = PdfWriter()
+    font = writer._add_object(DictionaryObject({
+        NameObject("/Type"): NameObject("/Font"),
+        NameObject("/Subtype"): NameObject("/Type1"),
+        NameObject("/BaseFont"): NameObject("/Helvetica"),
+    }))
+    return writer, font
+
+
+def _add_page(writer, font, content: str) -> None:
+    page = writer.add_blank_page(612, 792)
+    page[NameObject("/Resources")] = DictionaryObject({
+        NameObject("/Font"): DictionaryObject({NameObject("/F1"): font}),
+    })
+    stream = DecodedStreamObject()
+    stream.set_data(content.encode("latin-1"))
+    page[NameObject("/Contents")] = writer._add_object(stream)
+
+
+def make_text_pdf(path: Path, pages: int = 300, lines: int = 45, seed: int = 0) -> Path:
+    """A PDF of `pages` pages, each with `lines` lines of pseudo-random prose."""
+    rng = random.Random(seed)
+    writer, font = _new_writer()
+    for number in range(1, pages + 1):
+        ops = ["BT", "/F1 10 Tf", "14 TL", "72 740 Td", f"(Page {number} of {pages}) Tj"]
+        for _ in range(lines):
+            ops.append(f"({' '.join(rng.choice(WORDS) for _ in range(12))}) '")
+        ops.append("ET")
+        _add_page(writer, font, "\n".join(ops))
+    with open(path, "wb") as f:
+        writer.write(f)
+    return path
+
+
+def make_table_pdf(path: Path, pages: int = 100, rows: int = 20, cols: int = 4, seed: int = 0) -> Path:
+    """A PDF with one ruled table per page (header row plus `rows` invoice lines)."""
+    rng = random.Random(seed)
+    writer, font = _new_writer()
+    width, height, left, top = 110, 24, 72, 720
+    for number in range(1, pages + 1):
+        ops = ["0.5 w"]
+        for r in range(rows + 2):
+            ops.append(f"{left} {top - r * height} m {left + cols * width} {top - r * height} l S")
+        for c in range(cols + 1):
+            ops.append(f"{left + c * width} {top} m {left + c * width} {top - (rows + 1) * height} l S")
+        ops += ["BT", "/F1 9 Tf"]
+        cells = [["Item", "Qty", "Price", "Page"]] + [
+            [rng.choice(WORDS), str(rng.randint(1, 99)), f"{rng.uniform(1, 999):.2f}", str(number)]
+            for _ in range(rows)
+        ]
+        for r, row in enumerate(cells):
+            for c, value in enumerate(row[:cols]):
+                x, y = left + c * width + 6, top - (r + 1) * height + 8
+                ops.append(f"1 0 0 1 {x} {y} Tm ({value}) Tj")
+        ops.append("ET")
+        _add_page(writer, font, "\n".join(ops))
+    with open(path, "wb") as f:
+        writer.write(f)
+    return path
+
+
+def make_form_pdf(path: Path, pages: int = 80, fields_per_page: int = 10) -> Path:
+    """A fillable form: `fields_per_page` text fields named p<page>_f<n> on every page."""
+    writer, font = _new_writer()
+    fields = ArrayObject()
+    for number in range(1, pages + 1):
+        _add_page(writer, font, f"BT /F1 12 Tf 72 750 Td (Form page {number}) Tj ET")
+        page = writer.pages[-1]
+        annots = ArrayObject()
+        for n in range(fields_per_page):
+            y = 700 - n * 30
+            widget = writer._add_object(DictionaryObject({
+                NameObject("/Type"): NameObject("/Annot"),
+                NameObject("/Subtype"): NameObject("/Widget"),
+                NameObject("/FT"): NameObject("/Tx"),
+                NameObject("/T"): TextStringObject(f"p{number}_f{n}"),
+                NameObject("/Rect"): ArrayObject([FloatObject(v) for v in (200, y, 450, y + 20)]),
+                NameObject("/F"): NumberObject(4),
+                NameObject("/DA"): TextStringObject("/F1 10 Tf 0 g"),
+                NameObject("/V"): TextStringObject(""),
+                NameObject("/P"): page.indirect_reference,
+            }))
+            annots.append(widget)
+            fields.append(widget)
+        page[NameObject("/Annots")] = annots
+    writer._root_object[NameObject("/AcroForm")] = DictionaryObject({
+        NameObject("/Fields"): fields,
+        NameObject("/DA"): TextStringObject("/F1 0 Tf 0 g"),
+        NameObject("/DR"): DictionaryObject({
+            NameObject("/Font"): DictionaryObject({NameObject("/F1"): font}),
+        }),
+        NameObject("/NeedAppearances"): BooleanObject(True),
+    })
+    with open(path, "wb") as f:
+        writer.write(f)
+    return path
+
+
+def _image(writer, data: bytes, width: int):
+    image = DecodedStreamObject()
+    image.update({
+        NameObject("/Type"): NameObject("/XObject"),
+        NameObject("/Subtype"): NameObject("/Image"),
+        NameObject("/Width"): NumberObject(width),
+        NameObject("/Height"): NumberObject(len(data) // width),
+        NameObject("/ColorSpace"): NameObject("/DeviceGray"),
+        NameObject("/BitsPerComponent"): NumberObject(8),
+    })
+    image.set_data(data)
+    return writer._add_object(image)
+
+
+def make_scan_pdf(path: Path, pages: int = 4, image_kb: int = 256, seed: int = 0) -> Path:
+    """A "scanned" PDF: one incompressible full-page image per page, plus a letterhead image shared by every file."""
+    rng = random.Random(seed)
+    writer, font = _new_writer()
+    logo = _image(writer, bytes(range(256)) * 64, width=128)
+    for number in range(1, pages + 1):
+        _add_page(writer, font, f"q 612 0 0 792 0 0 cm /Scan Do Q q 128 0 0 128 20 650 cm /Logo Do Q "
+                                f"BT /F1 12 Tf 72 40 Td (Scan {seed}-{number}) Tj ET")
+        page = writer.pages[-1]
+        page[NameObject("/Resources")][NameObject("/XObject")] = DictionaryObject({
+            NameObject("/Scan"): _image(writer, rng.randbytes(image_kb * 1024), width=512),
+            NameObject("/Logo"): logo,
+        })
+    with open(path, "wb") as f:
+        writer.write(f)
+    return path
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Benchmark short script runs: `python script.py` vs. `ask run` vs. `ask-run`.
+
+Usage:
+    python benchmarks/run_bench.py [--runs 10] [--pages 1]
+
+Runs two ask-pdf-processing scripts end to end, in a new process each
+time: merge_pdfs.py on two small PDFs (start-up and imports dominate) and
+extract_text.py on one page (pdfplumber's layout analysis dominates). Each
+runs directly, through `ask run` with a warm pool and through the thin
+`ask-run` client with the same pool. Prints the median wall time of each.
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from pdf_fixtures import SKILL_SCRIPTS, make_text_pdf
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def time_runs(cmd: list, runs: int, env: dict) -> float:
+    """Median wall time of `runs` runs of cmd (after one warm-up run)."""
+    times = []
+    for i in range(runs + 1):
+        start = time.perf_counter()
+        subprocess.run(cmd, env=env, cwd=ROOT, stdout=subprocess.DEVNULL, check=True)
+        if i:
+            times.append(time.perf_counter() - start)
+    return statistics.median(times)
+
+
+def wait_for_pool(env: dict) -> None:
+    status = [sys.executable, "-m", "ask.cli", "run", "--status"]
+    deadline = time.time() + 30
+    while "Pool running" not in subprocess.run(status, env=env, cwd=ROOT, capture_output=True, text=True).stderr:
+        if time.time() > deadline:
+            sys.exit("pool did not start")
+        time.sleep(0.2)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=10, help="Timed runs per mode")
+    parser.add_argument("--pages", type=int, default=1, help="Pages in the generated PDF")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        pdf = make_text_pdf(tmp / "bench.pdf", pages=args.pages)
+        env = dict(os.environ, ASK_CACHE_DIR=str(tmp / "cache"), PYTHONPATH=str(ROOT))
+        scripts = {
+            "merge_pdfs.py": [str(pdf), str(pdf), "-o", str(tmp / "merged.pdf")],
+            "extract_text.py": [str(pdf), "--no-cache"],
+        }
+        modes = {
+            "ask run (pool)": [sys.executable, "-m", "ask.cli", "run", "ask-pdf-processing"],
+            "ask-run (pool)": [sys.executable, "-m", "ask.utils.run_client", "ask-pdf-processing"],
+        }
+
+        direct = {name: time_runs([sys.executable, str(SKILL_SCRIPTS / name), *script_args], args.runs, env)
+                  for name, script_args in scripts.items()}
+        pool = subprocess.Popen([sys.executable, "-m", "ask.cli", "run", "--serve"], env=env, cwd=ROOT,
+                                stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        try:
+            wait_for_pool(env)
+            for name, script_args in scripts.items():
+                print(f"{name} ({args.pages} page(s)), median of {args.runs} runs")
+                print(f"  python script.py  {direct[name] * 1000:8.1f} ms")
+                for label, prefix in modes.items():
+                    elapsed = time_runs([*prefix, name, *script_args], args.runs, env)
+                    print(f"  {label:<16}  {elapsed * 1000:8.1f} ms  x{direct[name] / elapsed:5.2f}")
+        finally:
+            subprocess.run([sys.executable, "-m", "ask.cli", "run", "--stop"], env=env, cwd=ROOT, capture_output=True)
+            pool.wait(timeout=10)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,37 @@
+"""Hatch build hook - bundle a registry snapshot into the wheel.
+
+Loads the skill library exactly as the CLI does and ships the result as
+skills/_registry.json, so installed packages never scan skills/ at runtime.
+"""
+
+import sys
+import tempfile
+from pathlib import Path
+
+from hatchling.builders.hooks.plugin.interface import BuildHookInterface
+
+
+class CustomBuildHook(BuildHookInterface):
+    PLUGIN_NAME = "custom"
+
+    def initialize(self, version, build_data):
+        if self.target_name != "wheel":
+            return
+
+        sys.path.insert(0, self.root)
+        try:
+            from ask.utils.registry_snapshot import SNAPSHOT_NAME, write_snapshot
+            from ask.utils.skill_registry import iter_skill_dirs, load_skill
+        finally:
+            sys.path.remove(self.root)
+
+        skills_dir = Path(self.root) / "skills"
+        skills = [skill for skill in map(load_skill, iter_skill_dirs()) if skill]
+
+        self._tmpdir = tempfile.TemporaryDirectory()
+        snapshot = write_snapshot(skills, skills_dir, Path(self._tmpdir.name) / SNAPSHOT_NAME)
+        build_data["force_include"][str(snapshot)] = f"skills/{SNAPSHOT_NAME}"
+
+    def finalize(self, version, build_data, artifact_path):
+        if getattr(self, "_tmpdir", None):
+            self._tmpdir.cleanup()
@@ -3,59 +3,400 @@
 Extract text from PDF files using pdfplumber.
 
 Usage:
-    python extract_text.py input.pdf [--output output.txt] [--pages 1,2,3]
+    python extract_text.py input.pdf [--output output.txt] [--pages 1,2,3] [--jobs N]
+    python extract_text.py input.pdf --tables [--format csv|jsonl] [--pages 1-50]
 
 Examples:
     python extract_text.py document.pdf
     python extract_text.py document.pdf --output extracted.txt
     python extract_text.py document.pdf --pages 1,3,5
+    python extract_text.py contract.pdf --jobs 8
+    python extract_text.py statement.pdf | grep -i invoice
+    python extract_text.py statement.pdf --tables --format jsonl --jobs 4 > tables.jsonl
+
+Pages and table rows are written (and flushed) as soon as they are
+extracted, so memory stays flat and downstream tools can start consuming
+immediately. Extracted pages are cached on disk (keyed by the PDF's content
+hash, the pdfplumber version, page and mode; see PageCache), so re-running on the same document with
+other --pages is mostly file reads. Use --no-cache to bypass it.
 """
 
 import argparse
+import csv
+import hashlib
+import json
+import os
 import sys
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
 from pathlib import Path
+from typing import Iterable, Iterator, TextIO
 
 try:
     import pdfplumber
 except ImportError:
-    print("Error: pdfplumber not installed. Run: pip install pdfplumber")
+    print("Error: pdfplumber not installed. Run: pip install pdfplumber (or 'ask deps', then use 'ask run')")
     sys.exit(1)
 
 
-def extract_text(pdf_path: str, pages: list[int] | None = None) -> str:
+PAGE_SEPARATOR = "\n\n"
+DEFAULT_CACHE_MB = 256
+
+# Cached pages are only valid for the extractor that produced them
+EXTRACTOR_VERSION = f"pdfplumber-{getattr(pdfplumber, '__version__', 'unknown')}"
+
+
+def get_cache_dir() -> Path:
+    """The ASK cache directory (honours ASK_CACHE_DIR and XDG_CACHE_HOME)."""
+    override = os.environ.get("ASK_CACHE_DIR")
+    if override:
+        return Path(override).expanduser()
+    xdg = os.environ.get("XDG_CACHE_HOME")
+    return (Path(xdg).expanduser() if xdg else Path.home() / ".cache") / "ask"
+
+
+def get_cache_limit() -> int:
+    """Page cache budget in bytes (ASK_PDF_CACHE_MB; the default when unset or invalid)."""
+    try:
+        megabytes = max(0, int(os.environ.get("ASK_PDF_CACHE_MB", DEFAULT_CACHE_MB)))
+    except ValueError:
+        megabytes = DEFAULT_CACHE_MB
+    return megabytes * 1024 * 1024
+
+
+# Open document in each worker process (see _init_worker)
+_worker_pdf = None
+
+
+def _init_worker(pdf_path: str) -> None:
+    """Open the PDF once per worker process."""
+    global _worker_pdf
+    _worker_pdf = pdfplumber.open(pdf_path)
+
+
+def _page_text(page):
+    return page.extract_text() or ""
+
+
+def _page_tables(page):
+    return page.extract_tables()
+
+
+# Extraction modes: what is pulled out of each page
+EXTRACTORS = {
+    "text": _page_text,
+    "tables": _page_tables,
+}
+
+
+def _extract_pages(pdf, mode: str, page_indices) -> list[tuple[int, object]]:
+    """Extract some pages of an open PDF as (page index, result) pairs."""
+    extract = EXTRACTORS[mode]
+    results = []
+    for i in page_indices:
+        page = pdf.pages[i]
+        results.append((i, extract(page)))
+        page.close()  # drop the page's parsed objects
+    return results
+
+
+def _extract_chunk(task: tuple[str, list[int]]) -> list[tuple[int, object]]:
+    mode, page_indices = task
+    return _extract_pages(_worker_pdf, mode, page_indices)
+
+
+def _chunks(items: list[int], jobs: int, max_size: int = 16) -> list[list[int]]:
+    """Split pages into contiguous ranges, a few per worker to even out load.
+
+    Ranges are capped at max_size pages so the first output arrives quickly.
+    """
+    size = min(max_size, max(1, -(-len(items) // (jobs * 4))))
+    return [items[i:i + size] for i in range(0, len(items), size)]
+
+
+def _ordered_map(pool, fn, items: Iterable, window: int) -> Iterator:
+    """Like pool.map, but keeps at most `window` tasks in flight so results never pile up."""
+    items = iter(items)
+    pending = deque(pool.submit(fn, item) for item in islice(items, window))
+    while pending:
+        result = pending.popleft().result()
+        for item in items:
+            pending.append(pool.submit(fn, item))
+            break
+        yield result
+
+
+def _page_indices(total_pages: int, pages: list[int] | None) -> list[int]:
+    if pages:
+        # Convert to 0-indexed and validate
+        return [p - 1 for p in pages if 0 < p <= total_pages]
+    return list(range(total_pages))
+
+
+class PageCache:
+    """
+    Per-page extraction results on disk, keyed by (PDF content hash,
+    extractor version, mode, page).
+    
+    Layout: <cache>/pdf-pages/<key[:2]>/<key>/<mode>-<page>.json, plus the
+    page count, so a fully cached run never opens the PDF. Reads bump an
+    entry's mtime; evict() removes least recently used entries once the cache
+    exceeds max_bytes (ASK_PDF_CACHE_MB, default 256). The total size is kept
+    in usage.json, so entries are only scanned when it may be over budget.
+    """
+    
+    def __init__(self, root: Path | None = None, max_bytes: int | None = None):
+        self.root = root or get_cache_dir() / "pdf-pages"
+        self.max_bytes = get_cache_limit() if max_bytes is None else max_bytes
+        self.written = 0  # bytes put() since the last evict()
+    
+    def file_key(self, pdf_path: str) -> str:
+        """Key for a PDF's entries: its SHA-256 (memoized by path, mtime and size) and EXTRACTOR_VERSION."""
+        st = os.stat(pdf_path)
+        sig = [st.st_mtime_ns, st.st_size]
+        memo_path = self.root / "files.json"
+        try:
+            memo = json.loads(memo_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            memo = {}
+        path = str(Path(pdf_path).resolve())
+        if memo.get(path, [None])[:2] == sig:
+            content = memo[path][2]
+        else:
+            digest = hashlib.sha256()
+            with open(pdf_path, "rb") as f:
+                for block in iter(lambda: f.read(1 << 20), b""):
+                    digest.update(block)
+            content = digest.hexdigest()
+            memo[path] = sig + [content]
+            self._write(memo_path, memo)
+        return hashlib.sha256(f"{content}:{EXTRACTOR_VERSION}".encode("utf-8")).hexdigest()
+    
+    def _entry(self, key: str, name: str) -> Path:
+        return self.root / key[:2] / key / f"{name}.json"
+    
+    def _write(self, path: Path, value) -> int:
+        """Write value as JSON atomically. Returns bytes written."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        data = json.dumps(value).encode("utf-8")
+        tmp.write_bytes(data)
+        os.replace(tmp, path)
+        return len(data)
+    
+    def has(self, key: str, mode: str, index: int) -> bool:
+        return self._entry(key, f"{mode}-{index + 1}").exists()
+    
+    def get(self, key: str, mode: str | None, index: int | None = None):
+        """Cached result (None when missing). mode=None reads the page count."""
+        path = self._entry(key, "pages" if mode is None else f"{mode}-{index + 1}")
+        try:
+            value = json.loads(path.read_text(encoding="utf-8"))
+            os.utime(path)  # mark as recently used
+        except (OSError, ValueError):
+            return None
+        return value
+    
+    def put(self, key: str, mode: str | None, index: int | None, value) -> None:
+        self.written += self._write(self._entry(key, "pages" if mode is None else f"{mode}-{index + 1}"), value)
+    
+    def _read_usage(self) -> int | None:
+        try:
+            return int(json.loads((self.root / "usage.json").read_text(encoding="utf-8")))
+        except (OSError, ValueError, TypeError):
+            return None
+    
+    def evict(self) -> int:
+        """
+        Delete least recently used entries until the cache fits. Returns entries removed.
+        
+        Scans the cache only when the recorded usage plus this run's writes
+        may exceed max_bytes (or nothing is recorded yet). Overwrites and
+        concurrent runs make the recorded usage approximate; every scan
+        records the exact total again.
+        """
+        usage = self._read_usage()
+        if usage is not None and usage + self.written <= self.max_bytes:
+            if self.written:
+                self._write(self.root / "usage.json", usage + self.written)
+                self.written = 0
+            return 0
+        
+        entries = []
+        total = 0
+        for bucket in os.scandir(self.root) if self.root.is_dir() else ():
+            if not bucket.is_dir():
+                continue
+            for doc in os.scandir(bucket.path):
+                for entry in os.scandir(doc.path):
+                    st = entry.stat()
+                    entries.append((st.st_mtime_ns, st.st_size, entry.path))
+                    total += st.st_size
+        
+        removed = 0
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            os.unlink(path)
+            total -= size
+            removed += 1
+            try:
+                os.rmdir(os.path.dirname(path))  # drop emptied document directories
+            except OSError:
+                pass
+        self._write(self.root / "usage.json", total)
+        self.written = 0
+        return removed
+
+
+def _extract_indices(pdf_path: str, mode: str, page_indices: list[int], jobs: int) -> Iterator[tuple[int, object]]:
+    """Extract pages (0-indexed) in order, serially or sharded across worker processes."""
+    if not page_indices:
+        return
+    if jobs <= 1 or len(page_indices) < 2:
+        extract = EXTRACTORS[mode]
+        with pdfplumber.open(pdf_path) as pdf:
+            for i in page_indices:
+                page = pdf.pages[i]
+                result = extract(page)
+                page.close()
+                yield i, result
+        return
+    
+    tasks = ((mode, chunk) for chunk in _chunks(page_indices, jobs))
+    with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker, initargs=(pdf_path,)) as pool:
+        for chunk in _ordered_map(pool, _extract_chunk, tasks, window=jobs * 2):
+            yield from chunk
+
+
+def iter_pages(pdf_path: str, mode: str = "text", pages: list[int] | None = None,
+               jobs: int = 1, cache: PageCache | None = None) -> Iterator[tuple[int, object]]:
+    """
+    Yield (page number, result) as each page is extracted, in page order.
+    
+    Pages are closed (their parsed objects dropped) as soon as they are
+    extracted, so memory stays flat however long the document is.
+    
+    Args:
+        pdf_path: Path to the PDF file
+        mode: Extraction mode (a key of EXTRACTORS)
+        pages: Optional list of page numbers (1-indexed) to extract
+        jobs: Worker processes; page ranges are sharded across them and
+              the output is identical to (and in the same order as) jobs=1
+        cache: Optional PageCache; only pages missing from it are extracted
+    """
+    key = total = None
+    if cache:
+        key = cache.file_key(pdf_path)
+        total = cache.get(key, None)
+    if total is None:
+        with pdfplumber.open(pdf_path) as pdf:
+            total = len(pdf.pages)
+        if cache:
+            cache.put(key, None, None, total)
+    
+    page_indices = _page_indices(total, pages)
+    cached = {i for i in page_indices if cache.has(key, mode, i)} if cache else set()
+    extracted = _extract_indices(pdf_path, mode, [i for i in page_indices if i not in cached], jobs)
+    
+    for i in page_indices:
+        if i in cached:
+            result = cache.get(key, mode, i)
+            if result is None:
+                # Evicted by a concurrent run since has(): extract just this page
+                _, result = next(_extract_indices(pdf_path, mode, [i], 1))
+        else:
+            _, result = next(extracted)
+            if cache:
+                cache.put(key, mode, i, result)
+        yield i + 1, result
+    
+    if cache:
+        cache.evict()
+
+
+def iter_page_text(pdf_path: str, pages: list[int] | None = None, jobs: int = 1,
+                   cache: PageCache | None = None) -> Iterator[tuple[int, str]]:
+    """Yield (page number, text) as each page is extracted (see iter_pages)."""
+    return iter_pages(pdf_path, "text", pages, jobs, cache)
+
+
+def iter_tables(pdf_path: str, pages: list[int] | None = None, jobs: int = 1,
+                cache: PageCache | None = None) -> Iterator[tuple[int, int, list[list]]]:
+    """Yield (page number, table index on the page, rows) for every table, in page order."""
+    for page_num, tables in iter_pages(pdf_path, "tables", pages, jobs, cache):
+        for index, rows in enumerate(tables, 1):
+            yield page_num, index, rows
+
+
+def write_pages(results: Iterable[tuple[int, str]], out: TextIO) -> int:
+    """Write pages as they arrive, flushing after each one. Returns pages written."""
+    written = 0
+    for page_num, text in results:
+        if not text:
+            continue
+        out.write(f"{PAGE_SEPARATOR if written else ''}--- Page {page_num} ---\n{text}")
+        out.flush()
+        written += 1
+    return written
+
+
+def write_tables(tables: Iterable[tuple[int, int, list[list]]], out: TextIO, fmt: str = "csv") -> int:
+    """
+    Write table rows as they arrive, tagged with page, table and row number.
+    
+    CSV rows are page, table, row, then the cells (no header: tables differ
+    in width); JSONL lines are {"page", "table", "row", "cells"}. Returns
+    tables written.
+    """
+    writer = csv.writer(out) if fmt == "csv" else None
+    written = 0
+    for page_num, index, rows in tables:
+        for row_num, cells in enumerate(rows, 1):
+            cells = ["" if cell is None else cell for cell in cells]
+            if writer:
+                writer.writerow([page_num, index, row_num, *cells])
+            else:
+                out.write(json.dumps({"page": page_num, "table": index, "row": row_num, "cells": cells}) + "\n")
+        out.flush()
+        written += 1
+    return written
+
+
+def parse_pages(spec: str) -> list[int]:
+    """Parse a page selection like "1,3,5" or "1-50,60" (1-indexed, order kept)."""
+    pages = []
+    for part in spec.split(","):
+        part = part.strip()
+        if "-" in part:
+            first, last = (int(p) for p in part.split("-", 1))
+            pages.extend(range(first, last + 1))
+        else:
+            pages.append(int(part))
+    return pages
+
+
+def extract_text(pdf_path: str, pages: list[int] | None = None, jobs: int = 1) -> str:
     """
     Extract text from a PDF file.
     
     Args:
         pdf_path: Path to the PDF file
         pages: Optional list of page numbers (1-indexed) to extract
+        jobs: Worker processes (see iter_page_text)
         
     Returns:
         Extracted text as a string
     """
-    extracted = []
-    
-    with pdfplumber.open(pdf_path) as pdf:
-        total_pages = len(pdf.pages)
-        
-        if pages:
-            # Convert to 0-indexed and validate
-            page_indices = [p - 1 for p in pages if 0 < p <= total_pages]
-        else:
-            page_indices = range(total_pages)
-        
-        for i in page_indices:
-            page = pdf.pages[i]
-            text = page.extract_text()
-            if text:
-                extracted.append(f"--- Page {i + 1} ---\n{text}")
-    
-    return "\n\n".join(extracted)
+    return PAGE_SEPARATOR.join(
+        f"--- Page {page_num} ---\n{text}" for page_num, text in iter_page_text(pdf_path, pages, jobs) if text
+    )
 
 
 def extract_tables(pdf_path: str, page_num: int = 1) -> list[list]:
     """
-    Extract tables from a specific page.
+    Extract tables from a specific page (see iter_tables for page ranges).
     
     Args:
         pdf_path: Path to the PDF file
@@ -82,12 +423,29 @@ def main():
     parser.add_argument("--output", "-o", help="Output text file (default: stdout)")
     parser.add_argument(
         "--pages", "-p",
-        help="Comma-separated page numbers to extract (e.g., 1,3,5)"
+        help="Pages to extract: numbers and ranges (e.g., 1,3,5 or 1-50,60)"
+    )
+    parser.add_argument(
+        "--jobs", "-j",
+        type=int,
+        default=1,
+        help="Worker processes (0 = one per CPU; default: 1)"
     )
     parser.add_argument(
         "--tables", "-t",
         action="store_true",
-        help="Extract tables instead of text"
+        help="Extract tables (all selected pages) instead of text"
+    )
+    parser.add_argument(
+        "--format", "-f",
+        choices=["csv", "jsonl"],
+        default="csv",
+        help="Table output format (default: csv)"
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Don't read or write the per-page extraction cache"
     )
     
     args = parser.parse_args()
@@ -102,24 +460,32 @@ def main():
     pages = None
     if args.pages:
         try:
-            pages = [int(p.strip()) for p in args.pages.split(",")]
+            pages = parse_pages(args.pages)
         except ValueError:
             print("Error: Invalid page numbers", file=sys.stderr)
             sys.exit(1)
     
-    # Extract content
-    if args.tables:
-        tables = extract_tables(str(input_path), pages[0] if pages else 1)
-        result = "\n".join(str(table) for table in tables)
-    else:
-        result = extract_text(str(input_path), pages)
+    # Stream pages (or table rows) to the output as they are extracted
+    jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+    cache = None if args.no_cache else PageCache()
+    out = open(args.output, "w", encoding="utf-8", newline="") if args.output else sys.stdout
+    try:
+        if args.tables:
+            write_tables(iter_tables(str(input_path), pages, jobs=jobs, cache=cache), out, args.format)
+        else:
+            write_pages(iter_page_text(str(input_path), pages, jobs=jobs, cache=cache), out)
+            if not args.output:
+                print()
+    except BrokenPipeError:
+        # Downstream stopped reading (e.g. `| head`): exit quietly
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        sys.exit(1)
+    finally:
+        if args.output:
+            out.close()
     
-    # Output
     if args.output:
-        Path(args.output).write_text(result, encoding="utf-8")
-        print(f"Extracted text saved to: {args.output}")
-    else:
-        print(result)
+        print(f"Extracted {'tables' if args.tables else 'text'} saved to: {args.output}")
 
 
 if __name__ == "__main__":
@@ -5,6 +5,7 @@ Fill PDF form fields using pypdf.
 Usage:
     python fill_form.py template.pdf --data data.json --output filled.pdf
     python fill_form.py template.pdf --list-fields
+    python fill_form.py template.pdf --records data.jsonl --output-pattern "out/{id}.pdf" [--jobs N]
 
 Examples:
     # List all form fields in a PDF
@@ -15,19 +16,109 @@ Examples:
     
     # Fill form with inline data
     python fill_form.py form.pdf --field "name=John Doe" --field "email=john@example.com" -o filled.pdf
+    
+    # Batch: one filled PDF per CSV/JSONL record, across 8 worker processes
+    python fill_form.py form.pdf --records applicants.csv --output-pattern "out/{id}.pdf" --jobs 8
+    
+    # Map source data onto PDF field names with a mapping from the reference
+    python fill_form.py application.pdf --mapping reference/form_mappings.yaml --form-type application \\
+        --records applicants.jsonl --output-pattern "out/{index}.pdf"
 """
 
 import argparse
+import csv
 import json
+import os
+import re
 import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, datetime
 from pathlib import Path
 
 try:
     from pypdf import PdfReader, PdfWriter
 except ImportError:
-    print("Error: pypdf not installed. Run: pip install pypdf")
+    print("Error: pypdf not installed. Run: pip install pypdf (or 'ask deps', then use 'ask run')")
     sys.exit(1)
 
+# Named validation rules usable in mappings (see reference/form_mappings.yaml)
+VALIDATIONS = {
+    "email": r"^[\w.-]+@[\w.-]+\.\w+$",
+    "phone": r"^\+?1?[-.\s]?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}$",
+    "zip": r"^\d{5}(-\d{4})?$",
+    "date": r"^\d{2}/\d{2}/\d{4}$",
+    "ssn": r"^\d{3}-\d{2}-\d{4}$",
+}
+TRUE_VALUES = {"1", "true", "yes", "y", "on", "x"}
+
+
+def _qualified_name(field) -> str:
+    """Full field name: the /T names of the field and its parents, joined by dots."""
+    names = []
+    while field is not None:
+        if "/T" in field:
+            names.append(str(field["/T"]))
+        field = field.get("/Parent")
+        field = field.get_object() if field is not None else None
+    return ".".join(reversed(names))
+
+
+def _inherited(field, key: str, default=None):
+    """Look up a field attribute, following /Parent like PDF viewers do."""
+    while field is not None:
+        if key in field:
+            return field[key]
+        field = field.get("/Parent")
+        field = field.get_object() if field is not None else None
+    return default
+
+
+def build_field_index(reader: PdfReader) -> dict:
+    """
+    Index a form's fields by walking every page's widget annotations once.
+    
+    Args:
+        reader: Parsed template
+        
+    Returns:
+        {"fields": {qualified name: {"type", "value", "options", "pages"}},
+         "pages": {field name: [page indices]}}. "pages" is keyed by both the
+        qualified and the partial (/T) name, the two names pypdf fills by.
+    """
+    fields = {}
+    pages = {}
+    for page_index, page in enumerate(reader.pages):
+        for annotation in page.get("/Annots") or []:
+            annotation = annotation.get_object()
+            if annotation.get("/Subtype") != "/Widget":
+                continue
+            # Same rule pypdf uses to find the field a widget belongs to
+            if "/FT" in annotation and "/T" in annotation:
+                field = annotation
+            else:
+                field = annotation.get("/Parent")
+                field = field.get_object() if field is not None else None
+            if field is None or "/T" not in field:
+                continue
+            
+            name = _qualified_name(field)
+            if name not in fields:
+                fields[name] = {
+                    "type": str(_inherited(field, "/FT", "Unknown")),
+                    "value": str(_inherited(field, "/V", "")),
+                    "options": _inherited(field, "/Opt", []),
+                    "pages": [],
+                }
+            if page_index not in fields[name]["pages"]:
+                fields[name]["pages"].append(page_index)
+            for key in {name, str(field["/T"])}:
+                key_pages = pages.setdefault(key, [])
+                if page_index not in key_pages:
+                    key_pages.append(page_index)
+    
+    return {"fields": fields, "pages": pages}
+
 
 def list_form_fields(pdf_path: str) -> dict:
     """
@@ -37,23 +128,44 @@ def list_form_fields(pdf_path: str) -> dict:
         pdf_path: Path to the PDF file
         
     Returns:
-        Dictionary of field names and their info
+        Dictionary of field names and their info (type, value, options and
+        the 1-based pages holding the field's widgets)
     """
-    reader = PdfReader(pdf_path)
-    fields = reader.get_fields()
+    result = {}
+    for name, info in build_field_index(PdfReader(pdf_path))["fields"].items():
+        result[name] = {**info, "pages": [index + 1 for index in info["pages"]]}
+    return result
+
+
+def _write_filled(
+    reader: PdfReader,
+    output_path: str,
+    field_data: dict,
+    flatten: bool = False,
+    index: dict | None = None
+) -> None:
+    """Write a filled copy of an already parsed template."""
+    if index is None:
+        index = build_field_index(reader)
     
-    if not fields:
-        return {}
+    # Only pages holding a requested field are touched, each with just its own fields
+    page_fields = {}
+    for name, value in field_data.items():
+        for page_index in index["pages"].get(name, ()):
+            page_fields.setdefault(page_index, {})[name] = value
     
-    result = {}
-    for name, info in fields.items():
-        result[name] = {
-            "type": str(info.get("/FT", "Unknown")),
-            "value": str(info.get("/V", "")),
-            "options": info.get("/Opt", [])
-        }
+    # Cloning reuses the reader's parsed objects, so a template is parsed only once
+    writer = PdfWriter(clone_from=reader)
+    for page_index in sorted(page_fields):
+        writer.update_page_form_field_values(writer.pages[page_index], page_fields[page_index])
     
-    return result
+    # Optionally flatten
+    if flatten:
+        for page in writer.pages:
+            page.annotations = None
+    
+    with open(output_path, "wb") as f:
+        writer.write(f)
 
 
 def fill_form(
@@ -71,23 +183,282 @@ def fill_form(
         field_data: Dictionary of field names and values
         flatten: Whether to flatten the form (make fields non-editable)
     """
-    reader = PdfReader(template_path)
-    writer = PdfWriter()
+    _write_filled(PdfReader(template_path), output_path, field_data, flatten)
+
+
+def load_records(records_path: str) -> list[dict]:
+    """Load batch records from a .csv (header row) or .jsonl file (one object per line)."""
+    with open(records_path, encoding="utf-8", newline="") as f:
+        if records_path.lower().endswith(".csv"):
+            return list(csv.DictReader(f))
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def load_mapping(mapping_path: str, form_type: str | None = None) -> dict:
+    """
+    Load a form mapping ({"form_type": ..., "fields": [...]}).
     
-    # Clone the template
-    writer.append(reader)
+    Args:
+        mapping_path: JSON or YAML file, or a Markdown document with ```yaml
+                      blocks such as reference/form_mappings.yaml
+        form_type: Which mapping to use when the file defines several
+        
+    Returns:
+        The mapping definition
+    """
+    text = Path(mapping_path).read_text(encoding="utf-8")
+    if mapping_path.lower().endswith(".json"):
+        documents = [json.loads(text)]
+    else:
+        try:
+            import yaml
+        except ImportError:
+            raise ValueError("pyyaml is required for YAML mappings (pip install pyyaml); JSON mappings work without it")
+        blocks = re.findall(r"^```ya?ml[ \t]*\n(.*?)^```", text, re.M | re.S) or [text]
+        try:
+            documents = [yaml.safe_load(block) for block in blocks]
+        except yaml.YAMLError as e:
+            raise ValueError(f"invalid YAML: {e}")
     
-    # Fill fields on each page
-    for page in writer.pages:
-        writer.update_page_form_field_values(page, field_data)
+    mappings = [doc for doc in documents if isinstance(doc, dict) and "fields" in doc]
+    if form_type:
+        mappings = [mapping for mapping in mappings if mapping.get("form_type") == form_type]
+    if not mappings:
+        suffix = f" for form type '{form_type}'" if form_type else ""
+        raise ValueError(f"no mapping{suffix} in {mapping_path}")
+    if len(mappings) > 1:
+        types = ", ".join(str(mapping.get("form_type")) for mapping in mappings)
+        raise ValueError(f"{mapping_path} defines several mappings ({types}); pick one with --form-type")
+    return mappings[0]
+
+
+def _source_path(source: str) -> tuple:
+    """Split 'items[0].description' into ("items", 0, "description")."""
+    return tuple(
+        int(part[1:-1]) if part.startswith("[") else part
+        for part in re.findall(r"\[\d+\]|[^.\[\]]+", source)
+    )
+
+
+def _lookup(record: dict, source: str, path: tuple):
+    # Flat records (CSV) may name their columns "address.city" outright
+    if source in record:
+        return record[source]
+    value = record
+    for key in path:
+        try:
+            value = value[key]
+        except (KeyError, IndexError, TypeError):
+            return None
+    return value
+
+
+def _as_number(value):
+    if isinstance(value, str):
+        for number in (int, float):
+            try:
+                return number(value)
+            except ValueError:
+                pass
+    return value
+
+
+def _as_date(value) -> date:
+    if isinstance(value, date):
+        return value
+    return datetime.fromisoformat(str(value))
+
+
+def _compile_format(fmt: str):
+    """Turn a mapping's format into a converter: "{:06d}", "%B %d, %Y", "(###) ###-####" or "MM/DD/YYYY"."""
+    if "{" in fmt:
+        return lambda value: fmt.format(_as_number(value))
+    if "%" in fmt:
+        return lambda value: _as_date(value).strftime(fmt)
+    if "#" in fmt:
+        def mask(value):
+            digits = [c for c in str(value) if c.isdigit()]
+            if len(digits) != fmt.count("#"):
+                raise ValueError(f"{value!r} does not fit format {fmt!r}")
+            digits = iter(digits)
+            return "".join(next(digits) if c == "#" else c for c in fmt)
+        return mask
     
-    # Optionally flatten
-    if flatten:
-        for page in writer.pages:
-            page.annotations = None
+    strftime = fmt
+    for token, code in (("YYYY", "%Y"), ("YY", "%y"), ("MM", "%m"), ("DD", "%d")):
+        strftime = strftime.replace(token, code)
+    if strftime == fmt:
+        raise ValueError(f"unsupported format {fmt!r}")
+    return lambda value: _as_date(value).strftime(strftime)
+
+
+def _compile_field(spec: dict):
+    """Build the converter from a source value to the PDF field's value."""
+    name = spec["pdf_field"]
+    if spec.get("type") == "checkbox":
+        checked = "/" + str(spec.get("checked_value", "Yes")).lstrip("/")
+        unchecked = "/" + str(spec.get("unchecked_value", "Off")).lstrip("/")
+        def checkbox(value):
+            if isinstance(value, str):
+                value = value.strip().lower() in TRUE_VALUES
+            return checked if value else unchecked
+        return checkbox
     
-    with open(output_path, "wb") as f:
-        writer.write(f)
+    fmt = _compile_format(str(spec["format"])) if spec.get("format") else str
+    validation = spec.get("validation")
+    pattern = re.compile(VALIDATIONS.get(validation, validation)) if validation else None
+    options = [str(option) for option in spec.get("options") or []]
+    max_length = spec.get("max_length")
+    
+    def convert(value):
+        if pattern and not pattern.search(str(value)):
+            raise ValueError(f"{name}: {value!r} fails validation '{validation}'")
+        text = fmt(value)
+        if options and text not in options:
+            raise ValueError(f"{name}: {text!r} is not one of {options}")
+        return text[:max_length] if max_length else text
+    return convert
+
+
+def compile_mapping(mapping: dict) -> list[tuple]:
+    """
+    Precompile a mapping's field rules once, so applying it to each record
+    is only lookups and conversions.
+    
+    Args:
+        mapping: Definition from load_mapping()
+        
+    Returns:
+        Rules for apply_mapping()
+    """
+    rules = []
+    for spec in mapping.get("fields") or []:
+        if not isinstance(spec, dict) or "pdf_field" not in spec:
+            raise ValueError(f"mapping field without pdf_field: {spec!r}")
+        if "compute" in spec:
+            raise ValueError(f"{spec['pdf_field']}: computed fields are not supported")
+        source = spec.get("source")
+        rules.append((
+            spec["pdf_field"],
+            source,
+            _source_path(source) if source else (),
+            spec.get("default"),
+            bool(spec.get("required")),
+            _compile_field(spec),
+        ))
+    return rules
+
+
+def apply_mapping(rules: list[tuple], record: dict) -> dict:
+    """
+    Map a source record to PDF field values.
+    
+    Args:
+        rules: Output of compile_mapping()
+        record: Source data, e.g. {"address": {"city": "Austin"}}
+        
+    Returns:
+        Dictionary of PDF field names and values; fields with no value and
+        no default are left out
+        
+    Raises:
+        ValueError: A required field is missing or a value fails its rules
+    """
+    field_data = {}
+    for pdf_field, source, path, default, required, convert in rules:
+        value = _lookup(record, source, path) if source else None
+        if value is None or value == "":
+            value = default
+        if value is None or value == "":
+            if required:
+                raise ValueError(f"missing required field '{source or pdf_field}'")
+            continue
+        field_data[pdf_field] = convert(value)
+    return field_data
+
+
+# Template parsed and indexed once in each worker process (see _init_worker)
+_worker_template = None
+_worker_index = None
+
+
+def _init_worker(template_path: str) -> None:
+    global _worker_template, _worker_index
+    _worker_template = PdfReader(template_path)
+    _worker_index = build_field_index(_worker_template)
+
+
+def _fill_record(task: tuple) -> tuple[int, str | None]:
+    """Fill one batch record; failures are returned, not raised, so the batch goes on."""
+    index, output_path, field_data, flatten = task
+    try:
+        Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+        _write_filled(_worker_template, output_path, field_data, flatten, _worker_index)
+    except Exception as e:
+        return index, f"{type(e).__name__}: {e}"
+    return index, None
+
+
+def fill_batch(
+    template_path: str,
+    records: list[dict],
+    output_pattern: str,
+    jobs: int = 1,
+    flatten: bool = False,
+    rules: list[tuple] | None = None,
+    defaults: dict | None = None
+) -> dict:
+    """
+    Fill one PDF per record.
+    
+    Args:
+        template_path: Path to the template PDF (parsed once per worker)
+        records: Field data per output PDF, or source data when rules are given
+        output_pattern: Output path, formatted with the record's fields plus
+                        {index} (1-based), e.g. "out/{id}.pdf"
+        jobs: Worker processes
+        flatten: Whether to flatten the forms
+        rules: Compiled mapping (see compile_mapping) applied to each record
+        defaults: Field values used where a record leaves a field out
+        
+    Returns:
+        {"filled": count, "failed": [(index, error), ...], "seconds": elapsed}
+    """
+    start = time.perf_counter()
+    failed = []
+    tasks = []
+    for index, record in enumerate(records, 1):
+        try:
+            output_path = output_pattern.format_map({**record, "index": index})
+        except (KeyError, IndexError, ValueError) as e:
+            failed.append((index, f"output pattern: {type(e).__name__}: {e}"))
+            continue
+        values = record
+        if rules is not None:
+            try:
+                values = apply_mapping(rules, record)
+            except (ValueError, TypeError) as e:
+                failed.append((index, f"mapping: {e}"))
+                continue
+        field_data = {
+            name: "" if value is None else str(value)
+            for name, value in {**(defaults or {}), **values}.items()
+        }
+        tasks.append((index, output_path, field_data, flatten))
+    
+    if jobs <= 1:
+        _init_worker(template_path)
+        results = list(map(_fill_record, tasks))
+    else:
+        with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker, initargs=(template_path,)) as pool:
+            results = list(pool.map(_fill_record, tasks, chunksize=max(1, len(tasks) // (jobs * 8))))
+    
+    fill_failures = [(index, error) for index, error in results if error]
+    return {
+        "filled": len(tasks) - len(fill_failures),
+        "failed": sorted(failed + fill_failures),
+        "seconds": time.perf_counter() - start,
+    }
 
 
 def parse_field_args(field_args: list[str]) -> dict:
@@ -127,6 +498,22 @@ def main():
         action="store_true",
         help="Flatten form after filling (make non-editable)"
     )
+    parser.add_argument(
+        "--mapping", "-m",
+        help="Form mapping (JSON, YAML or reference/form_mappings.yaml) from source data to PDF fields"
+    )
+    parser.add_argument("--form-type", help="Mapping to use when --mapping defines several")
+    parser.add_argument("--records", "-r", help="Batch mode: CSV or JSONL file, one form per record")
+    parser.add_argument(
+        "--output-pattern",
+        help="Batch output path with {field} placeholders and {index}, e.g. 'out/{id}.pdf'"
+    )
+    parser.add_argument(
+        "--jobs", "-j",
+        type=int,
+        default=1,
+        help="Batch worker processes (0 = one per CPU; default: 1)"
+    )
     
     args = parser.parse_args()
     
@@ -147,15 +534,20 @@ def main():
                 print(f"  Field: {name}")
                 print(f"    Type:  {info['type']}")
                 print(f"    Value: {info['value'] or '(empty)'}")
+                print(f"    Pages: {', '.join(map(str, info['pages']))}")
                 if info['options']:
                     print(f"    Options: {info['options']}")
                 print()
         return
     
-    # Fill mode requires output
-    if not args.output:
-        print("Error: --output is required when filling forms", file=sys.stderr)
-        sys.exit(1)
+    # Compile the mapping once, for one form or a whole batch
+    rules = None
+    if args.mapping:
+        try:
+            rules = compile_mapping(load_mapping(args.mapping, args.form_type))
+        except (OSError, ValueError) as e:
+            print(f"Error: Cannot load mapping: {e}", file=sys.stderr)
+            sys.exit(1)
     
     # Gather field data
     field_data = {}
@@ -167,10 +559,46 @@ def main():
             sys.exit(1)
         with open(data_path, encoding="utf-8") as f:
             field_data = json.load(f)
+        
+        # In batch mode the mapping applies to the records; --data holds field defaults
+        if rules is not None and not args.records:
+            try:
+                field_data = apply_mapping(rules, field_data)
+            except (ValueError, TypeError) as e:
+                print(f"Error: {e}", file=sys.stderr)
+                sys.exit(1)
     
     # Command-line fields override JSON
     field_data.update(parse_field_args(args.field))
     
+    # Batch mode
+    if args.records:
+        if not args.output_pattern:
+            print("Error: --output-pattern is required with --records", file=sys.stderr)
+            sys.exit(1)
+        try:
+            records = load_records(args.records)
+        except (OSError, ValueError) as e:
+            print(f"Error: Cannot read records: {e}", file=sys.stderr)
+            sys.exit(1)
+        
+        # --data/--field values act as defaults for every record
+        jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+        report = fill_batch(str(input_path), records, args.output_pattern, jobs, args.flatten, rules, field_data)
+        for index, error in report["failed"]:
+            print(f"  Record {index}: {error}", file=sys.stderr)
+        rate = report["filled"] / report["seconds"] if report["seconds"] else 0.0
+        print(f"Filled {report['filled']}/{len(records)} form(s) in {report['seconds']:.1f}s "
+              f"({rate:.1f} forms/s, {len(report['failed'])} failed)")
+        if report["failed"]:
+            sys.exit(1)
+        return
+    
+    # Fill mode requires output
+    if not args.output:
+        print("Error: --output is required when filling forms", file=sys.stderr)
+        sys.exit(1)
+    
     if not field_data:
         print("Error: No field data provided (use --data or --field)", file=sys.stderr)
         sys.exit(1)
@@ -14,18 +14,54 @@ Examples:
     
     # Merge specific pages
     python merge_pdfs.py "doc1.pdf:1-3" "doc2.pdf:5" -o partial.pdf
+    
+    # Thousands of inputs: write pages as they are read, with bounded memory
+    python merge_pdfs.py scans/*.pdf --stream -o archive.pdf
+    
+    # Many merge jobs from a manifest, 8 at a time
+    python merge_pdfs.py --manifest jobs.yaml --jobs 8
+
+Manifest (YAML list, JSON, or JSONL with one job per line):
+    - output: out/packet-0001.pdf
+      bookmarks: true
+      inputs:
+        - cover.pdf
+        - "scans/0001.pdf:1-3,5"
+        - {path: appendix.pdf, pages: "2-4", bookmark: "Appendix"}
 """
 
 import argparse
+import hashlib
+import json
+import os
 import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from io import BytesIO
 from pathlib import Path
 
 try:
     from pypdf import PdfReader, PdfWriter
+    from pypdf.generic import (
+        ArrayObject,
+        DictionaryObject,
+        IndirectObject,
+        NameObject,
+        NullObject,
+        NumberObject,
+        StreamObject,
+        TextStringObject,
+    )
 except ImportError:
-    print("Error: pypdf not installed. Run: pip install pypdf")
+    print("Error: pypdf not installed. Run: pip install pypdf (or 'ask deps', then use 'ask run')")
     sys.exit(1)
 
+# Page entries not carried over: links into the source's page tree, structure
+# tree and article threads, which would drag in the rest of the document
+PAGE_EXCLUDED_KEYS = {"/Parent", "/StructParents", "/B"}
+# Objects only a whole document owns; references to them become null
+DOCUMENT_TYPES = {"/Pages", "/Catalog", "/Page"}
+
 
 def parse_page_spec(spec: str) -> tuple[str, list[int] | None]:
     """
@@ -46,6 +82,11 @@ def parse_page_spec(spec: str) -> tuple[str, list[int] | None]:
     if len(pages_str) > 0 and not pages_str[0].isdigit():
         return spec, None
     
+    return path, parse_pages(pages_str)
+
+
+def parse_pages(pages_str: str) -> list[int]:
+    """Parse a page list like '1-3,5' into [1, 2, 3, 5]."""
     pages = []
     for part in pages_str.split(","):
         part = part.strip()
@@ -54,43 +95,284 @@ def parse_page_spec(spec: str) -> tuple[str, list[int] | None]:
             pages.extend(range(int(start), int(end) + 1))
         else:
             pages.append(int(part))
+    return pages
+
+
+def resolve_input(spec: str | dict) -> tuple[str, list[int] | None, str]:
+    """
+    Normalize an input to (path, pages or None for all, bookmark title).
     
-    return path, pages
+    Args:
+        spec: 'file.pdf:1-3,5', or a manifest entry
+              {"path": ..., "pages": "1-3,5" or [1, 2], "bookmark": ...}
+    """
+    if isinstance(spec, dict):
+        path = str(spec["path"])
+        pages = spec.get("pages")
+        if isinstance(pages, (str, int)):
+            pages = parse_pages(str(pages))
+        title = spec.get("bookmark")
+    else:
+        path, pages = parse_page_spec(spec)
+        title = None
+    return path, pages or None, str(title) if title else Path(path).stem
 
 
-def merge_pdfs(
-    pdf_specs: list[str],
+class StreamingMerger:
+    """
+    Write a merged PDF incrementally.
+    
+    Each object is serialized to the output as soon as it is copied, so only
+    the input currently being read is held in memory. Objects whose bytes
+    are identical once renumbered (fonts, letterheads, repeated images) are
+    written once; the dedup table keeps just a digest and an object number
+    per object, instead of a pass over the whole document at the end.
+    """
+    
+    CATALOG, PAGES = 1, 2
+    
+    def __init__(self, output, dedupe: bool = True):
+        self.output = output
+        self.offsets = {}
+        self.next_num = 3
+        self.kids = []
+        self.outline = []
+        self.digests = {} if dedupe else None
+        self.deduplicated = 0
+        output.write(b"%PDF-1.7\n%\xe2\xe3\xcf\xd3\n")
+    
+    def _allocate(self) -> int:
+        num = self.next_num
+        self.next_num += 1
+        return num
+    
+    def _write(self, num: int, body: bytes) -> None:
+        self.offsets[num] = self.output.tell()
+        self.output.write(b"%d 0 obj\n%s\nendobj\n" % (num, body))
+    
+    def _store(self, body: bytes) -> int:
+        """Write an object unless identical bytes were already written; return its number."""
+        digest = None
+        if self.digests is not None:
+            digest = hashlib.blake2b(body, digest_size=16).digest()
+            num = self.digests.get(digest)
+            if num is not None:
+                self.deduplicated += 1
+                return num
+        num = self._allocate()
+        self._write(num, body)
+        if digest is not None:
+            self.digests[digest] = num
+        return num
+    
+    def _serialize(self, obj, excluded=(), parent: int | None = None) -> bytes:
+        if isinstance(obj, DictionaryObject):
+            copy = DictionaryObject({
+                key: self._copy(value) for key, value in obj.items()
+                if key not in excluded and not (key == "/Length" and isinstance(obj, StreamObject))
+            })
+            if parent is not None:
+                copy[NameObject("/Parent")] = IndirectObject(parent, 0, None)
+        else:
+            copy = self._copy(obj)
+        
+        buf = BytesIO()
+        if isinstance(obj, StreamObject):
+            data = obj._data  # raw bytes, still encoded with the stream's /Filter
+            copy[NameObject("/Length")] = NumberObject(len(data))
+            copy.write_to_stream(buf)
+            buf.write(b"\nstream\n")
+            buf.write(data)
+            buf.write(b"\nendstream")
+        else:
+            copy.write_to_stream(buf)
+        return buf.getvalue()
+    
+    def _copy(self, obj):
+        """Copy a direct object, renumbering the references it holds."""
+        if isinstance(obj, IndirectObject):
+            return self._copy_ref(obj)
+        if isinstance(obj, DictionaryObject):
+            return DictionaryObject({key: self._copy(value) for key, value in obj.items()})
+        if isinstance(obj, ArrayObject):
+            return ArrayObject(self._copy(value) for value in obj)
+        return obj
+    
+    def _copy_ref(self, ref: IndirectObject):
+        key = (ref.idnum, ref.generation)
+        if key in self._refs:
+            num = self._refs[key]
+            return NullObject() if num is None else IndirectObject(num, 0, None)
+        if key in self._pending:
+            # A reference cycle: the object needs its number before it is finished
+            num = self._forced.setdefault(key, self._allocate())
+            return IndirectObject(num, 0, None)
+        
+        obj = ref.get_object()
+        if isinstance(obj, DictionaryObject) and obj.get("/Type") in DOCUMENT_TYPES:
+            self._refs[key] = None
+            return NullObject()
+        
+        self._pending.add(key)
+        body = self._serialize(obj)
+        self._pending.discard(key)
+        num = self._forced.pop(key, None)
+        if num is None:
+            num = self._store(body)
+        else:
+            self._write(num, body)
+        self._refs[key] = num
+        return IndirectObject(num, 0, None)
+    
+    def add_pages(self, reader: PdfReader, indices, title: str | None = None) -> int:
+        """
+        Copy pages of one input and write them out.
+        
+        Args:
+            reader: Open input; it can be closed as soon as this returns
+            indices: 0-based page numbers, in output order
+            title: Bookmark title pointing at the first copied page
+            
+        Returns:
+            Number of pages added
+        """
+        # Reader-local object numbers -> output numbers (None: dropped)
+        self._refs, self._pending, self._forced = {}, set(), {}
+        selected = [(reader.pages[index], self._allocate()) for index in indices]
+        for page, num in selected:
+            if page.indirect_reference is not None:
+                self._refs.setdefault((page.indirect_reference.idnum, page.indirect_reference.generation), num)
+        
+        for page, num in selected:
+            self._write(num, self._serialize(page, PAGE_EXCLUDED_KEYS, parent=self.PAGES))
+            self.kids.append(num)
+        if title and selected:
+            self.outline.append((title, selected[0][1]))
+        
+        self._refs, self._pending, self._forced = {}, set(), {}
+        return len(selected)
+    
+    def close(self) -> int:
+        """Write the page tree, bookmarks, catalog and xref table; return the page count."""
+        ref = lambda num: IndirectObject(num, 0, None)
+        catalog = DictionaryObject({
+            NameObject("/Type"): NameObject("/Catalog"),
+            NameObject("/Pages"): ref(self.PAGES),
+        })
+        
+        if self.outline:
+            root = self._allocate()
+            items = [self._allocate() for _ in self.outline]
+            for position, ((title, page_num), num) in enumerate(zip(self.outline, items)):
+                item = DictionaryObject({
+                    NameObject("/Title"): TextStringObject(title),
+                    NameObject("/Parent"): ref(root),
+                    NameObject("/Dest"): ArrayObject([ref(page_num), NameObject("/Fit")]),
+                })
+                if position > 0:
+                    item[NameObject("/Prev")] = ref(items[position - 1])
+                if position < len(items) - 1:
+                    item[NameObject("/Next")] = ref(items[position + 1])
+                self._write_object(num, item)
+            self._write_object(root, DictionaryObject({
+                NameObject("/Type"): NameObject("/Outlines"),
+                NameObject("/First"): ref(items[0]),
+                NameObject("/Last"): ref(items[-1]),
+                NameObject("/Count"): NumberObject(len(items)),
+            }))
+            catalog[NameObject("/Outlines")] = ref(root)
+        
+        self._write_object(self.PAGES, DictionaryObject({
+            NameObject("/Type"): NameObject("/Pages"),
+            NameObject("/Kids"): ArrayObject(ref(num) for num in self.kids),
+            NameObject("/Count"): NumberObject(len(self.kids)),
+        }))
+        self._write_object(self.CATALOG, catalog)
+        
+        xref = self.output.tell()
+        self.output.write(b"xref\n0 %d\n0000000000 65535 f \n" % self.next_num)
+        for num in range(1, self.next_num):
+            offset = self.offsets.get(num)
+            self.output.write(b"%010d 00000 n \n" % offset if offset is not None else b"0000000000 65535 f \n")
+        self.output.write(b"trailer\n<< /Size %d /Root %d 0 R >>\nstartxref\n%d\n%%%%EOF\n"
+                          % (self.next_num, self.CATALOG, xref))
+        return len(self.kids)
+    
+    def _write_object(self, num: int, obj) -> None:
+        buf = BytesIO()
+        obj.write_to_stream(buf)
+        self._write(num, buf.getvalue())
+
+
+def stream_merge(
+    pdf_specs: list[str | dict],
     output_path: str,
     add_bookmarks: bool = False,
     compress: bool = True
+) -> int:
+    """
+    Merge PDFs one input at a time, writing pages as they are read.
+    
+    Same arguments and result as merge_pdfs(); peak memory is bounded by the
+    largest single input instead of the whole merge.
+    """
+    with open(output_path, "wb") as f:
+        merger = StreamingMerger(f, dedupe=compress)
+        for spec in pdf_specs:
+            path, pages, title = resolve_input(spec)
+            
+            if not Path(path).exists():
+                print(f"Warning: File not found, skipping: {path}", file=sys.stderr)
+                continue
+            
+            # A file handle, unlike a path, keeps pypdf from reading the whole file into memory
+            with open(path, "rb") as fh, PdfReader(fh) as reader:
+                count = len(reader.pages)
+                if pages:
+                    indices = [page_num - 1 for page_num in pages if 0 < page_num <= count]
+                else:
+                    indices = range(count)
+                merger.add_pages(reader, indices, title if add_bookmarks else None)
+        
+        return merger.close()
+
+
+def merge_pdfs(
+    pdf_specs: list[str | dict],
+    output_path: str,
+    add_bookmarks: bool = False,
+    compress: bool = True,
+    stream: bool = False
 ) -> int:
     """
     Merge multiple PDFs into one.
     
     Args:
-        pdf_specs: List of PDF paths (with optional page ranges)
+        pdf_specs: List of PDF paths (with optional page ranges) or manifest
+                   input entries (see resolve_input)
         output_path: Path for the merged PDF
         add_bookmarks: Add bookmarks for each source PDF
         compress: Compress identical objects
+        stream: Write pages as they are read (see stream_merge)
         
     Returns:
         Total number of pages in merged PDF
     """
+    if stream:
+        return stream_merge(pdf_specs, output_path, add_bookmarks, compress)
+    
     writer = PdfWriter()
     total_pages = 0
     
     for spec in pdf_specs:
-        path, pages = parse_page_spec(spec)
+        path, pages, title = resolve_input(spec)
         
         if not Path(path).exists():
             print(f"Warning: File not found, skipping: {path}", file=sys.stderr)
             continue
         
         reader = PdfReader(path)
-        file_name = Path(path).stem
-        
-        if add_bookmarks:
-            writer.add_outline_item(file_name, total_pages)
+        first_page = total_pages
         
         if pages:
             # Add specific pages (convert to 0-indexed)
@@ -103,6 +385,10 @@ def merge_pdfs(
             for page in reader.pages:
                 writer.add_page(page)
                 total_pages += 1
+        
+        # Bookmark once the pages exist, or the outline item has no destination
+        if add_bookmarks and total_pages > first_page:
+            writer.add_outline_item(title, first_page)
     
     if compress:
         writer.compress_identical_objects()
@@ -113,6 +399,179 @@ def merge_pdfs(
     return total_pages
 
 
+def load_manifest(manifest_path: str) -> list[dict]:
+    """
+    Load merge jobs from a manifest.
+    
+    Args:
+        manifest_path: .jsonl (one job per line), .json or YAML (a list of
+                       jobs, or {"jobs": [...]})
+        
+    Returns:
+        Jobs, with relative input and output paths resolved against the
+        manifest's directory
+    """
+    text = Path(manifest_path).read_text(encoding="utf-8")
+    suffix = Path(manifest_path).suffix.lower()
+    if suffix == ".jsonl":
+        jobs = [json.loads(line) for line in text.splitlines() if line.strip()]
+    elif suffix == ".json":
+        jobs = json.loads(text)
+    else:
+        try:
+            import yaml
+        except ImportError:
+            raise ValueError("pyyaml is required for YAML manifests (pip install pyyaml); JSON/JSONL work without it")
+        try:
+            jobs = yaml.safe_load(text)
+        except yaml.YAMLError as e:
+            raise ValueError(f"invalid YAML: {e}")
+    if isinstance(jobs, dict):
+        jobs = jobs.get("jobs")
+    if not isinstance(jobs, list) or not all(isinstance(job, dict) for job in jobs):
+        raise ValueError("a manifest is a list of jobs, each with 'output' and 'inputs'")
+    
+    base = Path(manifest_path).parent
+    resolve = lambda path: str(base / path)
+    for job in jobs:
+        if "output" in job:
+            job["output"] = resolve(job["output"])
+        inputs = job.get("inputs")
+        if isinstance(inputs, list):
+            job["inputs"] = [
+                {**spec, "path": resolve(spec["path"])} if isinstance(spec, dict) and "path" in spec
+                else resolve(spec) if isinstance(spec, str) else spec
+                for spec in inputs
+            ]
+    return jobs
+
+
+def inspect_pdf(path: str) -> dict:
+    """Open a PDF and report {"pages", "encrypted", "error"} without keeping it in memory."""
+    try:
+        with open(path, "rb") as fh, PdfReader(fh) as reader:
+            encrypted = reader.is_encrypted
+            try:
+                pages = len(reader.pages)
+            except Exception:
+                if encrypted:
+                    return {"pages": 0, "encrypted": True, "error": "encrypted (needs a password)"}
+                raise
+            return {"pages": pages, "encrypted": encrypted, "error": None}
+    except FileNotFoundError:
+        return {"pages": 0, "encrypted": False, "error": "not found"}
+    except Exception as e:
+        return {"pages": 0, "encrypted": False, "error": f"{type(e).__name__}: {e}"}
+
+
+def _job_inputs(job: dict) -> list[tuple[str, list[int] | None, str]]:
+    if not job.get("output"):
+        raise ValueError("no output")
+    inputs = job.get("inputs")
+    if not isinstance(inputs, list) or not inputs:
+        raise ValueError("no inputs")
+    return [resolve_input(spec) for spec in inputs]
+
+
+def validate_job(job: dict, inspected: dict) -> str | None:
+    """Check a job against pre-inspected inputs; return why it can't run, or None."""
+    try:
+        inputs = _job_inputs(job)
+    except (ValueError, KeyError, TypeError) as e:
+        return f"invalid job: {e}"
+    for path, pages, _ in inputs:
+        info = inspected[path]
+        if info["error"]:
+            return f"{path}: {info['error']}"
+        bad = [page for page in pages or () if not 0 < page <= info["pages"]]
+        if bad:
+            return f"{path}: page {bad[0]} out of range ({info['pages']} pages)"
+    return None
+
+
+def _run_job(task: tuple) -> tuple[int, int, str | None]:
+    """Run one manifest job; failures are returned, not raised, so the run goes on."""
+    index, job, add_bookmarks, compress, stream = task
+    try:
+        Path(job["output"]).parent.mkdir(parents=True, exist_ok=True)
+        pages = merge_pdfs(
+            job["inputs"],
+            job["output"],
+            add_bookmarks=job.get("bookmarks", add_bookmarks),
+            compress=job.get("compress", compress),
+            stream=job.get("stream", stream),
+        )
+    except Exception as e:
+        return index, 0, f"{type(e).__name__}: {e}"
+    return index, pages, None
+
+
+def _map(pool, workers: int, fn, items: list):
+    if pool is None:
+        return map(fn, items)
+    return pool.map(fn, items, chunksize=max(1, len(items) // (workers * 8)))
+
+
+def run_manifest(
+    jobs: list[dict],
+    workers: int = 1,
+    add_bookmarks: bool = False,
+    compress: bool = True,
+    stream: bool = False
+) -> dict:
+    """
+    Validate every input of every job in parallel, then run the valid jobs
+    concurrently.
+    
+    Args:
+        jobs: Jobs from load_manifest()
+        workers: Worker processes for both phases
+        add_bookmarks, compress, stream: Defaults for jobs that don't set
+                                         "bookmarks", "compress" or "stream"
+        
+    Returns:
+        {"merged": [(index, output, pages)], "failed": [(index, error)],
+         "seconds": elapsed}, with 1-based job indices
+    """
+    start = time.perf_counter()
+    paths = set()
+    for job in jobs:
+        try:
+            paths.update(path for path, _, _ in _job_inputs(job))
+        except (ValueError, KeyError, TypeError):
+            pass  # reported by validate_job
+    paths = sorted(paths)
+    
+    pool = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+    try:
+        inspected = dict(zip(paths, _map(pool, workers, inspect_pdf, paths)))
+        
+        failed = []
+        tasks = []
+        outputs = {}
+        for index, job in enumerate(jobs, 1):
+            error = validate_job(job, inspected)
+            if error is None and job["output"] in outputs:
+                error = f"output {job['output']} is also written by job {outputs[job['output']]}"
+            if error:
+                failed.append((index, error))
+                continue
+            outputs[job["output"]] = index
+            tasks.append((index, job, add_bookmarks, compress, stream))
+        
+        merged = []
+        for index, pages, error in _map(pool, workers, _run_job, tasks):
+            if error:
+                failed.append((index, error))
+            else:
+                merged.append((index, jobs[index - 1]["output"], pages))
+    finally:
+        if pool is not None:
+            pool.shutdown()
+    
+    return {"merged": merged, "failed": sorted(failed), "seconds": time.perf_counter() - start}
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Merge multiple PDF files into one",
@@ -121,14 +580,20 @@ def main():
     )
     parser.add_argument(
         "inputs",
-        nargs="+",
+        nargs="*",
         help="Input PDF files (use 'file.pdf:1-3,5' for specific pages)"
     )
     parser.add_argument(
         "--output", "-o",
-        required=True,
         help="Output PDF file"
     )
+    parser.add_argument("--manifest", "-m", help="YAML/JSON/JSONL manifest of merge jobs (instead of inputs)")
+    parser.add_argument(
+        "--jobs", "-j",
+        type=int,
+        default=1,
+        help="Manifest worker processes (0 = one per CPU; default: 1)"
+    )
     parser.add_argument(
         "--bookmarks", "-b",
         action="store_true",
@@ -139,9 +604,40 @@ def main():
         action="store_true",
         help="Disable compression (faster but larger file)"
     )
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Write pages as they are read, one input open at a time (bounded memory for huge merges)"
+    )
     
     args = parser.parse_args()
     
+    # Manifest mode
+    if args.manifest:
+        if args.inputs or args.output:
+            print("Error: --manifest replaces input files and --output", file=sys.stderr)
+            sys.exit(1)
+        try:
+            jobs = load_manifest(args.manifest)
+        except (OSError, ValueError) as e:
+            print(f"Error: Cannot read manifest: {e}", file=sys.stderr)
+            sys.exit(1)
+        
+        workers = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+        report = run_manifest(jobs, workers, args.bookmarks, not args.no_compress, args.stream)
+        for index, error in report["failed"]:
+            print(f"  Job {index}: {error}", file=sys.stderr)
+        pages = sum(pages for _, _, pages in report["merged"])
+        print(f"Merged {len(report['merged'])}/{len(jobs)} job(s), {pages} pages in {report['seconds']:.1f}s "
+              f"({len(report['failed'])} failed)")
+        if report["failed"]:
+            sys.exit(1)
+        return
+    
+    if not args.output:
+        print("Error: --output is required (or use --manifest)", file=sys.stderr)
+        sys.exit(1)
+    
     # Validate at least 2 inputs for merge
     if len(args.inputs) < 2:
         print("Error: Need at least 2 PDF files to merge", file=sys.stderr)
@@ -152,7 +648,8 @@ def main():
         args.inputs,
         args.output,
         add_bookmarks=args.bookmarks,
-        compress=not args.no_compress
+        compress=not args.no_compress,
+        stream=args.stream
     )
     
     print(f"Merged PDF saved to: {args.output}")
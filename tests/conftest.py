@@ -1,6 +1,57 @@
 import pytest
 from click.testing import CliRunner
 
+
+class SkillLibrary:
+    """Helper for building throwaway skill libraries in tests."""
+
+    BODY = "# Notes\n\nKeep notes short and specific.\n"
+
+    def __init__(self, root):
+        self.root = root
+
+    def add_skill(self, name, body=BODY, category="coding", description="", tags=(), agents=("gemini", "claude")):
+        skill_dir = self.root / category / name
+        skill_dir.mkdir(parents=True, exist_ok=True)
+        tags_yaml = "".join(f"\n  - {t}" for t in tags) or " []"
+        agents_yaml = "".join(f"\n  - {a}" for a in agents)
+        (skill_dir / "skill.yaml").write_text(
+            f"name: {name}\nversion: 1.0.0\ncategory: {category}\n"
+            f"description: {description}\ntags:{tags_yaml}\nagents:{agents_yaml}\n",
+            encoding="utf-8",
+        )
+        (skill_dir / "SKILL.md").write_text(body, encoding="utf-8")
+        return skill_dir
+
+
 @pytest.fixture
 def runner():
     return CliRunner()
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    """Keep persistent caches out of the real user cache."""
+    path = tmp_path / "cache"
+    monkeypatch.setenv("ASK_CACHE_DIR", str(path))
+    return path
+
+
+@pytest.fixture
+def skills_dir(tmp_path, monkeypatch):
+    """A small skill library, wired in as the registry's skills directory."""
+    root = tmp_path / "skills"
+    root.mkdir()
+    monkeypatch.setattr("ask.utils.skill_registry.get_skills_dir", lambda: root)
+    return SkillLibrary(root)
+
+
+@pytest.fixture(autouse=True)
+def dist_dir(tmp_path, monkeypatch):
+    """Keep build artifacts out of the project's dist/."""
+    path = tmp_path / "dist"
+    monkeypatch.setattr("ask.utils.artifacts.get_dist_dir", lambda: path)
+    monkeypatch.setattr("ask.commands.build.get_dist_dir", lambda: path)
+    monkeypatch.setattr("ask.utils.artifacts._manifest_cache", {})
+    monkeypatch.setattr("ask.utils.artifacts._hasher", None)
+    return path
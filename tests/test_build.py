@@ -0,0 +1,84 @@
+import json
+import shutil
+
+from ask.cli import main
+from ask.utils.filesystem import get_adapter
+from ask.utils.skill_registry import load_skill
+
+
+def _manifest(dist_dir):
+    return json.loads((dist_dir / "manifest.json").read_text(encoding="utf-8"))
+
+
+def test_build_writes_artifacts_and_manifest(runner, skills_dir, dist_dir):
+    skills_dir.add_skill("note-taker")
+
+    result = runner.invoke(main, ["build", "--agent", "gemini", "--agent", "claude"])
+
+    assert result.exit_code == 0, result.output
+    assert (dist_dir / "gemini" / "note-taker" / "SKILL.md").exists()
+    assert (dist_dir / "claude" / "note-taker.md").exists()
+    entry = _manifest(dist_dir)["agents"]["gemini"]["skills"]["note-taker"]
+    assert list(entry["outputs"]) == ["note-taker/SKILL.md"]
+
+
+def test_build_is_incremental(runner, skills_dir, dist_dir):
+    skills_dir.add_skill("note-taker")
+    other = skills_dir.add_skill("other-skill")
+    runner.invoke(main, ["build", "--agent", "gemini"])
+    built = dist_dir / "gemini" / "note-taker" / "SKILL.md"
+    mtime = built.stat().st_mtime_ns
+
+    (other / "SKILL.md").write_text(skills_dir.BODY + "\nMore.\n", encoding="utf-8")
+    result = runner.invoke(main, ["build", "--agent", "gemini"])
+
+    assert result.exit_code == 0, result.output
+    assert built.stat().st_mtime_ns == mtime
+    assert "More." in (dist_dir / "gemini" / "other-skill" / "SKILL.md").read_text(encoding="utf-8")
+
+
+def test_build_removes_deleted_skills(runner, skills_dir, dist_dir):
+    skill_dir = skills_dir.add_skill("note-taker")
+    runner.invoke(main, ["build", "--agent", "gemini"])
+    shutil.rmtree(skill_dir)
+
+    runner.invoke(main, ["build", "--agent", "gemini"])
+
+    assert not (dist_dir / "gemini" / "note-taker").exists()
+    assert _manifest(dist_dir)["agents"]["gemini"]["skills"] == {}
+
+
+def test_copy_installs_fresh_artifacts(runner, skills_dir, dist_dir, tmp_path):
+    skill_dir = skills_dir.add_skill("note-taker")
+    runner.invoke(main, ["build", "--agent", "gemini", "--compact"])
+    artifact = dist_dir / "gemini" / "note-taker" / "SKILL.md"
+    artifact.write_text("prebuilt\n", encoding="utf-8")
+
+    adapter = get_adapter("gemini", compact=True)
+    adapter.target_dir = tmp_path / "install"
+    skill = load_skill(skill_dir)
+    assert list(adapter.render_outputs(skill).values()) == ["prebuilt\n"]
+
+    # Stale once the source changes, or when output options differ
+    adapter.compact = False
+    assert list(adapter.render_outputs(skill).values()) != ["prebuilt\n"]
+    adapter.compact = True
+    (skill_dir / "SKILL.md").write_text(skills_dir.BODY + "\nMore.\n", encoding="utf-8")
+    assert "More." in next(iter(adapter.render_outputs(skill).values()))
+
+
+def test_artifacts_survive_a_fresh_clone(runner, skills_dir, dist_dir, tmp_path, monkeypatch):
+    skills_dir.add_skill("note-taker")
+    runner.invoke(main, ["build", "--agent", "gemini", "--split"])
+    (dist_dir / "gemini" / "note-taker" / "SKILL.md").write_text("prebuilt\n", encoding="utf-8")
+
+    # Same content at a new path, with new mtimes and inodes and no hash cache
+    clone = tmp_path / "clone"
+    shutil.copytree(skills_dir.root, clone, copy_function=shutil.copyfile)
+    monkeypatch.setattr("ask.utils.skill_registry.get_skills_dir", lambda: clone)
+    monkeypatch.setattr("ask.utils.artifacts._hasher", None)
+
+    adapter = get_adapter("gemini", split=True)
+    adapter.target_dir = tmp_path / "install"
+    outputs = adapter.render_outputs(load_skill(clone / "coding" / "note-taker"))
+    assert "prebuilt\n" in outputs.values()
@@ -13,3 +13,8 @@ def test_remove_help(runner):
     result = runner.invoke(main, ["remove", "--help"])
     assert result.exit_code == 0
     assert "Remove a skill" in result.output
+
+def test_search_help(runner):
+    result = runner.invoke(main, ["search", "--help"])
+    assert result.exit_code == 0
+    assert "BM25" in result.output
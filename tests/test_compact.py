@@ -0,0 +1,34 @@
+from ask.utils.compact import compact_markdown
+
+
+def test_compact_drops_nested_frontmatter_and_fills_header():
+    source = (
+        "---\nname: ask-demo\nversion: 1.0.0\ndescription: \n---\n\n"
+        "---\nname: ask-demo\ndescription: Demo skill\n---\n\n"
+        "# Demo\n"
+    )
+    assert compact_markdown(source) == (
+        "---\nname: ask-demo\nversion: 1.0.0\ndescription: Demo skill\n---\n\n# Demo\n"
+    )
+
+
+def test_compact_strips_comments_emoji_and_repeats():
+    source = (
+        "# 🚀 Features\n\n\n\n"
+        "<!-- TODO: expand -->\n"
+        "Always reproduce the bug before fixing it.\n\n"
+        "━━━━━━━━━━\n\n"
+        "Always reproduce the bug before fixing it!\n"
+    )
+    assert compact_markdown(source) == "# Features\n\nAlways reproduce the bug before fixing it.\n"
+
+
+def test_compact_preserves_code_blocks():
+    code = "```python\n# 🚀 not a heading\n\n\n<!-- kept -->\nx = 1   \n```"
+    source = f"## Example\n{code}\n\n\nDone.\n"
+    assert compact_markdown(source) == f"## Example\n{code}\n\nDone.\n"
+
+
+def test_compact_keeps_rules_and_setext_underlines():
+    source = "Title\n=====\n\n---\n\n---\n\nBody\n"
+    assert compact_markdown(source) == "Title\n=====\n\n---\n\nBody\n"
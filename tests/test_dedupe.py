@@ -0,0 +1,65 @@
+from ask.cli import main
+from ask.utils.cache import load_json_cache
+from ask.utils.minhash import candidate_pairs, cluster_pairs, shingles, signature, similarity
+
+BODY = """# Laravel Architect
+
+Always separate the logic layer from controllers. Controllers stay thin and
+delegate to services, which own transactions and emit domain events.
+
+Prefer explicit relations over magic attributes and eager load everything a
+view touches to avoid N+1 queries in production traffic.
+"""
+
+
+def test_similarity_estimates_jaccard():
+    sig_a = signature(shingles(BODY))
+    sig_b = signature(shingles(BODY + "\nAlso run the migrations in a transaction.\n"))
+    sig_c = signature(shingles("Flutter widgets rebuild when their state changes."))
+
+    assert similarity(sig_a, sig_b) > 0.7
+    assert similarity(sig_a, sig_c) < 0.1
+
+
+def test_lsh_clusters_near_duplicates():
+    sigs = {
+        "a": signature(shingles(BODY)),
+        "b": signature(shingles(BODY.replace("production", "live"))),
+        "c": signature(shingles("Completely unrelated text about shell scripting and cron jobs.")),
+    }
+    pairs = candidate_pairs(sigs)
+
+    assert ("a", "b") in pairs
+    assert cluster_pairs(pairs) == [["a", "b"]]
+
+
+def test_dedupe_command_reports_shared_paragraphs(runner, skills_dir):
+    skills_dir.add_skill("ask-laravel-architect", BODY)
+    skills_dir.add_skill("ask-laravel-mechanic", BODY + "\nKeep queues observable.\n")
+    skills_dir.add_skill("ask-flutter-architect", "Use FVM for every Flutter command.")
+
+    result = runner.invoke(main, ["dedupe"])
+
+    assert result.exit_code == 0
+    assert "1 cluster" in result.output
+    assert "ask-laravel-architect" in result.output
+    assert "ask-flutter-architect" not in result.output
+    assert "Shared paragraphs (2)" in result.output
+
+
+def test_dedupe_keeps_other_signatures_and_same_names(runner, skills_dir):
+    skills_dir.add_skill("ask-laravel-architect", BODY, category="coding")
+    skills_dir.add_skill("ask-laravel-architect", BODY + "\nKeep queues observable.\n", category="planning")
+    skills_dir.add_skill("ask-flutter-architect", "Use FVM for every Flutter command.", category="other")
+    skills_dir.add_skill("ask-flutter-helper", "Use FVM for every Flutter command, always.", category="other")
+
+    runner.invoke(main, ["dedupe"])
+    cached = load_json_cache("minhash-signatures")
+    assert len(cached) == 4
+
+    runner.invoke(main, ["dedupe", "--category", "other"])
+    assert load_json_cache("minhash-signatures") == cached
+
+    result = runner.invoke(main, ["dedupe", "--no-paragraphs"])
+    assert "coding/ask-laravel-architect" in result.output
+    assert "planning/ask-laravel-architect" in result.output
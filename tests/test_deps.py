@@ -0,0 +1,128 @@
+import zipfile
+
+import pytest
+
+from ask.cli import main
+from ask.utils.deps import (
+    DepsError,
+    collect_requirements,
+    ensure_env,
+    env_python,
+    find_env,
+    get_envs_dir,
+    list_envs,
+    normalize_requirement,
+    prune_envs,
+)
+
+
+def _make_wheel(wheel_dir, name, version="1.0"):
+    """A minimal pure-Python wheel providing module `name`."""
+    wheel_dir.mkdir(parents=True, exist_ok=True)
+    dist_info = f"{name}-{version}.dist-info"
+    with zipfile.ZipFile(wheel_dir / f"{name}-{version}-py3-none-any.whl", "w") as whl:
+        whl.writestr(f"{name}/__init__.py", f"VERSION = {version!r}\n")
+        whl.writestr(f"{dist_info}/METADATA", f"Metadata-Version: 2.1\nName: {name}\nVersion: {version}\n")
+        whl.writestr(f"{dist_info}/WHEEL", "Wheel-Version: 1.0\nGenerator: test\nRoot-Is-Purelib: true\nTag: py3-none-any\n")
+        whl.writestr(f"{dist_info}/RECORD", "")
+
+
+@pytest.fixture
+def wheels(tmp_path):
+    path = tmp_path / "wheels"
+    _make_wheel(path, "tinydep")
+    _make_wheel(path, "otherdep")
+    return path
+
+
+def _add_skill_with_deps(skills_dir, name, deps):
+    skill_dir = skills_dir.add_skill(name)
+    with open(skill_dir / "skill.yaml", "a", encoding="utf-8") as f:
+        f.write("dependencies:\n" + "".join(f"  - {dep}\n" for dep in deps))
+    return skill_dir
+
+
+def test_requirements_are_normalised_and_merged():
+    assert normalize_requirement("PyYAML >= 6") == "pyyaml>=6"
+    assert normalize_requirement("ruamel.yaml") == "ruamel-yaml"
+    with pytest.raises(DepsError):
+        normalize_requirement(">=1")
+
+    skills = [{"name": "a", "dependencies": ["pypdf", "Pdf_Plumber"]}, {"name": "b", "dependencies": ["pypdf"]},
+              {"name": "c"}]
+    assert collect_requirements(skills) == {"pdf-plumber": ["a"], "pypdf": ["a", "b"]}
+
+
+def test_env_is_built_offline_and_reused(wheels):
+    first = ensure_env(["tinydep"], wheels)
+    assert first["built"]
+    python = env_python(first["path"])
+    assert python.exists()
+
+    again = ensure_env(["TinyDep"], wheels)
+    assert not again["built"] and again["path"] == first["path"]
+
+    other = ensure_env(["tinydep", "otherdep"], wheels)
+    assert other["built"] and other["key"] != first["key"]
+    assert (other["path"] / "lib").exists() or (other["path"] / "Lib").exists()
+
+    # The newest environment that covers the requirements wins
+    assert find_env(["tinydep"]) == other["path"]
+    assert find_env(["missing"]) is None
+    assert len(list_envs()) == 2
+
+
+def test_failed_build_leaves_nothing_usable(wheels):
+    with pytest.raises(DepsError, match="nosuchdep"):
+        ensure_env(["nosuchdep"], wheels)
+
+    assert list_envs() == []
+    assert find_env(["nosuchdep"]) is None
+
+
+def test_failed_rebuild_keeps_working_env(wheels, tmp_path):
+    env = ensure_env(["tinydep"], wheels)["path"]
+
+    with pytest.raises(DepsError):
+        ensure_env(["tinydep"], tmp_path / "empty", rebuild=True)
+
+    assert find_env(["tinydep"]) == env
+
+
+def test_prune_removes_unused_and_broken_envs(wheels):
+    env = ensure_env(["tinydep"], wheels)["path"]
+    broken = get_envs_dir() / "broken"
+    broken.mkdir()
+
+    assert prune_envs() == [broken]
+    assert prune_envs(days=-1) == [env]
+    assert list_envs() == []
+
+
+def test_cli_provisions_installed_skills(runner, skills_dir, wheels, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    _add_skill_with_deps(skills_dir, "pdf-helper", ["tinydep"])
+    _add_skill_with_deps(skills_dir, "not-installed", ["otherdep"])
+    runner.invoke(main, ["copy", "gemini", "--skill", "pdf-helper"], input="2\n")
+
+    args = ["deps", "--agent", "gemini", "--scope", "local", "--wheels", str(wheels)]
+    result = runner.invoke(main, args)
+    assert result.exit_code == 0, result.output
+    assert "tinydep (pdf-helper)" in result.output
+    assert "otherdep" not in result.output
+    assert "Built environment" in result.output
+
+    result = runner.invoke(main, args)
+    assert "Reusing environment" in result.output
+
+    result = runner.invoke(main, [*args, "--python"])
+    assert result.output.strip() == str(env_python(find_env(["tinydep"])))
+
+
+def test_cli_reports_missing_wheels(runner, skills_dir, tmp_path):
+    _add_skill_with_deps(skills_dir, "pdf-helper", ["nosuchdep"])
+
+    result = runner.invoke(main, ["deps", "--skill", "pdf-helper", "--wheels", str(tmp_path / "empty")])
+
+    assert result.exit_code == 1
+    assert "ask deps --fetch" in result.output
@@ -0,0 +1,42 @@
+from ask.cli import main
+
+
+def test_diff_shows_only_changed_files(runner, skills_dir, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    skill_dir = skills_dir.add_skill("note-taker")
+    skills_dir.add_skill("other-skill")
+    for skill in ("note-taker", "other-skill"):
+        runner.invoke(main, ["copy", "gemini", "--skill", skill], input="2\n")
+
+    (skill_dir / "SKILL.md").write_text(skills_dir.BODY + "\nNew tip.\n", encoding="utf-8")
+    result = runner.invoke(main, ["diff", "gemini", "--scope", "local", "--exit-code"])
+
+    assert result.exit_code == 1
+    assert "+New tip." in result.output
+    assert "note-taker/SKILL.md" in result.output
+    assert "other-skill" not in result.output
+    assert "1 file(s) differ" in result.output
+
+
+def test_diff_clean(runner, skills_dir, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    skills_dir.add_skill("note-taker")
+    runner.invoke(main, ["copy", "gemini", "--skill", "note-taker"], input="2\n")
+
+    result = runner.invoke(main, ["diff", "--scope", "local", "--exit-code"])
+
+    assert result.exit_code == 0
+    assert "match the library" in result.output
+
+
+def test_diff_labels_binary_files_by_path(runner, skills_dir, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    skills_dir.add_skill("note-taker")
+    runner.invoke(main, ["copy", "gemini", "--skill", "note-taker"], input="2\n")
+    (tmp_path / ".gemini" / "skills" / "note-taker" / "SKILL.md").write_bytes(b"\xff\xfe binary")
+
+    result = runner.invoke(main, ["diff", "gemini", "--scope", "local"])
+
+    label = ".gemini/skills/note-taker/SKILL.md"
+    assert f"Binary files {label} and {label} differ" in result.output
+    assert "Keep notes short" not in result.output
@@ -0,0 +1,85 @@
+import json
+import shutil
+
+from ask.cli import main
+
+
+def _doctor(runner):
+    result = runner.invoke(main, ["doctor", "--agent", "gemini", "--agent", "claude", "--scope", "local", "--json"])
+    return result.exit_code, {(f["agent"], f["skill"], f["status"]) for f in json.loads(result.output)}
+
+
+def _copy(runner, skill, agent="gemini"):
+    return runner.invoke(main, ["copy", agent, "--skill", skill], input="2\n")
+
+
+def test_clean_install_passes(runner, skills_dir, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    skills_dir.add_skill("note-taker")
+    _copy(runner, "note-taker")
+
+    assert _doctor(runner) == (0, set())
+
+
+def test_reports_modified_missing_and_orphaned(runner, skills_dir, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    skill_dir = skills_dir.add_skill("note-taker")
+    (skill_dir / "scripts").mkdir()
+    (skill_dir / "scripts" / "run.py").write_text("print('hi')\n", encoding="utf-8")
+    skills_dir.add_skill("other-skill")
+    _copy(runner, "note-taker", "claude")
+    _copy(runner, "other-skill")
+
+    commands = tmp_path / ".claude" / "commands"
+    (commands / ".scripts" / "note-taker" / "scripts" / "run.py").unlink()
+    (tmp_path / ".gemini" / "skills" / "other-skill" / "SKILL.md").write_text("edited\n", encoding="utf-8")
+    (commands / ".scripts" / "ghost").mkdir()
+
+    code, findings = _doctor(runner)
+
+    assert code == 1
+    assert findings == {
+        ("claude", "note-taker", "missing"),
+        ("gemini", "other-skill", "modified"),
+        ("claude", "ghost", "orphaned"),
+    }
+
+
+def test_locked_install_goes_stale_when_library_changes(runner, skills_dir, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    skill_dir = skills_dir.add_skill("note-taker")
+    _copy(runner, "note-taker")
+
+    (skill_dir / "SKILL.md").write_text(skills_dir.BODY + "\nNew tip.\n", encoding="utf-8")
+
+    assert _doctor(runner) == (1, {("gemini", "note-taker", "stale")})
+
+
+def test_reports_unlocked_installs_missing_from_library(runner, skills_dir, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    skills_dir.add_skill("note-taker")
+    removed = skills_dir.add_skill("retired-skill")
+    for skill in ("note-taker", "retired-skill"):
+        _copy(runner, skill)
+    (tmp_path / "ask.lock").unlink()
+    # A renamed copy of a library skill is not an orphan
+    installed = tmp_path / ".gemini" / "skills"
+    shutil.copytree(installed / "note-taker", installed / "note-taker-2")
+    shutil.rmtree(removed)
+
+    assert _doctor(runner) == (1, {("gemini", "retired-skill", "orphaned")})
+
+
+def test_user_authored_files_are_not_orphans(runner, skills_dir, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    skills_dir.add_skill("note-taker")
+    _copy(runner, "note-taker")
+    commands = tmp_path / ".claude" / "commands"
+    commands.mkdir(parents=True)
+    (commands / "deploy.md").write_text("# Deploy\n\nRun the deploy script.\n", encoding="utf-8")
+    (commands / "style.md").write_text("---\ndescription: House style\n---\n\nUse tabs.\n", encoding="utf-8")
+    own_skill = tmp_path / ".gemini" / "skills" / "my-skill"
+    own_skill.mkdir()
+    (own_skill / "SKILL.md").write_text("---\nname: my-skill\ndescription: Mine\n---\n\nBody.\n", encoding="utf-8")
+
+    assert _doctor(runner) == (0, set())
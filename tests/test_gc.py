@@ -0,0 +1,73 @@
+import json
+
+from ask.cli import main
+
+
+def _copy(runner, skill, agent="claude", input="2\n"):
+    return runner.invoke(main, ["copy", agent, "--skill", skill], input=input)
+
+
+def _add_skill_with_script(skills_dir, name):
+    skill_dir = skills_dir.add_skill(name)
+    (skill_dir / "scripts").mkdir()
+    (skill_dir / "scripts" / "run.py").write_text("print('hi')\n", encoding="utf-8")
+    return skill_dir
+
+
+def test_remove_deletes_resource_directory(runner, skills_dir, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    _add_skill_with_script(skills_dir, "note-taker")
+    _copy(runner, "note-taker")
+    scripts = tmp_path / ".claude" / "commands" / ".scripts" / "note-taker"
+    assert scripts.is_dir()
+
+    runner.invoke(main, ["remove", "claude", "--skill", "note-taker", "--yes"])
+
+    assert not scripts.exists()
+
+
+def test_gc_removes_orphans_backups_and_copies(runner, skills_dir, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    _add_skill_with_script(skills_dir, "note-taker")
+    skills_dir.add_skill("other-skill")
+    _copy(runner, "note-taker")
+    _copy(runner, "other-skill")
+    _copy(runner, "other-skill", input="2\nother-copy\n")
+
+    commands = tmp_path / ".claude" / "commands"
+    (commands / "note-taker.md").unlink()
+    (commands / "other-skill.md.bak").write_text("old\n", encoding="utf-8")
+    assert (commands / "other-copy.md").exists()
+
+    result = runner.invoke(main, ["gc", "--agent", "claude", "--scope", "local", "--dry-run"])
+    assert result.exit_code == 0
+    assert (commands / ".scripts" / "note-taker").exists()
+
+    result = runner.invoke(main, ["gc", "--agent", "claude", "--scope", "local", "--copies", "--yes"])
+    assert result.exit_code == 0
+    assert not (commands / ".scripts" / "note-taker").exists()
+    assert not (commands / "other-skill.md.bak").exists()
+    assert not (commands / "other-copy.md").exists()
+    assert (commands / "other-skill.md").exists()
+
+    lock = json.loads((tmp_path / "ask.lock").read_text(encoding="utf-8"))
+    assert "claude:other-copy" not in lock["skills"]["other-skill"]["installs"]
+
+
+def test_du_reports_bytes_per_skill(runner, skills_dir, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    _add_skill_with_script(skills_dir, "note-taker")
+    _copy(runner, "note-taker")
+    _copy(runner, "note-taker", agent="gemini")
+    (tmp_path / ".claude" / "commands" / ".scripts" / "ghost").mkdir()
+
+    result = runner.invoke(main, ["du", "--agent", "claude", "--agent", "gemini", "--scope", "local", "--json"])
+
+    assert result.exit_code == 0
+    rows = {(row["agent"], row["skill"]): row for row in json.loads(result.output)}
+    commands = tmp_path / ".claude" / "commands"
+    expected = (commands / "note-taker.md").stat().st_size + len("print('hi')\n")
+    assert rows[("claude", "note-taker")]["bytes"] == expected
+    assert rows[("claude", "note-taker")]["files"] == 2
+    assert rows[("claude", "ghost")]["orphaned"]
+    assert rows[("gemini", "note-taker")]["files"] == 2
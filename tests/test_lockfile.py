@@ -0,0 +1,72 @@
+import json
+
+from ask.cli import main
+
+
+def _copy(runner, skill):
+    # Scope prompt: 2 = local (project)
+    return runner.invoke(main, ["copy", "gemini", "--skill", skill], input="2\n")
+
+
+def test_copy_records_local_install(runner, skills_dir, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    skills_dir.add_skill("note-taker")
+
+    result = _copy(runner, "note-taker")
+
+    assert result.exit_code == 0, result.output
+    lock = json.loads((tmp_path / "ask.lock").read_text(encoding="utf-8"))
+    entry = lock["skills"]["note-taker"]
+    assert entry["version"] == "1.0.0"
+    assert list(entry["installs"]["gemini:note-taker"]["files"]) == ["note-taker/SKILL.md"]
+
+
+def test_install_rewrites_only_mismatched(runner, skills_dir, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    skills_dir.add_skill("note-taker")
+    skills_dir.add_skill("other-skill")
+    _copy(runner, "note-taker")
+    _copy(runner, "other-skill")
+    installed = tmp_path / ".gemini" / "skills"
+    untouched = installed / "other-skill" / "SKILL.md"
+    mtime = untouched.stat().st_mtime_ns
+
+    (installed / "note-taker" / "SKILL.md").write_text("hand edited\n", encoding="utf-8")
+    result = runner.invoke(main, ["install", "--frozen"])
+
+    assert result.exit_code == 0, result.output
+    assert "1 verified, 1 reinstalled, 0 failed" in result.output
+    assert "Keep notes short" in (installed / "note-taker" / "SKILL.md").read_text(encoding="utf-8")
+    assert untouched.stat().st_mtime_ns == mtime
+
+
+def test_frozen_install_checks_output_before_writing(runner, skills_dir, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    skills_dir.add_skill("note-taker")
+    _copy(runner, "note-taker")
+    # Same source, but the lock expects different output (as after an adapter change)
+    lock = json.loads((tmp_path / "ask.lock").read_text(encoding="utf-8"))
+    lock["skills"]["note-taker"]["installs"]["gemini:note-taker"]["files"]["note-taker/SKILL.md"] = "0" * 64
+    (tmp_path / "ask.lock").write_text(json.dumps(lock), encoding="utf-8")
+    main_file = tmp_path / ".gemini" / "skills" / "note-taker" / "SKILL.md"
+    main_file.write_text("hand edited\n", encoding="utf-8")
+
+    result = runner.invoke(main, ["install", "--frozen"])
+
+    assert result.exit_code == 1
+    assert "output differs from ask.lock" in result.output
+    assert main_file.read_text(encoding="utf-8") == "hand edited\n"
+
+
+def test_frozen_install_rejects_changed_source(runner, skills_dir, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    skill_dir = skills_dir.add_skill("note-taker")
+    _copy(runner, "note-taker")
+    (tmp_path / ".gemini" / "skills" / "note-taker" / "SKILL.md").unlink()
+    (skill_dir / "SKILL.md").write_text(skills_dir.BODY + "\nChanged.\n", encoding="utf-8")
+
+    assert runner.invoke(main, ["install", "--frozen"]).exit_code == 1
+
+    result = runner.invoke(main, ["install"])
+    assert result.exit_code == 0, result.output
+    assert "Changed." in (tmp_path / ".gemini" / "skills" / "note-taker" / "SKILL.md").read_text(encoding="utf-8")
@@ -0,0 +1,304 @@
+import io
+import json
+import os
+import sys
+
+import pytest
+
+pytest.importorskip("pdfplumber")
+pytest.importorskip("pypdf")
+
+from benchmarks.pdf_fixtures import (  # noqa: E402
+    SKILL_SCRIPTS,
+    make_form_pdf,
+    make_scan_pdf,
+    make_table_pdf,
+    make_text_pdf,
+)
+
+sys.path.insert(0, str(SKILL_SCRIPTS))
+
+import extract_text  # noqa: E402
+import fill_form  # noqa: E402
+import merge_pdfs  # noqa: E402
+from pypdf import PdfReader  # noqa: E402
+
+
+@pytest.fixture(scope="module")
+def text_pdf(tmp_path_factory):
+    return make_text_pdf(tmp_path_factory.mktemp("pdf") / "doc.pdf", pages=6, lines=5)
+
+
+@pytest.fixture(scope="module")
+def table_pdf(tmp_path_factory):
+    return make_table_pdf(tmp_path_factory.mktemp("pdf") / "tables.pdf", pages=4, rows=2)
+
+
+@pytest.fixture(scope="module")
+def form_pdf(tmp_path_factory):
+    return make_form_pdf(tmp_path_factory.mktemp("pdf") / "form.pdf", pages=3, fields_per_page=2)
+
+
+def test_parallel_extraction_matches_serial(text_pdf):
+    serial = extract_text.extract_text(str(text_pdf))
+
+    assert extract_text.extract_text(str(text_pdf), jobs=3) == serial
+    assert serial.index("--- Page 2 ---") < serial.index("--- Page 6 ---")
+
+
+def test_parallel_extraction_keeps_page_selection_order(text_pdf):
+    pages = [5, 1, 3]
+
+    assert extract_text.extract_text(str(text_pdf), pages, jobs=2) == extract_text.extract_text(str(text_pdf), pages)
+
+
+def test_pages_stream_in_order(text_pdf):
+    pages = extract_text.iter_page_text(str(text_pdf))
+
+    assert next(pages)[0] == 1
+    assert [page_num for page_num, _ in pages] == [2, 3, 4, 5, 6]
+
+
+def test_write_pages_matches_extract_text(text_pdf, tmp_path):
+    out = tmp_path / "out.txt"
+    with open(out, "w", encoding="utf-8") as f:
+        written = extract_text.write_pages(extract_text.iter_page_text(str(text_pdf), jobs=2), f)
+
+    assert written == 6
+    assert out.read_text(encoding="utf-8") == extract_text.extract_text(str(text_pdf))
+
+
+def test_parse_pages_accepts_ranges():
+    assert extract_text.parse_pages("1-3, 7,10-11") == [1, 2, 3, 7, 10, 11]
+
+
+def test_tables_stream_across_pages_as_jsonl(table_pdf):
+    out = io.StringIO()
+
+    written = extract_text.write_tables(extract_text.iter_tables(str(table_pdf), [2, 3, 4], jobs=2), out, "jsonl")
+
+    rows = [json.loads(line) for line in out.getvalue().splitlines()]
+    assert written == 3
+    assert [(row["page"], row["table"], row["row"]) for row in rows[:3]] == [(2, 1, 1), (2, 1, 2), (2, 1, 3)]
+    assert rows[0]["cells"] == ["Item", "Qty", "Price", "Page"]
+    assert {row["cells"][3] for row in rows[1:]} == {"2", "3", "4"} | {"Page"}
+
+
+def test_parallel_tables_match_serial_csv(table_pdf):
+    serial, parallel = io.StringIO(), io.StringIO()
+
+    extract_text.write_tables(extract_text.iter_tables(str(table_pdf)), serial)
+    extract_text.write_tables(extract_text.iter_tables(str(table_pdf), jobs=3), parallel)
+
+    assert parallel.getvalue() == serial.getvalue()
+    assert serial.getvalue().splitlines()[0] == "1,1,1,Item,Qty,Price,Page"
+
+
+def test_cached_pages_are_not_extracted_again(text_pdf, tmp_path, monkeypatch):
+    cache = extract_text.PageCache(tmp_path / "cache")
+    first = list(extract_text.iter_page_text(str(text_pdf), [1, 2], cache=cache))
+
+    extracted = []
+    real = extract_text._extract_indices
+    monkeypatch.setattr(extract_text, "_extract_indices",
+                        lambda path, mode, indices, jobs: extracted.extend(indices) or real(path, mode, indices, jobs))
+    second = list(extract_text.iter_page_text(str(text_pdf), [2, 3, 1], cache=cache))
+
+    assert extracted == [2]
+    assert second == [first[1], (3, second[1][1]), first[0]]
+    assert list(extract_text.iter_page_text(str(text_pdf), [3])) == [second[1]]
+
+
+def test_cache_evicts_least_recently_used(text_pdf, tmp_path):
+    cache = extract_text.PageCache(tmp_path / "cache")
+    list(extract_text.iter_page_text(str(text_pdf), cache=cache))
+    key = cache.file_key(str(text_pdf))
+    entry_size = cache._entry(key, "text-1").stat().st_size
+
+    cache.max_bytes = entry_size * 3
+    cache.get(key, "text", 0)  # page 1 becomes the most recently used
+
+    assert cache.evict() > 0
+    assert cache.has(key, "text", 0)
+    assert not cache.has(key, "text", 1)
+
+
+def test_cache_only_scans_when_over_budget(text_pdf, tmp_path, monkeypatch):
+    cache = extract_text.PageCache(tmp_path / "cache")
+    list(extract_text.iter_page_text(str(text_pdf), cache=cache))
+
+    scans = []
+    real = os.scandir
+    monkeypatch.setattr(extract_text.os, "scandir", lambda path: scans.append(path) or real(path))
+    # A fully cached run writes nothing, and the recorded usage is within budget
+    list(extract_text.iter_page_text(str(text_pdf), cache=cache))
+    assert scans == []
+
+    cache.max_bytes = 1
+    assert cache.evict() > 0 and scans
+
+
+def test_cache_key_and_limit_fall_back_safely(text_pdf, tmp_path, monkeypatch):
+    cache = extract_text.PageCache(tmp_path / "cache")
+    key = cache.file_key(str(text_pdf))
+    monkeypatch.setattr(extract_text, "EXTRACTOR_VERSION", "pdfplumber-0.0-other")
+    assert cache.file_key(str(text_pdf)) != key
+
+    monkeypatch.setenv("ASK_PDF_CACHE_MB", "lots")
+    assert extract_text.PageCache(tmp_path / "cache").max_bytes == extract_text.DEFAULT_CACHE_MB * 1024 * 1024
+
+
+def test_batch_fill_writes_one_pdf_per_record(form_pdf, tmp_path):
+    records_file = tmp_path / "records.csv"
+    records_file.write_text("id,p1_f0,p3_f1\na,Ada,1815\nb,Bob,1900\n", encoding="utf-8")
+
+    report = fill_form.fill_batch(str(form_pdf), fill_form.load_records(str(records_file)),
+                                  str(tmp_path / "out" / "{id}.pdf"))
+
+    assert report["filled"] == 2 and report["failed"] == []
+    fields = fill_form.list_form_fields(str(tmp_path / "out" / "b.pdf"))
+    assert (fields["p1_f0"]["value"], fields["p3_f1"]["value"], fields["p2_f0"]["value"]) == ("Bob", "1900", "")
+
+
+def test_batch_fill_reports_failures_and_continues(form_pdf, tmp_path):
+    records = [{"id": "a", "p1_f0": "x"}, {"p1_f0": "no id"}, {"id": "c", "p2_f1": "y"}]
+
+    report = fill_form.fill_batch(str(form_pdf), records, str(tmp_path / "{id}.pdf"), jobs=2)
+
+    assert report["filled"] == 2
+    assert [index for index, _ in report["failed"]] == [2]
+    assert "KeyError" in report["failed"][0][1]
+    assert fill_form.list_form_fields(str(tmp_path / "c.pdf"))["p2_f1"]["value"] == "y"
+
+
+def test_field_index_maps_fields_to_pages(form_pdf):
+    fields = fill_form.list_form_fields(str(form_pdf))
+
+    assert len(fields) == 6
+    assert fields["p3_f1"]["pages"] == [3]
+    assert fields["p3_f1"]["type"] == "/Tx"
+
+
+def test_fill_updates_only_pages_holding_requested_fields(form_pdf, tmp_path, monkeypatch):
+    updated = []
+    real = fill_form.PdfWriter.update_page_form_field_values
+    monkeypatch.setattr(fill_form.PdfWriter, "update_page_form_field_values",
+                        lambda self, page, fields, *args, **kwargs:
+                        updated.append(sorted(fields)) or real(self, page, fields, *args, **kwargs))
+
+    fill_form.fill_form(str(form_pdf), str(tmp_path / "out.pdf"), {"p3_f0": "x", "p3_f1": "y", "missing": "z"})
+
+    assert updated == [["p3_f0", "p3_f1"]]
+    fields = fill_form.list_form_fields(str(tmp_path / "out.pdf"))
+    assert (fields["p3_f0"]["value"], fields["p3_f1"]["value"], fields["p1_f0"]["value"]) == ("x", "y", "")
+
+
+def test_reference_mappings_compile_and_apply():
+    reference = str(SKILL_SCRIPTS.parent / "reference" / "form_mappings.yaml")
+    with pytest.raises(ValueError, match="--form-type"):
+        fill_form.load_mapping(reference)
+
+    rules = fill_form.compile_mapping(fill_form.load_mapping(reference, "invoice"))
+    fields = fill_form.apply_mapping(rules, {"id": "42", "date": "2026-01-18", "client": {"name": "ACME"}, "total": 1234.5})
+
+    assert fields == {"invoice_number": "INV-000042", "invoice_date": "January 18, 2026",
+                      "client_name": "ACME", "total": "$1,234.50"}
+
+
+def test_batch_fill_applies_mapping_per_record(form_pdf, tmp_path):
+    mapping = tmp_path / "mapping.json"
+    mapping.write_text(json.dumps({"fields": [
+        {"pdf_field": "p1_f0", "source": "person.name", "required": True},
+        {"pdf_field": "p2_f0", "source": "phone", "format": "(###) ###-####", "default": "0000000000"},
+    ]}), encoding="utf-8")
+    rules = fill_form.compile_mapping(fill_form.load_mapping(str(mapping)))
+    records = [{"id": "a", "person": {"name": "Ada"}, "phone": "5551234567"}, {"id": "b", "phone": "1"}]
+
+    report = fill_form.fill_batch(str(form_pdf), records, str(tmp_path / "{id}.pdf"), rules=rules,
+                                  defaults={"p3_f1": "default"})
+
+    assert report["filled"] == 1
+    assert report["failed"] == [(2, "mapping: missing required field 'person.name'")]
+    fields = fill_form.list_form_fields(str(tmp_path / "a.pdf"))
+    assert [fields[name]["value"] for name in ("p1_f0", "p2_f0", "p3_f1")] == ["Ada", "(555) 123-4567", "default"]
+
+
+@pytest.fixture(scope="module")
+def scan_pdfs(tmp_path_factory):
+    folder = tmp_path_factory.mktemp("scans")
+    return [str(make_scan_pdf(folder / f"scan{i}.pdf", pages=2, image_kb=4, seed=i)) for i in range(3)]
+
+
+def test_stream_merge_matches_in_memory_merge(scan_pdfs, form_pdf, tmp_path):
+    specs = scan_pdfs + [f"{form_pdf}:3,1", str(tmp_path / "missing.pdf")]
+    merged = {}
+    for stream in (False, True):
+        output = tmp_path / f"merged{stream}.pdf"
+        assert merge_pdfs.merge_pdfs(specs, str(output), add_bookmarks=True, stream=stream) == 8
+        reader = PdfReader(output, strict=True)
+        merged[stream] = (
+            [page.extract_text() for page in reader.pages],
+            [(item.title, reader.get_destination_page_number(item)) for item in reader.outline],
+            [len(page.get("/Annots", [])) for page in reader.pages],
+        )
+
+    assert merged[True] == merged[False]
+    assert merged[True][1] == [("scan0", 0), ("scan1", 2), ("scan2", 4), ("form", 6)]
+
+
+def test_stream_merge_writes_shared_objects_once(scan_pdfs, tmp_path):
+    output = tmp_path / "merged.pdf"
+    merge_pdfs.stream_merge(scan_pdfs, str(output))
+
+    reader = PdfReader(output)
+    logos = {page["/Resources"]["/XObject"].raw_get("/Logo").idnum for page in reader.pages}
+    scans = {page["/Resources"]["/XObject"].raw_get("/Scan").idnum for page in reader.pages}
+    assert len(logos) == 1
+    assert len(scans) == 6
+
+
+def test_stream_merge_without_dedupe_keeps_copies(scan_pdfs, tmp_path):
+    output = tmp_path / "merged.pdf"
+    merge_pdfs.stream_merge(scan_pdfs, str(output), compress=False)
+
+    reader = PdfReader(output)
+    assert len({page["/Resources"]["/XObject"].raw_get("/Logo").idnum for page in reader.pages}) == 3
+
+
+def test_manifest_paths_resolve_against_manifest_dir(tmp_path):
+    manifest = tmp_path / "jobs" / "manifest.yaml"
+    manifest.parent.mkdir()
+    manifest.write_text(
+        "- output: out/a.pdf\n"
+        "  inputs: ['in/a.pdf:1-2', {path: /abs/b.pdf, pages: [3], bookmark: B}]\n",
+        encoding="utf-8",
+    )
+
+    [job] = merge_pdfs.load_manifest(str(manifest))
+
+    assert job["output"] == str(manifest.parent / "out" / "a.pdf")
+    assert [merge_pdfs.resolve_input(spec) for spec in job["inputs"]] == [
+        (str(manifest.parent / "in" / "a.pdf"), [1, 2], "a"),
+        ("/abs/b.pdf", [3], "B"),
+    ]
+
+
+def test_run_manifest_validates_first_and_keeps_going(scan_pdfs, tmp_path):
+    broken = tmp_path / "broken.pdf"
+    broken.write_bytes(b"%PDF-1.4 not really")
+    jobs = [
+        {"output": str(tmp_path / "a.pdf"), "inputs": [scan_pdfs[0], {"path": scan_pdfs[1], "pages": "2"}],
+         "bookmarks": True},
+        {"output": str(tmp_path / "b.pdf"), "inputs": [scan_pdfs[2], str(broken)]},
+        {"output": str(tmp_path / "c.pdf"), "inputs": [f"{scan_pdfs[1]}:3"]},
+        {"output": str(tmp_path / "sub" / "d.pdf"), "inputs": scan_pdfs, "stream": True},
+        {"output": str(tmp_path / "a.pdf"), "inputs": [scan_pdfs[0]]},
+    ]
+
+    report = merge_pdfs.run_manifest(jobs, workers=2)
+
+    assert [(index, pages) for index, _, pages in sorted(report["merged"])] == [(1, 3), (4, 6)]
+    assert [index for index, _ in report["failed"]] == [2, 3, 5]
+    assert "page 3 out of range (2 pages)" in report["failed"][1][1]
+    assert not (tmp_path / "b.pdf").exists()
+    assert [item.title for item in PdfReader(tmp_path / "a.pdf").outline] == ["scan0", "scan1"]
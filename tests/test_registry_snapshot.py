@@ -0,0 +1,51 @@
+from ask.utils import skill_registry
+from ask.utils.registry_snapshot import load_snapshot, write_snapshot
+
+
+def _live():
+    return [s for s in map(skill_registry.load_skill, skill_registry.iter_skill_dirs()) if s]
+
+
+def test_snapshot_round_trips_live_scan(skills_dir):
+    skill_dir = skills_dir.add_skill("note-taker", "# Notes\n", tags=("notes",))
+    (skill_dir / "scripts").mkdir()
+    (skill_dir / "reference.md").write_text("ref\n", encoding="utf-8")
+    live = _live()
+
+    write_snapshot(live, skills_dir.root)
+
+    assert load_snapshot(skills_dir.root) == live
+    assert live[0]["_resources"] == ["SKILL.md", "reference.md", "scripts", "skill.yaml"]
+
+
+def test_snapshot_copies_are_independent(skills_dir):
+    skills_dir.add_skill("note-taker", "# Notes\n", tags=("notes",))
+    write_snapshot(_live(), skills_dir.root)
+
+    first = load_snapshot(skills_dir.root)
+    first[0]["tags"].append("mutated")
+    first[0]["agents"].clear()
+
+    again = load_snapshot(skills_dir.root)[0]
+    assert again["tags"] == ["notes"]
+    assert again["agents"] == ["gemini", "claude"]
+
+
+def test_package_mode_reads_snapshot(skills_dir, monkeypatch):
+    skills_dir.add_skill("note-taker", "# Notes\n")
+    write_snapshot(_live(), skills_dir.root)
+    # Skills added after the build are not scanned in package mode
+    skills_dir.add_skill("late-skill", "# Late\n")
+
+    monkeypatch.setattr(skill_registry, "is_dev_mode", lambda: False)
+    assert [s["name"] for s in skill_registry.get_all_skills()] == ["note-taker"]
+
+    monkeypatch.setattr(skill_registry, "is_dev_mode", lambda: True)
+    assert sorted(s["name"] for s in skill_registry.get_all_skills()) == ["late-skill", "note-taker"]
+
+
+def test_missing_snapshot_falls_back_to_scan(skills_dir, monkeypatch):
+    skills_dir.add_skill("note-taker", "# Notes\n")
+    monkeypatch.setattr(skill_registry, "is_dev_mode", lambda: False)
+
+    assert [s["name"] for s in skill_registry.get_all_skills()] == ["note-taker"]
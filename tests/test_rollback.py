@@ -0,0 +1,90 @@
+import json
+
+from ask.cli import main
+from ask.utils.backups import BackupStore
+from ask.utils.filesystem import get_adapter
+
+
+def _setup(runner, skills_dir, tmp_path, monkeypatch):
+    monkeypatch.setenv("HOME", str(tmp_path / "home"))
+    monkeypatch.chdir(tmp_path)
+    skill_dir = skills_dir.add_skill("note-taker")
+    (skill_dir / "scripts").mkdir()
+    (skill_dir / "scripts" / "run.py").write_text("print('v1')\n", encoding="utf-8")
+    runner.invoke(main, ["copy", "gemini", "--skill", "note-taker"], input="2\n")
+    return skill_dir
+
+
+def _release(skill_dir, version, body, script):
+    yaml = (skill_dir / "skill.yaml").read_text(encoding="utf-8")
+    (skill_dir / "skill.yaml").write_text(yaml.replace("version: 1.0.0", f"version: {version}"), encoding="utf-8")
+    (skill_dir / "SKILL.md").write_text(body, encoding="utf-8")
+    (skill_dir / "scripts" / "run.py").write_text(script, encoding="utf-8")
+
+
+def test_update_snapshots_and_rollback_restores(runner, skills_dir, tmp_path, monkeypatch):
+    skill_dir = _setup(runner, skills_dir, tmp_path, monkeypatch)
+    folder = tmp_path / ".gemini" / "skills" / "note-taker"
+    main_file = folder / "SKILL.md"
+    script = folder / "scripts" / "run.py"
+    original_main = main_file.read_text(encoding="utf-8")
+    original_lock = json.loads((tmp_path / "ask.lock").read_text(encoding="utf-8"))
+
+    _release(skill_dir, "2.0.0", skills_dir.BODY + "\nNew tip.\n", "print('v2')\n")
+    (skill_dir / "scripts" / "extra.py").write_text("pass\n", encoding="utf-8")
+    result = runner.invoke(main, ["update", "--yes"])
+    assert result.exit_code == 0
+    assert script.read_text(encoding="utf-8") == "print('v2')\n"
+    assert (script.parent / "extra.py").exists()
+    assert not list(folder.glob("*.bak"))
+
+    result = runner.invoke(main, ["rollback", "gemini", "--yes"])
+
+    assert result.exit_code == 0
+    assert main_file.read_text(encoding="utf-8") == original_main
+    assert script.read_text(encoding="utf-8") == "print('v1')\n"
+    assert not (script.parent / "extra.py").exists()
+    assert json.loads((tmp_path / "ask.lock").read_text(encoding="utf-8")) == original_lock
+
+
+def test_unchanged_files_are_stored_once(runner, skills_dir, tmp_path, monkeypatch):
+    _setup(runner, skills_dir, tmp_path, monkeypatch)
+    adapter = get_adapter("gemini")
+    store = BackupStore(adapter)
+
+    first = store.snapshot([{"name": "note-taker"}])
+    second = store.snapshot([{"name": "note-taker"}])
+
+    assert first["new_objects"] == 2
+    assert second["new_objects"] == 0
+    assert [gen["id"] for gen in BackupStore(adapter).generations] == [1, 2]
+
+
+def test_old_generations_are_pruned(runner, skills_dir, tmp_path, monkeypatch):
+    _setup(runner, skills_dir, tmp_path, monkeypatch)
+    monkeypatch.setenv("ASK_BACKUP_GENERATIONS", "2")
+    store = BackupStore(get_adapter("gemini"))
+    script = tmp_path / ".gemini" / "skills" / "note-taker" / "scripts" / "run.py"
+
+    for version in range(3):
+        script.write_text(f"print({version})\n", encoding="utf-8")
+        store.snapshot([{"name": "note-taker"}])
+
+    objects = [path for path in (store.root / "objects").rglob("*.gz")]
+    assert [gen["id"] for gen in store.generations] == [2, 3]
+    assert len(objects) == 3  # main file + two script versions
+
+
+def test_rollback_to_requires_a_single_store(runner, skills_dir, tmp_path, monkeypatch):
+    _setup(runner, skills_dir, tmp_path, monkeypatch)
+    runner.invoke(main, ["copy", "claude", "--skill", "note-taker"], input="2\n")
+    for agent in ("gemini", "claude"):
+        BackupStore(get_adapter(agent)).snapshot([{"name": "note-taker"}])
+
+    result = runner.invoke(main, ["rollback", "--to", "1", "--yes"])
+    assert result.exit_code == 1
+    assert "several install locations" in result.output
+
+    result = runner.invoke(main, ["rollback", "gemini", "--to", "1", "--yes"])
+    assert result.exit_code == 0, result.output
+    assert "gemini (local)" in result.output and "claude" not in result.output
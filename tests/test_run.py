@@ -0,0 +1,171 @@
+import os
+import signal
+import stat
+import time
+from pathlib import Path
+
+import pytest
+
+from ask.cli import main
+from ask.utils import run_client
+from ask.utils import runner as pool_runner
+from ask.utils.filesystem import get_skills_dir
+from ask.utils.daemon import DaemonError
+from ask.utils.runner import WorkerPool, module_names, request, resolve_script
+
+
+pytestmark = pytest.mark.skipif(not pool_runner.is_supported(), reason="needs fork() and Unix domain sockets")
+
+SCRIPT = """import json, os, sys
+print(json.dumps({"args": sys.argv[1:], "cwd": os.getcwd(), "env": os.environ.get("RUN_TEST")}))
+print("to stderr", file=sys.stderr)
+sys.exit(int(os.environ.get("RUN_EXIT", "0")))
+"""
+
+
+@pytest.fixture
+def skill(skills_dir):
+    skill_dir = skills_dir.add_skill("script-skill", "# Scripts\n\nHas a helper.\n")
+    (skill_dir / "scripts").mkdir()
+    (skill_dir / "scripts" / "echo_args.py").write_text(SCRIPT, encoding="utf-8")
+    return skill_dir
+
+
+@pytest.fixture
+def pool(skill, cache_dir):
+    socket_path = cache_dir / "ask-run.sock"
+    pid = os.fork()
+    if pid == 0:
+        code = 0
+        try:
+            worker_pool = WorkerPool(socket_path, workers=1, modules=["json"])
+            worker_pool.preload()
+            worker_pool.serve()
+        except BaseException:
+            code = 1
+        finally:
+            os._exit(code)
+
+    deadline = time.time() + 10
+    while request("status", socket_path) is None:
+        assert time.time() < deadline, "pool did not start"
+        time.sleep(0.05)
+    yield socket_path
+    os.kill(pid, signal.SIGTERM)
+    os.waitpid(pid, 0)
+
+
+def _run(socket_path, tmp_path, script="echo_args.py", args=(), env=None):
+    out, err = tmp_path / "out.txt", tmp_path / "err.txt"
+    with open(os.devnull) as stdin, open(out, "w") as stdout, open(err, "w") as stderr:
+        result = request(
+            "run", socket_path, fds=[stdin.fileno(), stdout.fileno(), stderr.fileno()],
+            skill="script-skill", script=script, args=list(args), cwd=str(tmp_path), env=env or {},
+        )
+    return result["exit"], out.read_text(), err.read_text()
+
+
+def test_pool_runs_script_on_callers_stdio(pool, tmp_path):
+    code, out, err = _run(pool, tmp_path, args=["a b", "--flag"], env={"RUN_TEST": "yes"})
+
+    assert code == 0
+    assert out.strip() == f'{{"args": ["a b", "--flag"], "cwd": "{tmp_path}", "env": "yes"}}'
+    assert err.strip() == "to stderr"
+
+
+def test_pool_passes_exit_status_and_keeps_serving(pool, tmp_path):
+    assert _run(pool, tmp_path, script="echo_args", env={"RUN_EXIT": "3"})[0] == 3
+    # Each run gets a fresh worker
+    assert _run(pool, tmp_path)[0] == 0
+    assert request("status", pool)["modules"] == ["json"]
+
+
+def test_pool_rejects_unknown_scripts(pool, tmp_path):
+    with pytest.raises(DaemonError, match="Script not found"):
+        _run(pool, tmp_path, script="../SKILL.md")
+    with pytest.raises(DaemonError, match="Skill not found"):
+        request("run", pool, fds=[0, 1, 2], skill="missing", script="x.py")
+
+
+def test_pool_only_serves_its_own_library(pool, tmp_path, monkeypatch):
+    assert stat.S_IMODE(os.stat(pool).st_mode) == 0o600
+    assert pool_runner.get_socket_path(tmp_path / "other") != pool_runner.get_socket_path()
+
+    with monkeypatch.context() as patch:
+        patch.setattr("ask.utils.skill_registry.get_skills_dir", lambda: tmp_path / "other")
+        assert request("status", pool) is None
+
+
+def test_pool_never_unlinks_other_files(skill, cache_dir):
+    cache_dir.mkdir()
+    path = cache_dir / "not-a-socket"
+    path.write_text("keep\n", encoding="utf-8")
+
+    with pytest.raises(OSError):
+        WorkerPool(path, workers=1).serve()
+    assert path.read_text(encoding="utf-8") == "keep\n"
+
+
+def test_thin_client_runs_through_pool(pool, skills_dir, monkeypatch, capfd):
+    monkeypatch.setenv("ASK_RUN_SOCKET", str(pool))
+    monkeypatch.setattr(run_client, "default_skills_dir", lambda: str(skills_dir.root))
+
+    with pytest.raises(SystemExit) as exit_info:
+        run_client.main(["script-skill", "echo_args", "x"])
+
+    assert exit_info.value.code == 0
+    assert '"args": ["x"]' in capfd.readouterr().out
+
+
+def test_thin_client_finds_the_same_library():
+    assert Path(run_client.default_skills_dir()) == get_skills_dir().resolve()
+
+
+def test_resolve_script_stays_in_scripts_dir(skill):
+    info = {"_scripts": str(skill / "scripts")}
+
+    assert resolve_script(info, "echo_args") == (skill / "scripts" / "echo_args.py").resolve()
+    assert resolve_script(info, "../skill.yaml") is None
+    assert resolve_script({}, "echo_args.py") is None
+
+
+def test_module_names_maps_distributions():
+    assert module_names(["pyyaml>=6", "click", "not-installed-dist"]) == ["yaml", "click", "not_installed_dist"]
+
+
+def test_cli_runs_without_pool(skill, runner, monkeypatch, tmp_path):
+    monkeypatch.setenv("ASK_NO_DAEMON", "1")
+    calls = []
+
+    class Completed:
+        returncode = 4
+
+    def fake_run(cmd):
+        calls.append(cmd)
+        return Completed()
+
+    monkeypatch.setattr("ask.commands.run.subprocess.run", fake_run)
+
+    result = runner.invoke(main, ["run", "script-skill", "echo_args", "--pages", "1-3"])
+    assert result.exit_code == 4
+    assert calls[0][1:] == [str((skill / "scripts" / "echo_args.py").resolve()), "--pages", "1-3"]
+
+    result = runner.invoke(main, ["run", "script-skill", "missing.py"])
+    assert result.exit_code == 1
+    assert "Available: echo_args.py" in result.output
+
+
+def test_cli_fallback_uses_provisioned_env(skill, runner, monkeypatch, tmp_path):
+    monkeypatch.setenv("ASK_NO_DAEMON", "1")
+    with open(skill / "skill.yaml", "a", encoding="utf-8") as f:
+        f.write("dependencies:\n  - pypdf\n")
+    calls = []
+
+    class Completed:
+        returncode = 0
+
+    monkeypatch.setattr("ask.commands.run.find_env", lambda deps: tmp_path / "env" if deps == ["pypdf"] else None)
+    monkeypatch.setattr("ask.commands.run.subprocess.run", lambda cmd: calls.append(cmd) or Completed())
+
+    assert runner.invoke(main, ["run", "script-skill", "echo_args"]).exit_code == 0
+    assert calls[0][0] == str(tmp_path / "env" / "bin" / "python")
@@ -0,0 +1,40 @@
+from ask.utils.search_index import SearchIndex, search_skills, tokenize
+
+
+def test_tokenize_drops_stopwords_and_splits_names():
+    assert tokenize("The ask-bug-finder and a Docker image") == ["ask", "bug", "finder", "docker", "image"]
+
+
+def test_search_ranks_name_matches_first(skills_dir):
+    skills_dir.add_skill("ask-docker-expert", "Multi-stage builds.", description="Containers")
+    skills_dir.add_skill("ask-bug-finder", "Sometimes the bug is in a docker config.")
+
+    index = SearchIndex()
+    index.refresh()
+    results = index.search("docker")
+
+    assert [r["name"] for r in results] == ["ask-docker-expert", "ask-bug-finder"]
+
+
+def test_refresh_is_incremental(skills_dir):
+    skill_dir = skills_dir.add_skill("ask-bug-finder", "Reproduce first.")
+    skills_dir.add_skill("ask-docker-expert", "Multi-stage builds.")
+
+    index = SearchIndex()
+    assert index.refresh() == 2
+    index.save()
+
+    index = SearchIndex.load()
+    assert index.refresh() == 0
+
+    (skill_dir / "SKILL.md").write_text("Bisect the history.", encoding="utf-8")
+    assert index.refresh() == 1
+    assert [r["name"] for r in index.search("bisect")] == ["ask-bug-finder"]
+    assert index.search("reproduce") == []
+
+
+def test_search_skills_uses_persistent_index(skills_dir):
+    skills_dir.add_skill("ask-bug-finder", "Reproduce first.")
+
+    assert [r["name"] for r in search_skills("reproduce")] == ["ask-bug-finder"]
+    assert SearchIndex.load().refresh() == 0
@@ -0,0 +1,97 @@
+import threading
+import time
+
+import pytest
+
+from ask.cli import main
+from ask.utils import daemon
+from ask.utils.daemon import DaemonError, SkillServer, SkillService, request
+
+
+pytestmark = pytest.mark.skipif(not daemon.is_supported(), reason="needs Unix domain sockets")
+
+
+@pytest.fixture
+def server(skills_dir, cache_dir):
+    skills_dir.add_skill("docker-helper", "# Docker\n\nBuild small images.\n", tags=("docker",))
+    skills_dir.add_skill("note-taker", "# Notes\n\nKeep notes short.\n")
+    socket_path = daemon.get_socket_path()
+    srv = SkillServer(socket_path, SkillService())
+    thread = threading.Thread(target=srv.serve, daemon=True)
+    thread.start()
+    yield socket_path
+    request("shutdown", socket_path)
+    thread.join(timeout=5)
+
+
+def test_daemon_answers_requests(server):
+    assert request("status", server)["skills"] == 2
+    assert sorted(s["name"] for s in request("list", server)) == ["docker-helper", "note-taker"]
+    assert request("search", server, query="docker")[0]["name"] == "docker-helper"
+    with pytest.raises(DaemonError):
+        request("copy", server, skill="missing", agent="gemini")
+
+
+def test_daemon_picks_up_new_skills(server, skills_dir):
+    skills_dir.add_skill("late-skill", "# Late\n\nAdded while serving.\n")
+
+    # Picked up once the watcher reports it, without rescanning on every request
+    deadline = time.time() + 10
+    while not request("search", server, query="serving"):
+        assert time.time() < deadline, "change was not picked up"
+        time.sleep(0.1)
+    assert request("search", server, query="serving")[0]["name"] == "late-skill"
+
+
+def test_daemon_only_serves_its_own_library(server, tmp_path, monkeypatch):
+    other = tmp_path / "other-skills"
+    other.mkdir()
+    assert daemon.get_socket_path(other) != server
+
+    # A client working on another library falls back to running in-process
+    with monkeypatch.context() as patch:
+        patch.setattr("ask.utils.skill_registry.get_skills_dir", lambda: other)
+        assert request("status", server) is None
+
+
+def test_daemon_copies_into_the_clients_project(server, tmp_path):
+    project = tmp_path / "project"
+    project.mkdir()
+
+    result = request("copy", server, skill="note-taker", agent="gemini", cwd=str(project))
+
+    assert result["status"] == "copied"
+    assert (project / ".gemini" / "skills" / "note-taker" / "SKILL.md").exists()
+
+
+def test_cli_copy_goes_through_daemon(server, runner, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+
+    result = runner.invoke(main, ["copy", "gemini", "--skill", "note-taker"], input="2\n")
+
+    assert result.exit_code == 0, result.output
+    assert request("status", server)["adapters"] == 1
+    assert (tmp_path / ".gemini" / "skills" / "note-taker" / "SKILL.md").exists()
+    assert "note-taker" in (tmp_path / "ask.lock").read_text(encoding="utf-8")
+
+    with monkeypatch.context() as patch:
+        patch.setenv("ASK_NO_DAEMON", "1")
+        result = runner.invoke(main, ["copy", "gemini", "--skill", "docker-helper"], input="2\n")
+    assert result.exit_code == 0, result.output
+    assert request("status", server)["adapters"] == 1
+    assert (tmp_path / ".gemini" / "skills" / "docker-helper" / "SKILL.md").exists()
+
+
+def test_cli_uses_daemon_and_falls_back(server, runner, monkeypatch):
+    result = runner.invoke(main, ["search", "docker"])
+    assert "docker-helper" in result.output
+
+    with monkeypatch.context() as patch:
+        patch.setenv("ASK_NO_DAEMON", "1")
+        patch.setattr(daemon, "get_socket_path", lambda: server)
+        assert request("status") is None
+        assert "docker-helper" in runner.invoke(main, ["search", "docker"]).output
+
+
+def test_no_daemon_returns_none(cache_dir):
+    assert request("status", cache_dir / "missing.sock") is None
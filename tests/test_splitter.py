@@ -0,0 +1,92 @@
+from agents.base import BaseAdapter
+from ask.utils.filesystem import get_adapter
+from ask.utils.skill_registry import get_skill, get_skill_readme
+from ask.utils.splitter import split_markdown
+
+DOC = (
+    "---\nname: ask-demo\n---\n\n# Demo\n\nShort summary.\n\n"
+    "## Small\n\nTiny section.\n\n"
+    "## Large Section\n\n" + "Lots of detail. " * 20 + "\n\n"
+    "```bash\n## not a heading\n```\n"
+)
+
+BIG_DOC = DOC.replace("Lots of detail. " * 20, "Lots of detail. " * 200)
+
+
+class FlatAdapter(BaseAdapter):
+    """Flat <name>.md layout with no resource directory, like the add-agent template."""
+
+    def get_target_path(self, skill, name=None):
+        return self.target_dir / f"{name or skill['name']}.md"
+
+    def transform(self, skill):
+        return get_skill_readme(skill)
+
+
+def test_split_moves_large_sections_and_keeps_small_inline():
+    main, sections = split_markdown(DOC, "sections", min_section_bytes=200)
+
+    assert [name for name, _ in sections] == ["02-large-section.md"]
+    assert sections[0][1].startswith("## Large Section\n")
+    assert "## not a heading" in sections[0][1]
+
+    assert main.startswith("---\nname: ask-demo\n---\n\n# Demo\n\nShort summary.\n\n## Sections")
+    assert "- Small (below)" in main
+    assert "- [Large Section](sections/02-large-section.md)" in main
+    assert main.endswith("## Small\n\nTiny section.\n")
+
+
+def test_split_leaves_small_documents_alone():
+    assert split_markdown(DOC, "sections", min_section_bytes=10_000) == (DOC, [])
+
+
+def test_split_install_writes_sections_next_to_skill(tmp_path, skills_dir):
+    skills_dir.add_skill("ask-demo", BIG_DOC)
+    adapter = get_adapter("claude", split=True)
+    adapter.target_dir = tmp_path / "commands"
+
+    result = adapter.copy_skill(get_skill("ask-demo"))
+
+    assert result["status"] == "copied"
+    sections_dir = tmp_path / "commands" / ".scripts" / "ask-demo" / "sections"
+    assert [p.name for p in sections_dir.iterdir()] == ["02-large-section.md"]
+    assert "(.scripts/ask-demo/sections/02-large-section.md)" in (tmp_path / "commands" / "ask-demo.md").read_text()
+    assert adapter.copy_skill(get_skill("ask-demo"))["status"] == "conflict"
+
+
+def test_forced_unsplit_install_removes_old_sections(tmp_path, skills_dir):
+    skills_dir.add_skill("ask-demo", BIG_DOC)
+    adapter = get_adapter("claude", split=True)
+    adapter.target_dir = tmp_path / "commands"
+    adapter.copy_skill(get_skill("ask-demo"))
+
+    adapter = get_adapter("claude")
+    adapter.target_dir = tmp_path / "commands"
+    assert adapter.copy_skill(get_skill("ask-demo"), force=True)["status"] == "copied"
+
+    assert not (tmp_path / "commands" / ".scripts" / "ask-demo" / "sections").exists()
+    assert "Lots of detail." in (tmp_path / "commands" / "ask-demo.md").read_text()
+
+
+def test_flat_layout_keeps_sections_per_skill(tmp_path, skills_dir):
+    skills_dir.add_skill("ask-demo", BIG_DOC)
+    skills_dir.add_skill("ask-other", BIG_DOC)
+    adapter = FlatAdapter()
+    adapter.target_dir = tmp_path / "rules"
+    adapter.split = True
+    adapter.copy_skill(get_skill("ask-demo"))
+    demo_sections = tmp_path / "rules" / ".scripts" / "ask-demo" / "sections"
+    (demo_sections / "notes.md").write_text("mine\n", encoding="utf-8")
+
+    assert adapter.copy_skill(get_skill("ask-other"))["status"] == "copied"
+    adapter.split = False
+    skills_dir.add_skill("ask-third")
+    assert adapter.copy_skill(get_skill("ask-third"))["status"] == "copied"
+
+    assert sorted(p.name for p in demo_sections.iterdir()) == ["02-large-section.md", "notes.md"]
+    assert (tmp_path / "rules" / ".scripts" / "ask-other" / "sections" / "02-large-section.md").exists()
+    assert not (tmp_path / "rules" / "sections").exists()
+
+    # A forced rewrite drops only the section files ASK wrote
+    assert adapter.copy_skill(get_skill("ask-demo"), force=True)["status"] == "copied"
+    assert [p.name for p in demo_sections.iterdir()] == ["notes.md"]
@@ -0,0 +1,22 @@
+import json
+
+from ask.cli import main
+from ask.utils.tokens import estimate_tokens
+
+
+def test_estimate_tokens_charges_long_words_more():
+    assert estimate_tokens("") == 0
+    assert estimate_tokens("fix the bug") == 3
+    assert estimate_tokens("internationalization") > estimate_tokens("bug")
+
+
+def test_stats_budget_fails(runner, skills_dir):
+    skills_dir.add_skill("ask-small", "Short.", description="A small skill.")
+    skills_dir.add_skill("ask-large", "word " * 500, description="A large skill.")
+
+    result = runner.invoke(main, ["stats", "--agent", "claude", "--json", "--budget", "100"])
+
+    assert result.exit_code == 1
+    report = json.loads(result.output)
+    assert report["agents"]["claude"]["skills"] == 2
+    assert [v.split(" ")[0] for v in report["violations"]] == ["ask-large"]
@@ -0,0 +1,72 @@
+import errno
+import json
+import os
+from pathlib import Path
+
+from ask.cli import main
+from ask.utils.filesystem import get_adapter
+from ask.utils.skill_registry import load_skill
+from ask.utils import store
+from ask.utils.store import get_store_dir, prune, store_status
+
+
+def _skill_with_script(skills_dir):
+    skill_dir = skills_dir.add_skill("pdf-tool", "# PDF\n\nRun the script.\n")
+    (skill_dir / "scripts").mkdir()
+    script = skill_dir / "scripts" / "run.py"
+    script.write_text("print('hi')\n", encoding="utf-8")
+    script.chmod(0o755)
+    return load_skill(skill_dir)
+
+
+def _install(skill, target_dir):
+    adapter = get_adapter("gemini", link=True)
+    adapter.target_dir = target_dir
+    assert adapter.copy_skill(skill, force=True)["status"] == "copied"
+    return target_dir / "pdf-tool" / "scripts" / "run.py"
+
+
+def test_linked_installs_share_one_object(skills_dir, tmp_path):
+    skill = _skill_with_script(skills_dir)
+
+    first = _install(skill, tmp_path / "project-a")
+    second = _install(skill, tmp_path / "project-b")
+
+    assert first.read_text(encoding="utf-8") == "print('hi')\n"
+    assert os.stat(first).st_ino == os.stat(second).st_ino
+    assert oct(first.stat().st_mode & 0o777) == oct(0o555)
+    assert store_status()["objects"] == 1
+
+
+def test_prune_removes_only_unreferenced_objects(skills_dir, tmp_path, runner):
+    skill = _skill_with_script(skills_dir)
+    installed = _install(skill, tmp_path / "project-a")
+
+    assert prune() == (0, 0)
+
+    installed.unlink()
+    result = runner.invoke(main, ["store", "prune"])
+
+    assert result.exit_code == 0, result.output
+    assert "Removed 1 unused object" in result.output
+    assert store_status()["objects"] == 0
+
+
+def test_symlinks_are_recorded_in_one_write(skills_dir, tmp_path, monkeypatch):
+    skill = _skill_with_script(skills_dir)
+    (skills_dir.root / "coding" / "pdf-tool" / "scripts" / "other.py").write_text("pass\n", encoding="utf-8")
+
+    def cross_device(src, dst):
+        raise OSError(errno.EXDEV, "Invalid cross-device link")
+
+    saves = []
+    save = store._save_links
+    monkeypatch.setattr(store.os, "link", cross_device)
+    monkeypatch.setattr(store, "_save_links", lambda links: saves.append(links) or save(links))
+
+    installed = _install(skill, tmp_path / "project-a")
+
+    assert installed.is_symlink()
+    assert len(saves) == 1
+    links = json.loads((get_store_dir() / "links.json").read_text(encoding="utf-8"))
+    assert sorted(Path(link).name for link in links) == ["other.py", "run.py"]
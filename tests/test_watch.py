@@ -0,0 +1,49 @@
+from ask.commands.watch import redeploy
+from ask.utils.filesystem import get_adapter
+from ask.utils.skill_registry import SkillRegistry
+from ask.utils.watcher import PollingWatcher
+
+
+def test_polling_watcher_reports_changed_files(tmp_path):
+    (tmp_path / "a.md").write_text("one", encoding="utf-8")
+    watcher = PollingWatcher(tmp_path, interval=0.01)
+
+    (tmp_path / "a.md").write_text("two!", encoding="utf-8")
+    (tmp_path / "b.md").write_text("new", encoding="utf-8")
+
+    assert watcher.changes(timeout=1) == {tmp_path / "a.md", tmp_path / "b.md"}
+    assert watcher.changes(timeout=0.05) == set()
+
+
+def test_registry_refresh_reloads_only_touched_skill(skills_dir):
+    first = skills_dir.add_skill("note-taker", "# Notes\n")
+    skills_dir.add_skill("other-skill", "# Other\n")
+    registry = SkillRegistry()
+    untouched = registry.get("other-skill")
+
+    (first / "skill.yaml").write_text(
+        (first / "skill.yaml").read_text(encoding="utf-8").replace("1.0.0", "1.1.0"), encoding="utf-8"
+    )
+    changed = registry.refresh([first / "skill.yaml"])
+
+    assert list(changed) == [first]
+    assert registry.get("note-taker")["version"] == "1.1.0"
+    assert registry.get("other-skill") is untouched
+
+
+def test_redeploy_rewrites_only_installed_pairs(skills_dir, tmp_path):
+    skill_dir = skills_dir.add_skill("note-taker", "# Notes\n")
+    registry = SkillRegistry()
+    adapters = {}
+    for agent in ("gemini", "claude"):
+        adapter = get_adapter(agent)
+        adapter.target_dir = tmp_path / agent
+        adapters[(agent, "local")] = adapter
+    adapters[("gemini", "local")].copy_skill(registry.get("note-taker"))
+
+    (skill_dir / "SKILL.md").write_text("# Notes\n\nEdited.\n", encoding="utf-8")
+    results = redeploy(registry, adapters, [skill_dir / "SKILL.md"])
+
+    assert [(r["agent"], r["status"]) for r in results] == [("gemini", "copied")]
+    assert "Edited." in (tmp_path / "gemini" / "note-taker" / "SKILL.md").read_text(encoding="utf-8")
+    assert not (tmp_path / "claude").exists()